@@ -1,18 +1,86 @@
 import os
+import shlex
+import signal
 import subprocess
 import shutil
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
-from typing import List, Optional
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+# Obergrenze für von ``_run_capture`` gesammelte Ausgabe (Zeichen); Befehle
+# wie ``swarm monitor --real-time`` liefern sonst unbegrenzt Daten
+_MAX_CAPTURE = 256 * 1024
+# Zeitlimit je claude‑flow‑Befehl (Sekunden)
+_STEP_TIMEOUT = 15
+# Anzahl der Befehle, die ``command_history`` höchstens behält
+_HISTORY_LIMIT = 512
+
+
+def _kill_group(proc: subprocess.Popen) -> None:
+    """Beendet einen mit ``start_new_session`` gestarteten Prozess samt Kindern (npx → node)."""
+    if proc.returncode is None:
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
 
 class ClaudeFlowCLI:
     """Kapselt Aufrufe an ``npx claude-flow@alpha`` für verschiedene Funktionen."""
 
     def __init__(self, working_dir: Optional[Path] = None) -> None:
         self.working_dir = working_dir or Path.cwd()
-        # Halte eine Historie aller ausgeführten Befehle fest. Diese Liste
-        # enthält ausschließlich die Argumente nach ``npx claude-flow@alpha``
-        # und dient später der Anzeige im Menü. Sie wird nicht persistiert.
-        self.command_history: List[str] = []
+        # Halte eine Historie der ausgeführten Befehle fest. Sie enthält
+        # ausschließlich die Argumente nach ``npx claude-flow@alpha`` und dient
+        # später der Anzeige im Menü. Sie wird nicht persistiert und behält nur
+        # die letzten ``_HISTORY_LIMIT`` Einträge.
+        self.command_history: Deque[str] = deque(maxlen=_HISTORY_LIMIT)
+        # Umgebung für Subprozesse; wird einmalig kopiert und nach Änderungen
+        # an os.environ über ``invalidate_env`` verworfen
+        self._env_cache: Optional[Dict[str, str]] = None
+        # Ausgaben unveränderlicher Abfragen (z. B. ``sparc modes``), je Argumentliste
+        self._output_cache: Dict[Tuple[str, ...], str] = {}
+        # Mit ``run_background`` gestartete Prozesse, je Sitzungsname
+        self._bg_sessions: Dict[str, subprocess.Popen] = {}
+        # Zahl fehlgeschlagener oder abgebrochener ``_run``/``run_chain``‑Aufrufe;
+        # Aufrufer vergleichen Stände vor und nach einer Befehlsfolge
+        self.failed_commands = 0
+        self._fail_lock = threading.Lock()
+
+    def _note_failure(self) -> None:
+        with self._fail_lock:
+            self.failed_commands += 1
+
+    def _get_env(self) -> Dict[str, str]:
+        """Liefert die (gecachte) Umgebung für claude‑flow‑Aufrufe. Nicht verändern."""
+        env = self._env_cache
+        if env is None:
+            env = dict(os.environ)
+            env.setdefault("npm_config_yes", "true")
+            self._env_cache = env
+        return env
+
+    def invalidate_env(self) -> None:
+        """Verwirft die gecachte Umgebung, z. B. nachdem Tokens gesetzt wurden."""
+        self._env_cache = None
+
+    @cached_property
+    def _base_cmd(self) -> Tuple[str, ...]:
+        """
+        Aufrufpräfix für claude‑flow, einmal pro Instanz ermittelt. Ein
+        installiertes ``claude-flow`` wird bevorzugt, um die Paketauflösung
+        von npx bei jedem Aufruf zu vermeiden.
+        """
+        return ("claude-flow",) if shutil.which("claude-flow") else ("npx", "claude-flow@alpha")
+
+    @cached_property
+    def _base_cmd_text(self) -> str:
+        # Präfix für Statusausgaben, nur einmal zusammengesetzt
+        return " ".join(self._base_cmd)
 
     def _run(self, args: List[str]) -> None:
         """
@@ -22,51 +90,201 @@ class ClaudeFlowCLI:
         """
         # Verwende das installierte ``claude-flow`` falls verfügbar, um
         # Probleme mit npx und temporären Verzeichnissen zu vermeiden.
-        base_cmd = ["claude-flow"] if shutil.which("claude-flow") else ["npx", "claude-flow@alpha"]
-        cmd = base_cmd + args
-        print(f"Ausführen: {' '.join(cmd)}")
-        env = os.environ.copy()
-        env.setdefault("npm_config_yes", "true")
+        cmd = [*self._base_cmd, *args]
+        # Das Argumentsegment wird einmal verbunden und für Ausgabe und Historie genutzt
+        line = ' '.join(args)
+        print(f"Ausführen: {self._base_cmd_text} {line}")
+        env = self._get_env()
         try:
             # Führe den Befehl aus und speichere die Argumentliste in der Historie
-            subprocess.run(cmd, cwd=self.working_dir, env=env, timeout=15)
+            result = subprocess.run(cmd, cwd=self.working_dir, env=env, timeout=_STEP_TIMEOUT)
+            if result.returncode != 0:
+                self._note_failure()
             try:
                 # Speichere nur das Argumentsegment (ohne npx) für die Anzeige
-                self.command_history.append(' '.join(args))
+                self.command_history.append(line)
             except Exception:
                 # Wenn das Anhängen fehlschlägt, ignoriere den Fehler
                 pass
         except Exception as e:
-            print(f"[CLI] Fehler beim Ausführen von {' '.join(cmd)}: {e}")
+            self._note_failure()
+            print(f"[CLI] Fehler beim Ausführen von {self._base_cmd_text} {line}: {e}")
+
+    @cached_property
+    def _step_limit(self) -> Tuple[str, ...]:
+        """
+        Präfix, das einem Kettenglied sein eigenes Zeitlimit gibt. GNU
+        ``timeout`` beendet bei Ablauf die ganze Prozessgruppe des Befehls
+        (npx samt node); ohne ``timeout`` ist das Präfix leer.
+        """
+        if shutil.which("timeout"):
+            return ("timeout", "-k", "5", str(_STEP_TIMEOUT))
+        return ()
 
-    def _run_capture(self, args: List[str]) -> str:
+    def run_chain(self, commands: List[List[str]]) -> None:
+        """
+        Führt mehrere claude‑flow‑Befehle nacheinander in einem einzigen
+        Shell‑Aufruf aus (``cmd1; cmd2; …``). Wie bei einzelnen ``_run``‑Aufrufen
+        hat jeder Befehl sein eigenes Zeitlimit von ``_STEP_TIMEOUT`` Sekunden,
+        und ein fehlgeschlagener oder abgebrochener Befehl bricht die Kette
+        nicht ab. Steht ``timeout`` nicht zur Verfügung, laufen die Befehle
+        einzeln über ``_run``.
+        """
+        if not commands:
+            return
+        limit = self._step_limit
+        if not limit:
+            for args in commands:
+                self._run(args)
+            return
+        base_cmd = self._base_cmd
+        print(f"Ausführen: {'; '.join(shlex.join([*base_cmd, *args]) for args in commands)}")
+        # Fehlgeschlagene Glieder werden vermerkt; der Exit‑Code der Kette ist
+        # dann ungleich 0, auch wenn der letzte Befehl gelingt
+        script = "f=0; " + "; ".join(
+            f"{shlex.join([*limit, *base_cmd, *args])} || f=1" for args in commands
+        ) + "; exit $f"
+        try:
+            # Eigene Sitzung, damit bei Abbruch die gesamte Kette samt Kindern beendet wird
+            proc = subprocess.Popen(["sh", "-c", script], cwd=self.working_dir, env=self._get_env(), start_new_session=True)
+        except Exception as e:
+            self._note_failure()
+            print(f"[CLI] Fehler beim Ausführen der Befehlskette: {e}")
+            return
+        try:
+            # Sicherheitsnetz über die Zeitlimits der einzelnen Befehle hinaus
+            proc.wait(timeout=(_STEP_TIMEOUT + 10) * len(commands))
+        except subprocess.TimeoutExpired:
+            _kill_group(proc)
+            proc.wait()
+            print("[CLI] Fehler beim Ausführen der Befehlskette: Zeitlimit überschritten")
+        except BaseException:
+            _kill_group(proc)
+            proc.wait()
+            raise
+        if proc.returncode != 0:
+            self._note_failure()
+        self.command_history.extend(' '.join(args) for args in commands)
+
+    def _run_cached(self, args: List[str]) -> None:
+        """
+        Wie ``_run`` für reine Abfragen, deren Antwort sich während einer
+        Sitzung nicht ändert. Die Ausgabe wird beim ersten Aufruf gesammelt und
+        bei Wiederholung ohne neuen Prozess erneut angezeigt; Historie und
+        Fehlerzähler werden wie bei ``_run`` geführt. Gespeichert wird nur eine
+        vollständige, nicht leere Ausgabe eines mit Code 0 beendeten
+        Befehls – abgebrochene oder fehlgeschlagene Aufrufe werden wiederholt.
+        """
+        key = tuple(args)
+        output = self._output_cache.get(key)
+        line = ' '.join(args)
+        if output is not None:
+            print(f"[CLI] Zwischengespeichert: {self._base_cmd_text} {line}")
+            self.command_history.append(line)
+        else:
+            print(f"Ausführen: {self._base_cmd_text} {line}")
+            # stderr mit erfassen, damit Fehlermeldungen wie bei ``_run`` sichtbar
+            # bleiben; ``_capture`` trägt den Befehl in die Historie ein
+            output, code = self._capture(args, merge_stderr=True)
+            if code != 0:
+                self._note_failure()
+            elif output:
+                self._output_cache[key] = output
+        if output:
+            print(output)
+
+    def run_parallel(self, commands: List[List[str]]) -> None:
+        """
+        Führt voneinander unabhängige, lesende claude‑flow‑Befehle gleichzeitig
+        aus. Die Ausgaben (inklusive stderr) werden über ``_capture`` gesammelt
+        und danach mit Exit‑Status in der Reihenfolge von ``commands`` ausgegeben, damit sie sich im Terminal
+        nicht vermischen. Die Wartezeit entspricht so dem langsamsten Befehl
+        statt der Summe aller.
+        """
+        if not commands:
+            return
+        lines = [' '.join(args) for args in commands]
+        for line in lines:
+            print(f"Ausführen: {self._base_cmd_text} {line}")
+        with ThreadPoolExecutor(max_workers=len(commands)) as pool:
+            results = list(pool.map(lambda args: self._capture(args, merge_stderr=True), commands))
+        for line, (output, code) in zip(lines, results):
+            if code == 0:
+                status = ""
+            elif code is None:
+                status = " – abgebrochen (Zeitlimit/Ausgabegrenze) oder nicht gestartet"
+            else:
+                status = f" – Exit‑Code {code}"
+            print(f"\n[CLI] {line}{status}:")
+            if output:
+                print(output)
+
+    def _run_capture(self, args: List[str], timeout: float = _STEP_TIMEOUT) -> str:
         """
         Führt den Befehl ``npx claude-flow@alpha`` aus und gibt stdout als
         Zeichenkette zurück. Diese Methode wird für Monitoring genutzt, um
         Informationen über Sessions, Status oder Swarm zu parsen. Bei einem
         Fehler wird der Fehlertext zurückgegeben.
+
+        Die Ausgabe wird zeilenweise gelesen und nach ``_MAX_CAPTURE`` Zeichen
+        bzw. ``timeout`` Sekunden abgeschnitten; der Prozess wird dann beendet
+        und das bis dahin Gelesene geliefert.
         """
-        base_cmd = ["claude-flow"] if shutil.which("claude-flow") else ["npx", "claude-flow@alpha"]
-        cmd = base_cmd + args
-        env = os.environ.copy()
-        env.setdefault("npm_config_yes", "true")
+        return self._capture(args, timeout)[0]
+
+    def _capture(self, args: List[str], timeout: float = _STEP_TIMEOUT, merge_stderr: bool = False) -> Tuple[str, Optional[int]]:
+        """
+        Wie ``_run_capture``, liefert zusätzlich den Exit‑Code. ``None`` steht
+        für einen Befehl, der nicht gestartet werden konnte oder wegen
+        Zeitlimit bzw. Ausgabegrenze abgebrochen wurde – die Ausgabe ist dann
+        ein Fehlertext oder unvollständig. Mit ``merge_stderr`` landen
+        Fehlermeldungen des Befehls mit in der Ausgabe, sonst werden sie verworfen.
+        """
+        cmd = [*self._base_cmd, *args]
+        env = self._get_env()
         try:
-            result = subprocess.run(
+            proc = subprocess.Popen(
                 cmd,
                 cwd=self.working_dir,
                 env=env,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT if merge_stderr else subprocess.DEVNULL,
                 text=True,
-                timeout=15,
+                start_new_session=True,
             )
-            # Füge das Kommando zur Historie hinzu
-            try:
-                self.command_history.append(' '.join(args))
-            except Exception:
-                pass
-            return result.stdout.strip()
         except Exception as e:
-            return f"[CLI] Fehler beim Ausführen von {' '.join(cmd)}: {e}"
+            return f"[CLI] Fehler beim Ausführen von {' '.join(cmd)}: {e}", None
+        # Beendet die Prozessgruppe bei Zeitüberschreitung; die Leseschleife
+        # endet dann mit dem Schließen der Pipe
+        killer = threading.Timer(timeout, _kill_group, (proc,))
+        killer.start()
+        parts: List[str] = []
+        size = 0
+        truncated = False
+        try:
+            for line in proc.stdout:
+                parts.append(line)
+                size += len(line)
+                if size >= _MAX_CAPTURE:
+                    _kill_group(proc)
+                    truncated = True
+                    break
+            proc.wait()
+        except Exception as e:
+            _kill_group(proc)
+            return f"[CLI] Fehler beim Ausführen von {' '.join(cmd)}: {e}", None
+        except KeyboardInterrupt:
+            _kill_group(proc)
+            raise
+        finally:
+            killer.cancel()
+            proc.stdout.close()
+            proc.wait()
+        # Füge das Kommando zur Historie hinzu
+        self.command_history.append(' '.join(args))
+        # Ein negativer Code bedeutet Abbruch per Signal (u. a. durch das Zeitlimit)
+        code = proc.returncode
+        return "".join(parts).strip(), None if truncated or code < 0 else code
 
     # Setup / Init
     def init(self, project_name: Optional[str] = None, hive_mind: bool = False, neural_enhanced: bool = False) -> None:
@@ -404,11 +622,15 @@ class ClaudeFlowCLI:
             args += ["--project", project]
         self._run(args)
 
-    def github_release_coord(self, version: str, auto_changelog: bool = False) -> None:
+    @staticmethod
+    def github_release_coord_args(version: str, auto_changelog: bool = False) -> List[str]:
         args = ["github", "release-manager", "--version", version]
         if auto_changelog:
             args.append("--auto-changelog")
-        self._run(args)
+        return args
+
+    def github_release_coord(self, version: str, auto_changelog: bool = False) -> None:
+        self._run(self.github_release_coord_args(version, auto_changelog))
 
     def github_workflow_auto(self, file: str) -> None:
         args = ["github", "workflow-auto", "--file", file]
@@ -473,7 +695,7 @@ class ClaudeFlowCLI:
         self._run(args)
 
     def features_detect(self) -> None:
-        self._run(["config", "features-detect"])
+        self._run_cached(["config", "features-detect"])
 
     def log_analysis(self, log_file: str) -> None:
         args = ["log", "analysis", log_file]
@@ -483,19 +705,27 @@ class ClaudeFlowCLI:
     # Kommando-Historie und Schnellbefehle
     def history_show(self) -> None:
         """
-        Gibt die Liste der bisher mit ``_run`` ausgeführten Befehle aus. Die
-        Historie wird nicht persistiert und gilt nur für die laufende Sitzung.
+        Gibt die Liste der bisher mit ``_run`` ausgeführten Befehle sowie den
+        Zustand gestarteter Hintergrundprozesse aus. Die Historie wird nicht
+        persistiert und gilt nur für die laufende Sitzung.
         """
         if not self.command_history:
             print("[History] Keine Befehle wurden bisher ausgeführt.")
-            return
-        print("\n[History] Ausgeführte Befehle:")
-        for idx, cmd in enumerate(self.command_history, start=1):
-            print(f"{idx}. {cmd}")
+        else:
+            print("\n[History] Ausgeführte Befehle:")
+            for idx, cmd in enumerate(self.command_history, start=1):
+                print(f"{idx}. {cmd}")
+        if self._bg_sessions:
+            print("\n[History] Hintergrundprozesse:")
+            for name, proc in self._bg_sessions.items():
+                code = proc.poll()
+                state = "läuft" if code is None else f"beendet ({code})"
+                print(f"- {name} (PID {proc.pid}): {state}")
 
     def history_clear(self) -> None:
-        """Löscht die gespeicherte Befehls-Historie."""
+        """Löscht die gespeicherte Befehls-Historie samt zwischengespeicherter Abfragen."""
         self.command_history.clear()
+        self._output_cache.clear()
         print("[History] Historie wurde geleert.")
 
     # ------------------------------------------------------------------
@@ -583,10 +813,13 @@ class ClaudeFlowCLI:
         `metrics collect` zu einer einzigen Kennzahlübersicht, um den Nutzer
         schnelle Einblicke zu geben.
         """
-        self.memory_stats()
-        self.memory_list()
-        self.performance_report()
-        self.metrics_collect()
+        # Reine Abfragen ohne gegenseitige Abhängigkeit – daher parallel
+        self.run_parallel([
+            ["memory", "stats"],
+            ["memory", "list"],
+            ["performance", "report"],
+            ["performance", "metrics-collect"],
+        ])
 
     # ------------------------------------------------------------------
     # Sicherheit & Compliance
@@ -611,9 +844,9 @@ class ClaudeFlowCLI:
 
     # ------------------------------------------------------------------
     # Hooks & Konfigurationswerkzeuge
-    def hook(self, hook_name: str, params: List[str]) -> None:
+    def hook(self, hook_name: str, params: Sequence[str] = ()) -> None:
         # Allgemeiner Aufruf für hooks. "hook_name" entspricht z. B. pre-task, post-edit usw.
-        args = ["hooks", hook_name] + params
+        args = ["hooks", hook_name, *params]
         self._run(args)
 
     def fix_hook_variables(self, target: Optional[str] = None, test: bool = False) -> None:
@@ -628,27 +861,37 @@ class ClaudeFlowCLI:
     # SPARC‑Workflow und Batchtools
     def sparc_modes(self) -> None:
         """Listet alle verfügbaren SPARC‑Entwicklungsmodi auf."""
-        self._run(["sparc", "modes"])
+        self._run_cached(["sparc", "modes"])
 
-    def sparc_run(self, mode: str, task: str, parallel: bool = False, batch_optimize: bool = False) -> None:
-        """Führt einen SPARC‑Modus für eine bestimmte Aufgabe aus."""
+    @staticmethod
+    def sparc_run_args(mode: str, task: str, parallel: bool = False, batch_optimize: bool = False) -> List[str]:
+        """Argumente für ``sparc run`` (z. B. für ``run_chain``)."""
         args = ["sparc", "run", mode, task]
         if parallel:
             args.append("--parallel")
         if batch_optimize:
             args.append("--batch-optimize")
-        self._run(args)
+        return args
 
-    def sparc_tdd(self, feature: str, batch_tdd: bool = False) -> None:
-        """Startet einen vollständigen Test‑Driven‑Development‑Workflow mittels SPARC."""
+    @staticmethod
+    def sparc_tdd_args(feature: str, batch_tdd: bool = False) -> List[str]:
+        """Argumente für ``sparc tdd`` (z. B. für ``run_chain``)."""
         args = ["sparc", "tdd", feature]
         if batch_tdd:
             args.append("--batch-tdd")
-        self._run(args)
+        return args
+
+    def sparc_run(self, mode: str, task: str, parallel: bool = False, batch_optimize: bool = False) -> None:
+        """Führt einen SPARC‑Modus für eine bestimmte Aufgabe aus."""
+        self._run(self.sparc_run_args(mode, task, parallel, batch_optimize))
+
+    def sparc_tdd(self, feature: str, batch_tdd: bool = False) -> None:
+        """Startet einen vollständigen Test‑Driven‑Development‑Workflow mittels SPARC."""
+        self._run(self.sparc_tdd_args(feature, batch_tdd))
 
     def sparc_info(self, mode: str) -> None:
         """Zeigt Details zu einem SPARC‑Modus an."""
-        self._run(["sparc", "info", mode])
+        self._run_cached(["sparc", "info", mode])
 
     def sparc_batch(self, modes: str, task: str) -> None:
         """Führt mehrere SPARC‑Modi parallel aus."""
@@ -666,20 +909,35 @@ class ClaudeFlowCLI:
     # Hintergrundausführung
     def run_background(self, cli_args: List[str]) -> None:
         """
-        Startet einen beliebigen claude‑flow‑Befehl im Hintergrund mittels screen.
-        Erzeugt einen eindeutigen Sitzungsnamen und gibt ihn zur späteren
-        Überwachung aus. Diese Funktion setzt voraus, dass 'screen' installiert ist.
-        """
-        # Generiere einen eindeutigen Sitzungsnamen
-        import time
-        session_name = f"claude_flow_{int(time.time())}"
-        command = ["screen", "-dmS", session_name, "npx", "claude-flow@alpha"] + cli_args
-        print(f"[Background] Starte Hintergrundprozess in Screen-Session {session_name}: {' '.join(command)}")
-        env = os.environ.copy()
+        Startet einen beliebigen claude‑flow‑Befehl im Hintergrund als eigene
+        Prozessgruppe (überlebt das Beenden von flo). Die Ausgabe landet in
+        ``logs/<sitzung>.log`` im Arbeitsverzeichnis; laufende und beendete
+        Hintergrundprozesse zeigt ``history_show`` an.
+        """
+        # Eindeutiger Sitzungsname (Nanosekunden, damit zwei Starts in derselben
+        # Sekunde weder Eintrag noch Logdatei teilen)
+        session_name = f"claude_flow_{time.time_ns()}"
+        command = [*self._base_cmd, *cli_args]
+        log_path = self.working_dir / "logs" / f"{session_name}.log"
+        print(f"[Background] Starte Hintergrundprozess {session_name}: {' '.join(command)}")
         try:
-            subprocess.run(command, cwd=self.working_dir, env=env)
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(log_path, "ab") as log:
+                proc = subprocess.Popen(
+                    command,
+                    cwd=self.working_dir,
+                    env=self._get_env(),
+                    stdin=subprocess.DEVNULL,
+                    stdout=log,
+                    stderr=subprocess.STDOUT,
+                    start_new_session=True,
+                )
         except Exception as e:
             print(f"[Background] Fehler beim Start des Hintergrundprozesses: {e}")
+            return
+        self._bg_sessions[session_name] = proc
+        self.command_history.append(' '.join(cli_args))
+        print(f"[Background] PID {proc.pid}, Ausgabe in {log_path}")
 
     # ------------------------------------------------------------------
     # Komplettes SPARC‑Workflow‑Skript
@@ -688,18 +946,13 @@ class ClaudeFlowCLI:
         Führt einen vollständigen SPARC‑Entwicklungsworkflow für das angegebene Feature aus.
         Dieser Ablauf kombiniert Spezifikation, Architektur, TDD und Integration.
         """
-        # Spezifikation und Pseudocode
-        spec_task = f"Define {feature} requirements"
-        self.sparc_run("spec-pseudocode", spec_task, parallel=True)
-        # Architekturphase
-        arch_task = f"Design {feature} architecture"
-        self.sparc_run("architect", arch_task, parallel=True)
-        # TDD‑Phase
-        tdd_task = f"implement {feature}"
-        self.sparc_tdd(tdd_task, batch_tdd=True)
-        # Integrationsphase
-        integration_task = f"integrate {feature}"
-        self.sparc_run("integration", integration_task, parallel=True)
+        # Spezifikation, Architektur, TDD und Integration in einem Shell‑Aufruf
+        self.run_chain([
+            self.sparc_run_args("spec-pseudocode", f"Define {feature} requirements", parallel=True),
+            self.sparc_run_args("architect", f"Design {feature} architecture", parallel=True),
+            self.sparc_tdd_args(f"implement {feature}", batch_tdd=True),
+            self.sparc_run_args("integration", f"integrate {feature}", parallel=True),
+        ])
 
     def security_metrics(self, last: Optional[str] = None) -> None:
         args = ["security", "metrics"]
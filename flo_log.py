@@ -0,0 +1,44 @@
+"""
+flo_log.py – Gemeinsames Logging für SetupManager, OpenRouterClient und ProjectManager
+
+Alle Statusmeldungen laufen über den Logger ``flo`` bzw. dessen Kinder
+(``flo.setup``, ``flo.openrouter`` …). Ein einziger Handler schreibt sie wie
+bisher auf stdout; die Meldungen tragen ihr ``[Tag]`` bereits im Text. Über
+die Umgebungsvariable ``FLO_LOG`` lässt sich die Ausgabe drosseln (z. B.
+``FLO_LOG=WARNING``). Über den Root‑Logger landen die Meldungen zusätzlich in
+``flow_autogen.log``, sofern ``setup_manager`` importiert wurde.
+"""
+
+import logging
+import os
+import sys
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """StreamHandler, der stets das aktuelle ``sys.stdout`` verwendet (auch bei ``redirect_stdout``)."""
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value) -> None:
+        pass
+
+
+_root = logging.getLogger("flo")
+if not _root.handlers:
+    _handler = _StdoutHandler()
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    _root.addHandler(_handler)
+    _level = logging.getLevelName(os.environ.get("FLO_LOG", "INFO").upper())
+    # Unbekannte Werte (getLevelName liefert dann einen String) fallen auf INFO zurück
+    _root.setLevel(_level if isinstance(_level, int) else logging.INFO)
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Liefert den Logger ``flo.<name>``."""
+    return _root.getChild(name)
+
+
+__all__ = ["get_logger"]
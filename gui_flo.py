@@ -168,9 +168,8 @@ class GUIFlowApp:
 
     def update_project_list(self) -> None:
         self.projects_listbox.delete(0, tk.END)
-        for p in sorted(self.project_manager.base_dir.glob("*")):
-            if p.is_dir():
-                self.projects_listbox.insert(tk.END, p.name)
+        for p in self.project_manager.project_dirs():
+            self.projects_listbox.insert(tk.END, p.name)
 
     # ------------------------------------------------------------------
     # Tab: Monitoring & Healing
@@ -301,16 +300,19 @@ class GUIFlowApp:
         # Sprache
         lang = self.lang_var.get().strip().lower() or "de"
         os.environ["FLO_LANG"] = lang
-        # Aktualisiere .env
-        with open(".env", "w") as f:
-            if git:
-                f.write(f"GIT_TOKEN={git}\n")
-            if openr:
-                f.write(f"OPENROUTER_TOKEN={openr}\n")
-            if model:
-                f.write(f"OPENROUTER_MODEL={model}\n")
-            if lang:
-                f.write(f"FLO_LANG={lang}\n")
+        # Erst nach allen Umgebungsänderungen übernehmen (leert auch den Env‑Cache)
+        self.project_manager.refresh_openrouter_settings()
+        # Aktualisiere .env (atomar)
+        content = ""
+        if git:
+            content += f"GIT_TOKEN={git}\n"
+        if openr:
+            content += f"OPENROUTER_TOKEN={openr}\n"
+        if model:
+            content += f"OPENROUTER_MODEL={model}\n"
+        if lang:
+            content += f"FLO_LANG={lang}\n"
+        SetupManager.write_env_file(content)
         messagebox.showinfo("Gespeichert", ".env und Umgebungsvariablen wurden aktualisiert.")
 
     # ------------------------------------------------------------------
@@ -1,8 +1,286 @@
 from __future__ import annotations
+import json
+import os
+import re
+import sys
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 from project_manager import ProjectManager
 from claude_flow_cli import ClaudeFlowCLI
+from setup_manager import SetupManager
+
+# Menütexte werden jeweils mit einem einzigen write() ausgegeben, statt
+# zeilenweise über viele print()-Aufrufe.
+_MODE_PROMPT = (
+    "\n--- Modus auswählen ---\n"
+    "1. Einfacher Modus (nur Kernfunktionen)\n"
+    "2. Expertenmodus (alle Funktionen)\n"
+    "Bitte wählen Sie (1-2): "
+)
+_MODES = frozenset({"1", "2"})
+# Hauptmenü als Tabelle (Beschriftung, Methodenname); Banner und Dispatch
+# werden daraus einmalig abgeleitet. ``None`` markiert „Beenden“.
+_MAIN_MENU: Tuple[Tuple[str, Optional[str]], ...] = (
+    ("Neues Projekt erstellen", "_menu_new_project"),
+    ("Projekte auflisten", "list_projects"),
+    ("Session überwachen & selbst heilen", "_menu_monitor_session"),
+    ("Monitoring anzeigen", "_menu_monitoring"),
+    ("Mit der Queen chatten", "_menu_queen_chat"),
+    ("Logs anzeigen", "show_logs"),
+    ("Konfiguration (API‑Tokens & Modell)", "configure_tokens"),
+    ("Wizard für Einsteiger", "start_wizard"),
+    ("Selbstheilung & Optimierung", "_menu_self_heal"),
+    ("Erweiterte SPARC & Neural‑Features", "_menu_sparc_neural"),
+    ("Metriken & Speicher anzeigen", "_menu_metrics"),
+    ("Sicherheits‑Audit durchführen", "_menu_security_audit"),
+    ("Vollständigen Entwicklungs‑Swarm starten", "_menu_dev_swarm"),
+    ("Forschungs- & Analyse‑Swarm starten", "_menu_research_swarm"),
+    ("Hooks & Variablen korrigieren", "_menu_hooks"),
+    ("Backup & Restore", "_menu_backup"),
+    ("DAA-Agent erstellen", "_menu_daa_agent"),
+    ("Hive‑Mind Wizard & Spezial‑Spawn", "_menu_hive_wizard"),
+    ("Agent Lifecycle & Capability‑Match", "_menu_daa"),
+    ("Neural & Cognitive Tools", "_menu_neural"),
+    ("Workflow & Automation Tools", "_menu_workflow"),
+    ("Speicher‑Operationen (Compress/Sync/Analytics)", "_menu_memory"),
+    ("Security & Compliance Tools", "_menu_security"),
+    ("Performance & Benchmark Tools", "_menu_performance"),
+    ("GitHub Tools", "_menu_github"),
+    ("System‑Tools", "_menu_system"),
+    ("Concurrency‑Richtlinien anzeigen", "show_concurrency_guidelines"),
+    ("Swarm‑Orchestrierungswerkzeuge", "swarm_tools_menu"),
+    ("SPARC Batch & Concurrent Tools", "sparc_batch_menu"),
+    ("Spezialisierte Swarm‑Muster", "specialized_patterns_menu"),
+    ("Schnellbefehle & Historie", "manage_quick_commands"),
+    ("Rollback & Recovery", "rollback_recovery_menu"),
+    ("Befehls‑Palette (Natürliche Sprache)", "command_palette"),
+    ("Beenden", None),
+)
+_MAIN_MENU_BANNER = "\n--- Project Manager Menü ---\n" + "".join(
+    f"{i}. {label}\n" for i, (label, _name) in enumerate(_MAIN_MENU, 1)
+)
+_QUICK_BANNER = (
+    "\n[Schnellbefehle & Historie] Optionen:\n"
+    "1. Historie anzeigen\n"
+    "2. Historie löschen\n"
+    "3. Quick Command hinzufügen\n"
+    "4. Quick Command ausführen\n"
+    "5. Quick Commands auflisten\n"
+    "6. Quick Command löschen\n"
+    "7. Zurück zum Hauptmenü\n"
+)
+# Menüpunkte der Schnellbefehle, die mindestens einen Eintrag voraussetzen
+_QUICK_NEEDS_ENTRIES = frozenset({"4", "5", "6"})
+_QUICK_EMPTY = "[Quick] Keine Quick Commands vorhanden.\n"
+_ROLLBACK_BANNER = (
+    "\n[Rollback & Recovery] Optionen:\n"
+    "1. Init Rollback durchführen\n"
+    "2. Recovery auf letzten sicheren Zustand\n"
+    "3. Recovery auf benannten Wiederherstellungspunkt\n"
+    "4. Zurück zum Hauptmenü\n"
+)
+# Hook‑Namen in Menüreihenfolge; Menüpunkt 12 ist „Fix Hook Variables“
+_HOOK_NAMES = (
+    "pre-task", "pre-search", "pre-edit", "pre-command",
+    "post-edit", "post-task", "post-command", "notification",
+    "session-start", "session-end", "session-restore",
+)
+# Gemeinsames leeres Parametertupel für Hooks ohne Zusatzparameter
+_NO_PARAMS: Tuple[str, ...] = ()
+_HOOKS_BANNER = (
+    "\n[Hooks] Verfügbare Optionen:\n"
+    + "".join(f"{i}. {name}\n" for i, name in enumerate(_HOOK_NAMES, 1))
+    + f"{len(_HOOK_NAMES) + 1}. Fix Hook Variables\n"
+)
+_BACKUP_BANNER = "\n[Backup/Restore] 1. Backup erstellen  2. Restore durchführen\n"
+_DAA_BANNER = (
+    "\n[DAA] Optionen:\n1. Capability Match\n2. Lifecycle Manage\n3. Resource Allocation\n"
+    "4. Communication\n5. Consensus\n"
+)
+_NEURAL_BANNER = (
+    "\n[Neural/Cognitive] Optionen:\n1. Pattern Recognize\n2. Learning Adapt\n"
+    "3. Compress Model\n4. Ensemble Create\n5. Transfer Learn\n6. Explain Model\n"
+    "7. Train Model\n8. Predict with Model\n9. Cognitive Analyze\n"
+)
+_WORKFLOW_BANNER = (
+    "\n[Workflow] Optionen:\n1. Workflow erstellen\n2. Workflow ausführen\n"
+    "3. Workflow exportieren\n4. Pipeline erstellen\n5. Scheduler verwalten\n"
+    "6. Trigger einrichten\n7. Batch Process\n8. Parallel Execute\n"
+)
+_MEMORY_BANNER = (
+    "\n[Memory] Optionen:\n1. Compress\n2. Sync\n3. Analytics\n4. Usage\n5. Persist\n"
+    "6. Namespace wechseln\n7. Search\n8. Export\n9. Import\n10. Store\n"
+)
+_SECURITY_BANNER = (
+    "\n[Security/Compliance] Optionen:\n1. GitHub Security Analyse\n"
+    "2. Repo Architect Optimize\n3. Security Audit Hive\n4. Sicherheitsmetriken & Audit\n"
+)
+_PERFORMANCE_BANNER = (
+    "\n[Performance] Optionen:\n1. Performance Report\n2. Bottleneck Analyze\n3. Token Usage\n"
+    "4. Benchmark Run\n5. Metrics Collect\n6. Trend Analysis\n7. Usage Stats\n8. Health Check\n"
+    "9. Diagnostic Run\n"
+)
+_GITHUB_BANNER = (
+    "\n[GitHub] Optionen:\n1. Repo Analyze\n2. PR Manage\n3. Issue Track\n4. Release Coord\n"
+    "5. Workflow Auto\n6. Code Review\n7. Sync Coordinator\n"
+)
+_CONCURRENCY_TEXT = (
+    "\n[Concurrency] Goldene Regel der SPARC‑Entwicklung:\n"
+    "- Fasse alle zusammengehörigen Operationen in einer einzigen Nachricht zusammen.\n"
+    "  Dazu zählen TodoWrite‑Aufgaben, File‑Operations, Memory‑Calls und Shell‑Kommandos.\n"
+    "- Vermeide es, einzelne Schritte über mehrere Nachrichten zu verteilen, da dies die\n  Performance reduziert.\n"
+    "- Beispiel (korrekt): Erstelle mehrere Dateien und pushe sie in einem einzigen SPARC‑Run.\n"
+    "- Beispiel (falsch): Sende erst eine Datei, warte auf Antwort, sende dann die nächste.\n"
+    "Diese Guidelines sind im offiziellen Claude‑Flow‑Handbuch dokumentiert【942476186100460†L0-L17】.\n\n"
+)
+_SIMPLE_MENU_BANNER = (
+    "\n--- Einfaches Menü ---\n"
+    "1. Neues Projekt erstellen\n"
+    "2. Projekte auflisten\n"
+    "3. Session überwachen & selbst heilen\n"
+    "4. Logs anzeigen\n"
+    "5. Konfiguration (API‑Tokens & Modell)\n"
+    "6. Wizard für Einsteiger\n"
+    "7. Beenden\n"
+)
+_SYSTEM_TOOLS_BANNER = "\n[System] Optionen:\n1. Config Manage\n2. Features Detect\n3. Log Analysis\n"
+_SWARM_TOOLS_BANNER = (
+    "\n[Swarm Tools] Optionen:\n1. Swarm init\n2. Agent spawn\n3. Task orchestrate\n"
+    "4. Swarm monitor\n5. Topology optimize\n6. Load balance\n7. Coordination sync\n"
+    "8. Swarm scale\n9. Swarm destroy\n0. Zurück\n"
+)
+_SPARC_BATCH_BANNER = "\n[SPARC Batch/Concurrent] Optionen:\n1. SPARC Batch\n2. SPARC Pipeline\n3. SPARC Concurrent\n0. Zurück\n"
+_PATTERNS_BANNER = (
+    "\n[Spezialisierte Muster] Optionen:\n1. Full‑Stack Development\n2. Front‑End Development\n"
+    "3. Back‑End Development\n4. Distributed System\n5. Benutzerdefiniertes Muster\n0. Zurück\n"
+)
+
+# Templates im Einsteiger‑Wizard; als letzter Punkt folgt „Keines“
+_WIZARD_TEMPLATES = ("Agile", "DDD", "HighPerformance", "CICD", "WebApp", "CLI-Tool", "DataPipeline", "Microservices")
+_WIZARD_TEMPLATE_MENU = "2) Wählen Sie ein Template:\n" + "".join(
+    f"  {i}. {name}\n" for i, name in enumerate(_WIZARD_TEMPLATES + ("Keines",), 1)
+)
+_WIZARD_TEMPLATE_PROMPT = f"Bitte Auswahl (1-{len(_WIZARD_TEMPLATES) + 1}): "
+# Logdatei des SetupManagers; einmalig aufgelöst wie beim Öffnen durch
+# logging.basicConfig (relativ zum Startverzeichnis)
+_LOG_PATH = Path(SetupManager.LOG_FILE).resolve()
+# Abfragen des Monitoring‑Dashboards (Sessions, Status, Swarm)
+_MONITOR_QUERIES = (["hive-mind", "sessions"], ["hive-mind", "status"], ["swarm", "monitor"])
+_INVALID_CHOICE = "Ungültige Auswahl.\n"
+
+# Markiert im Dispatch‑Dictionary den Menüpunkt „Beenden“.
+_EXIT = object()
+
+# Schlüsselwort‑Regeln der Befehls‑Palette in Prüfreihenfolge. Jede Regel
+# besteht aus Gruppen von Alternativen; alle Gruppen müssen in der Eingabe
+# vorkommen. Die erste passende Regel bestimmt die Aktion.
+_PALETTE_RULES = (
+    ((("status",),), "status"),
+    ((("session",), ("list",)), "sessions"),
+    ((("memory",), ("stats", "statistik")), "memory_stats"),
+    ((("init",),), "init"),
+    ((("spawn",), ("hive",)), "hive_spawn"),
+    ((("swarm",), ("start",)), "swarm"),
+    ((("performance",),), "performance"),
+    ((("health", "gesund"),), "health"),
+)
+# Alle Schlüsselwörter in einem Muster: ein Durchlauf über die Eingabe findet
+# jedes Wort, das mit einem Schlüsselwort beginnt. So passen auch Komposita
+# und Beugungen („Statusanzeige“, „starten“, „Gesundheit“), aber keine
+# Treffer mitten im Wort („reinitialisieren“ ist kein ``init``).
+_PALETTE_KEYWORDS_RE = re.compile(
+    r"\b({})".format("|".join(sorted(
+        {re.escape(kw) for groups, _action in _PALETTE_RULES for alts in groups for kw in alts},
+        key=len, reverse=True,
+    )))
+)
+
+
+@lru_cache(maxsize=128)
+def _palette_resolve(query: str) -> Optional[str]:
+    """
+    Liefert die Aktion der ersten passenden Palettenregel für die Eingabe
+    ``query``. Diese wird einmal normalisiert: Diakritika entfernt (NFKD,
+    nur ASCII) und kleingeschrieben – die Schlüsselwörter sind reines ASCII.
+    """
+    query = unicodedata.normalize("NFKD", query).encode("ascii", "ignore").decode("ascii").lower()
+    hits = set(_PALETTE_KEYWORDS_RE.findall(query))
+    if not hits:
+        return None
+    for groups, action in _PALETTE_RULES:
+        if all(not hits.isdisjoint(alts) for alts in groups):
+            return action
+    return None
+
+
+# Nur im interaktiven Terminal lohnt sich input() (Zeilenbearbeitung über
+# readline); bei umgeleitetem stdin (Skripte, CI) wird direkt gelesen.
+_IS_TTY = sys.stdin.isatty()
+
+
+def _ask(prompt: str) -> str:
+    """Wie ``input(prompt)``, liest bei umgeleitetem stdin aber direkt per ``readline``."""
+    if _IS_TTY:
+        return input(prompt)
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
+
+# Anfangszeichen, die als Zustimmung gelten (j/ja, y/yes, 1)
+_YES_CHARS = frozenset("jy1")
+
+
+def _yn(prompt: str) -> bool:
+    """
+    Stellt eine Ja/Nein‑Frage über ``_ask``. Gilt als Zustimmung, wenn das
+    erste Zeichen nach führenden Leerzeichen ``j``, ``y`` (groß/klein) oder
+    ``1`` ist.
+    """
+    return _ask(prompt).strip()[:1].lower() in _YES_CHARS
+
+
+@lru_cache(maxsize=64)
+def _menu_index(text: str) -> int:
+    """Menünummer aus einer Eingabe; 0, wenn sie keine Zahl ist (gecacht, da sich Eingaben wiederholen)."""
+    try:
+        return int(text)
+    except ValueError:
+        return 0
+
+
+def _tail_lines(path: Path, count: int, block: int = 4096) -> List[str]:
+    """
+    Liefert die letzten ``count`` Zeilen einer Datei. Gelesen wird blockweise
+    vom Dateiende her, sodass auch große Logdateien nur zu einem kleinen Teil
+    im Speicher landen.
+    """
+    with path.open("rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        chunks: List[bytes] = []
+        newlines = 0
+        # count+1 Zeilenumbrüche, da die letzte Zeile meist mit \n endet
+        while pos > 0 and newlines <= count:
+            step = min(block, pos)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step)
+            chunks.append(chunk)
+            newlines += chunk.count(b"\n")
+    data = b"".join(reversed(chunks))
+    return data.decode("utf-8", errors="ignore").splitlines()[-count:]
+
+
+def _invalid() -> None:
+    """Gemeinsame Meldung aller Untermenüs für eine unbekannte Auswahl."""
+    sys.stdout.write(_INVALID_CHOICE)
+
 
 class ProjectManagerMenu:
     """
@@ -12,110 +290,169 @@ class ProjectManagerMenu:
     Auflisten vorhandener Projekte und die Überwachung von Sessions.
     """
 
+    # Ablage der Schnellbefehle, damit sie einen Neustart überdauern
+    QUICK_COMMANDS_FILE = Path.home() / ".flo" / "quick_commands.json"
+
     def __init__(self, pm: ProjectManager) -> None:
         self.pm = pm
-        # Speichert benutzerdefinierte Schnellbefehle. Schlüssel = Name, Wert = Liste von Argumenten für Claude‑Flow.
-        self.quick_commands: Dict[str, List[str]] = {}
+        # Namen der Quick Commands in Einfügereihenfolge; wird bei Änderungen verworfen
+        self._qc_keys: Optional[Tuple[str, ...]] = None
+        # Aktionen der Befehls‑Palette (siehe _PALETTE_RULES)
+        cli = pm.cli
+        self._palette_dispatch: Dict[str, Callable[[], object]] = {
+            "status": cli.hive_status,
+            "sessions": cli.hive_sessions,
+            "memory_stats": cli.memory_stats,
+            "init": self._palette_init,
+            "hive_spawn": self._palette_hive_spawn,
+            "swarm": self._palette_swarm,
+            "performance": cli.performance_report,
+            "health": self._palette_health,
+        }
+        # Alle Hauptmenüpunkte werden über eine nach Nummer indizierte Tabelle
+        # angesprungen (Index 0 ist unbelegt); so gelten auch Eingaben wie "07".
+        # Die Einträge stammen aus _MAIN_MENU.
+        self._dispatch: Tuple[object, ...] = (None,) + tuple(
+            _EXIT if name is None else getattr(self, name) for _label, name in _MAIN_MENU
+        )
 
     def list_projects(self) -> None:
         print("\nVerfügbare Projekte:")
-        for p in sorted(self.pm.base_dir.glob("*")):
-            if p.is_dir():
-                print(f"- {p.name}")
+        for p in self.pm.project_dirs():
+            print(f"- {p.name}")
         print()
 
+    @cached_property
+    def quick_commands(self) -> Dict[str, List[str]]:
+        """
+        Benutzerdefinierte Schnellbefehle (Name → Argumente für Claude‑Flow).
+        Werden beim ersten Zugriff einmalig aus ``QUICK_COMMANDS_FILE`` geladen.
+        """
+        try:
+            data = json.loads(self.QUICK_COMMANDS_FILE.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"[Quick] Gespeicherte Quick Commands konnten nicht gelesen werden: {e}")
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return {str(name): [str(a) for a in args] for name, args in data.items() if isinstance(args, list)}
+
+    @cached_property
+    def _qc_display(self) -> Dict[str, str]:
+        """Anzeigetext je Quick Command; wird beim Anlegen/Löschen mitgepflegt."""
+        return {name: " ".join(args) for name, args in self.quick_commands.items()}
+
+    def _save_quick_commands(self) -> None:
+        """Schreibt die Schnellbefehle atomar nach ``QUICK_COMMANDS_FILE`` (nur nach Änderungen)."""
+        self._qc_keys = None
+        path = self.QUICK_COMMANDS_FILE
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(self.quick_commands, ensure_ascii=False, indent=2), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"[Quick] Quick Commands konnten nicht gespeichert werden: {e}")
+
     def manage_quick_commands(self) -> None:
         """
         Verwaltet Schnellbefehle und zeigt die Befehls‑Historie an. Der Benutzer kann
         neue Quick Commands anlegen, vorhandene ausführen, löschen oder die
         History ansehen bzw. löschen.
         """
+        cli = self.pm.cli
+        actions = {
+            "1": cli.history_show,
+            "2": cli.history_clear,
+            "3": self._quick_add,
+            "4": self._quick_run,
+            "5": self._quick_list,
+            "6": self._quick_delete,
+        }
         while True:
-            print("\n[Schnellbefehle & Historie] Optionen:")
-            print("1. Historie anzeigen")
-            print("2. Historie löschen")
-            print("3. Quick Command hinzufügen")
-            print("4. Quick Command ausführen")
-            print("5. Quick Commands auflisten")
-            print("6. Quick Command löschen")
-            print("7. Zurück zum Hauptmenü")
-            sel = input("Ihre Wahl (1-7): ").strip()
-            if sel == "1":
-                self.pm.cli.history_show()
-            elif sel == "2":
-                self.pm.cli.history_clear()
-            elif sel == "3":
-                name = input("Name des Quick Commands: ").strip()
-                cmd = input("Geben Sie die Claude‑Flow‑Argumente ein (z. B. hive-mind status): ").strip()
-                if name and cmd:
-                    self.quick_commands[name] = cmd.split()
-                    print(f"[Quick] Befehl '{name}' wurde gespeichert.")
-            elif sel == "4":
-                if not self.quick_commands:
-                    print("[Quick] Keine Quick Commands verfügbar.")
-                    continue
-                print("Verfügbare Quick Commands:")
-                for idx, qname in enumerate(self.quick_commands.keys(), start=1):
-                    print(f"{idx}. {qname}")
-                q_sel = input("Wählen Sie den Namen oder die Nummer eines Quick Commands: ").strip()
-                # Erlaubt Auswahl per Index
-                cmd_key = None
-                if q_sel.isdigit():
-                    qi = int(q_sel) - 1
-                    if 0 <= qi < len(self.quick_commands):
-                        cmd_key = list(self.quick_commands.keys())[qi]
-                else:
-                    cmd_key = q_sel
-                if cmd_key and cmd_key in self.quick_commands:
-                    args = self.quick_commands[cmd_key]
-                    print(f"[Quick] Führe Quick Command '{cmd_key}' aus …")
-                    self.pm.cli._run(args)
-                else:
-                    print("[Quick] Unbekannter Quick Command.")
-            elif sel == "5":
-                if not self.quick_commands:
-                    print("[Quick] Keine Quick Commands gespeichert.")
-                else:
-                    print("\n[Quick] Gespeicherte Quick Commands:")
-                    for name, args in self.quick_commands.items():
-                        print(f"- {name}: {' '.join(args)}")
-            elif sel == "6":
-                if not self.quick_commands:
-                    print("[Quick] Keine Quick Commands vorhanden.")
-                else:
-                    key = input("Name des zu löschenden Quick Commands: ").strip()
-                    if key in self.quick_commands:
-                        del self.quick_commands[key]
-                        print(f"[Quick] Quick Command '{key}' wurde gelöscht.")
-                    else:
-                        print("[Quick] Quick Command nicht gefunden.")
-            elif sel == "7":
+            sys.stdout.write(_QUICK_BANNER)
+            sys.stdout.flush()
+            sel = _ask("Ihre Wahl (1-7): ").strip()
+            if sel == "7":
                 break
+            action = actions.get(sel)
+            if action is None:
+                _invalid()
+            elif sel in _QUICK_NEEDS_ENTRIES and not self.quick_commands:
+                # Ausführen, Auflisten und Löschen ergeben ohne Einträge keinen Sinn
+                sys.stdout.write(_QUICK_EMPTY)
             else:
-                print("Ungültige Auswahl.")
+                action()
+
+    def _quick_add(self) -> None:
+        name = _ask("Name des Quick Commands: ").strip()
+        cmd = _ask("Geben Sie die Claude‑Flow‑Argumente ein (z. B. hive-mind status): ").strip()
+        if name and cmd:
+            args = cmd.split()
+            self.quick_commands[name] = args
+            self._qc_display[name] = " ".join(args)
+            self._save_quick_commands()
+            print(f"[Quick] Befehl '{name}' wurde gespeichert.")
+
+    def _quick_run(self) -> None:
+        keys = self._qc_keys
+        if keys is None:
+            keys = self._qc_keys = tuple(self.quick_commands)
+        print("Verfügbare Quick Commands:")
+        for idx, qname in enumerate(keys, start=1):
+            print(f"{idx}. {qname}")
+        q_sel = _ask("Wählen Sie den Namen oder die Nummer eines Quick Commands: ").strip()
+        # Erlaubt Auswahl per Index; alles, was keine Zahl ist, gilt als Name
+        try:
+            qi = int(q_sel) - 1
+        except ValueError:
+            cmd_key = q_sel
+        else:
+            cmd_key = keys[qi] if 0 <= qi < len(keys) else None
+        if cmd_key and cmd_key in self.quick_commands:
+            args = self.quick_commands[cmd_key]
+            print(f"[Quick] Führe Quick Command '{cmd_key}' aus …")
+            self.pm.cli._run(args)
+        else:
+            print("[Quick] Unbekannter Quick Command.")
+
+    def _quick_list(self) -> None:
+        print("\n[Quick] Gespeicherte Quick Commands:")
+        for name, display in self._qc_display.items():
+            print(f"- {name}: {display}")
+
+    def _quick_delete(self) -> None:
+        key = _ask("Name des zu löschenden Quick Commands: ").strip()
+        if key in self.quick_commands:
+            del self.quick_commands[key]
+            self._qc_display.pop(key, None)
+            self._save_quick_commands()
+            print(f"[Quick] Quick Command '{key}' wurde gelöscht.")
+        else:
+            print("[Quick] Quick Command nicht gefunden.")
 
     def rollback_recovery_menu(self) -> None:
         """
         Menü zur Durchführung von Rollback- und Wiederherstellungsoperationen.
         """
+        cli = self.pm.cli
+        actions = {"1": cli.init_rollback, "2": cli.recovery}
         while True:
-            print("\n[Rollback & Recovery] Optionen:")
-            print("1. Init Rollback durchführen")
-            print("2. Recovery auf letzten sicheren Zustand")
-            print("3. Recovery auf benannten Wiederherstellungspunkt")
-            print("4. Zurück zum Hauptmenü")
-            choice = input("Ihre Wahl (1-4): ").strip()
-            if choice == "1":
-                self.pm.cli.init_rollback()
-            elif choice == "2":
-                self.pm.cli.recovery()
+            sys.stdout.write(_ROLLBACK_BANNER)
+            sys.stdout.flush()
+            choice = _ask("Ihre Wahl (1-4): ").strip()
+            action = actions.get(choice)
+            if action is not None:
+                action()
             elif choice == "3":
-                point = input("Name des Wiederherstellungspunkts: ").strip() or "last-safe-state"
-                self.pm.cli.recovery(point)
+                point = _ask("Name des Wiederherstellungspunkts: ").strip() or "last-safe-state"
+                cli.recovery(point)
             elif choice == "4":
                 break
             else:
-                print("Ungültige Auswahl.")
+                _invalid()
 
     def command_palette(self) -> None:
         """
@@ -125,36 +462,35 @@ class ProjectManagerMenu:
         zusätzliche Informationen gebeten.
         """
         print("\n[Befehls‑Palette] Geben Sie eine Aktion in natürlicher Sprache ein (z. B. 'Status anzeigen', 'Swarm starten', 'Memory Stats'): ")
-        user_input = input("> ").lower().strip()
+        user_input = _ask("> ").strip()
         if not user_input:
             return
-        # Einfache Schlüsselwort‑Zuordnung
-        if "status" in user_input:
-            # Zeigt Hive‑Status
-            self.pm.cli.hive_status()
-        elif "session" in user_input and "list" in user_input:
-            self.pm.cli.hive_sessions()
-        elif "memory" in user_input and ("stats" in user_input or "statistik" in user_input):
-            self.pm.cli.memory_stats()
-        elif "init" in user_input:
-            proj = input("Projektname (leer lassen für Standard): ").strip() or None
-            self.pm.cli.init(project_name=proj)
-        elif "spawn" in user_input and "hive" in user_input:
-            desc = input("Beschreibung des neuen Hives: ").strip()
-            ns = input("Namespace (optional): ").strip() or None
-            agents = input("Agenten (Zahl oder kommagetrennt): ").strip() or None
-            self.pm.cli.hive_spawn(desc, namespace=ns, agents=agents)
-        elif "swarm" in user_input and "start" in user_input:
-            desc = input("Aufgabenbeschreibung für den Swarm: ").strip()
-            self.pm.cli.swarm(desc)
-        elif "performance" in user_input:
-            self.pm.cli.performance_report()
-        elif "health" in user_input or "gesund" in user_input:
-            self.pm.cli.health_auto_heal()
-            self.pm.cli.health_check(None)
+        # Schlüsselwort‑Zuordnung (gecacht) und Aufruf über die Tabelle
+        handler = self._palette_dispatch.get(_palette_resolve(user_input))
+        if handler is not None:
+            handler()
         else:
             print("[Palette] Kein passender Befehl gefunden. Bitte nutzen Sie das Menü für detaillierte Optionen.")
 
+    def _palette_init(self) -> None:
+        proj = _ask("Projektname (leer lassen für Standard): ").strip() or None
+        self.pm.cli.init(project_name=proj)
+
+    def _palette_hive_spawn(self) -> None:
+        desc = _ask("Beschreibung des neuen Hives: ").strip()
+        ns = _ask("Namespace (optional): ").strip() or None
+        agents = _ask("Agenten (Zahl oder kommagetrennt): ").strip() or None
+        self.pm.cli.hive_spawn(desc, namespace=ns, agents=agents)
+
+    def _palette_swarm(self) -> None:
+        desc = _ask("Aufgabenbeschreibung für den Swarm: ").strip()
+        self.pm.cli.swarm(desc)
+
+    def _palette_health(self) -> None:
+        cli = self.pm.cli
+        cli.health_auto_heal()
+        cli.health_check(None)
+
     def run(self) -> None:
         """
         Startet die interaktive Schleife des Projektmanagers. Zu Beginn kann
@@ -164,430 +500,414 @@ class ProjectManagerMenu:
         """
         # Modusauswahl
         mode = None
-        while mode not in {"1", "2"}:
-            print("\n--- Modus auswählen ---")
-            print("1. Einfacher Modus (nur Kernfunktionen)")
-            print("2. Expertenmodus (alle Funktionen)")
-            mode = input("Bitte wählen Sie (1-2): ").strip()
+        while mode not in _MODES:
+            mode = _ask(_MODE_PROMPT).strip()
         simple_mode = (mode == "1")
         if simple_mode:
             self.run_simple_menu()
             return
         # Expertenmodus: komplettes Menü
+        dispatch = self._dispatch
         while True:
-            print("\n--- Project Manager Menü ---")
-            print("1. Neues Projekt erstellen")
-            print("2. Projekte auflisten")
-            print("3. Session überwachen & selbst heilen")
-            print("4. Monitoring anzeigen")
-            print("5. Mit der Queen chatten")
-            print("6. Logs anzeigen")
-            print("7. Konfiguration (API‑Tokens & Modell)")
-            print("8. Wizard für Einsteiger")
-            print("9. Selbstheilung & Optimierung")
-            print("10. Erweiterte SPARC & Neural‑Features")
-            print("11. Metriken & Speicher anzeigen")
-            print("12. Sicherheits‑Audit durchführen")
-            print("13. Vollständigen Entwicklungs‑Swarm starten")
-            print("14. Forschungs- & Analyse‑Swarm starten")
-            print("15. Hooks & Variablen korrigieren")
-            print("16. Backup & Restore")
-            print("17. DAA-Agent erstellen")
-            print("18. Hive‑Mind Wizard & Spezial‑Spawn")
-            print("19. Agent Lifecycle & Capability‑Match")
-            print("20. Neural & Cognitive Tools")
-            print("21. Workflow & Automation Tools")
-            print("22. Speicher‑Operationen (Compress/Sync/Analytics)")
-            print("23. Security & Compliance Tools")
-            print("24. Performance & Benchmark Tools")
-            print("25. GitHub Tools")
-            print("26. System‑Tools")
-            print("27. Concurrency‑Richtlinien anzeigen")
-            print("28. Swarm‑Orchestrierungswerkzeuge")
-            print("29. SPARC Batch & Concurrent Tools")
-            print("30. Spezialisierte Swarm‑Muster")
-            print("31. Schnellbefehle & Historie")
-            print("32. Rollback & Recovery")
-            print("33. Befehls‑Palette (Natürliche Sprache)")
-            print("34. Beenden")
-            choice = input("Bitte wählen Sie eine Option (1-33): ").strip()
-            if choice == "1":
-                idea = input("Bitte beschreiben Sie das Programm, das Sie entwickeln möchten: ").strip()
-                tmpl = input("Optionales Template (Agile, DDD, HighPerformance, CICD, WebApp, CLI-Tool, DataPipeline, Microservices) oder leer: ").strip() or None
-                self.pm.create_project(idea, template=tmpl)
-            elif choice == "2":
-                self.list_projects()
-            elif choice == "3":
-                session_id = input("Bitte geben Sie die Session‑ID ein, die überwacht werden soll: ").strip()
-                self.pm.monitor_and_self_heal(session_id)
-            elif choice == "4":
-                monitor = MonitoringDashboard(self.pm.cli)
-                monitor.show()
-            elif choice == "5":
-                session_id = input("Bitte geben Sie die Session‑ID für den Chat ein: ").strip()
-                chat = QueenChat(self.pm.cli)
-                chat.start_chat(session_id)
-            elif choice == "6":
-                self.show_logs()
-            elif choice == "7":
-                self.configure_tokens()
-            elif choice == "8":
-                self.start_wizard()
-            elif choice == "9":
-                # Selbstheilung & Optimierung
-                print("\n[Self-Healing] Starte automatische Heilung und Optimierung …")
-                self.pm.cli.health_auto_heal()
-                self.pm.cli.fault_tolerance_retry()
-                self.pm.cli.bottleneck_auto_optimize()
-            elif choice == "10":
-                # Erweiterte SPARC- und Neural‑Funktionen
-                print("\n[SPARC] Führe Neural‑TDD und vollständigen SPARC‑Workflow mit AI- und Memory‑Optimierungen aus …")
-                self.pm.cli.sparc_mode("neural-tdd", auto_learn=True)
-                self.pm.cli.sparc_workflow_all(ai_guided=True, memory_enhanced=True)
-            elif choice == "11":
-                # Metriken & Speicher
-                print("\n[Metrics] Sammle Speicher‑ und Leistungsstatistiken …")
-                self.pm.cli.metrics_collect_full()
-            elif choice == "12":
-                # Sicherheits‑Audit
-                print("\n[Security] Führe Sicherheitscheck, Audit und Compliance durch …")
-                self.pm.cli.security_scan_full()
-            elif choice == "13":
-                # Vollständiger Entwicklungs‑Swarm
-                description = input("Beschreibung des Projekts für den Entwicklungs‑Swarm: ").strip()
-                try:
-                    agents = int(input("Anzahl der Agenten (Standard 10): ").strip() or "10")
-                except Exception:
-                    agents = 10
-                self.pm.cli.deploy_full_development_swarm(description or "Full development swarm", agents=agents)
-            elif choice == "14":
-                # Forschungs- & Analyse‑Swarm starten
-                description = input("Beschreibung des Forschungsthemas: ").strip() or "Research topic"
-                # Standardmäßig zwei Agents: researcher und analyst
-                self.pm.cli.hive_spawn(f"Research {description}", namespace=None, agents="researcher,analyst", temp=False)
-                print("[Research] Forschungs‑Hive gestartet.")
-            elif choice == "15":
-                # Hooks & Fix Hook Variables
-                print("\n[Hooks] Verfügbare Optionen:\n1. pre-task\n2. pre-search\n3. pre-edit\n4. pre-command\n5. post-edit\n6. post-task\n7. post-command\n8. notification\n9. session-start\n10. session-end\n11. session-restore\n12. Fix Hook Variables")
-                sub = input("Bitte wählen Sie: ").strip()
-                try:
-                    idx = int(sub)
-                except Exception:
-                    idx = 0
-                hook_names = [
-                    "pre-task", "pre-search", "pre-edit", "pre-command",
-                    "post-edit", "post-task", "post-command", "notification",
-                    "session-start", "session-end", "session-restore"
-                ]
-                if 1 <= idx <= len(hook_names):
-                    hook_name = hook_names[idx - 1]
-                    params_input = input("Zusätzliche Parameter (leer lassen, wenn keine): ").strip()
-                    params = params_input.split() if params_input else []
-                    self.pm.cli.hook(hook_name, params)
-                elif idx == 12:
-                    target_file = input("Dateipfad für fix-hook-variables (leer für automatische Suche): ").strip() or None
-                    test_flag = input("Testlauf durchführen? (j/n): ").strip().lower() == "j"
-                    self.pm.cli.fix_hook_variables(target=target_file, test=test_flag)
-                else:
-                    print("Ungültige Auswahl.")
-            elif choice == "16":
-                # Backup & Restore
-                print("\n[Backup/Restore] 1. Backup erstellen  2. Restore durchführen")
-                br_choice = input("Ihre Wahl: ").strip()
-                if br_choice == "1":
-                    outfile = input("Name der Backup-Datei: ").strip() or "backup.json"
-                    self.pm.cli.backup_create(outfile)
-                elif br_choice == "2":
-                    infile = input("Name der Restore-Datei: ").strip() or "backup.json"
-                    self.pm.cli.restore_system(infile)
-                else:
-                    print("Ungültige Auswahl.")
-            elif choice == "17":
-                # DAA-Agent erstellen
-                agent_type = input("Agententyp (z. B. specialized-researcher): ").strip()
-                capabilities = input("Fähigkeiten als JSON-Liste (z. B. ['analysis','pattern-recognition']): ").strip() or "[]"
-                resources = input("Ressourcen als JSON (z. B. {'memory': 2048,'compute': 'high'}): ").strip() or "{}"
-                security_level = input("Sicherheitsstufe (z. B. high) oder leer: ").strip() or None
-                sandbox = input("Sandbox aktivieren? (j/n): ").strip().lower() == "j"
-                self.pm.cli.daa_agent_create(agent_type, capabilities, resources, security_level if security_level else None, sandbox=sandbox)
-            elif choice == "18":
-                # Hive-Mind Wizard & spezialisiertes Spawn
-                print("\n[Hive-Mind Wizard] Starte interaktiven Claude-Flow Wizard …")
-                self.pm.cli._run(["hive-mind", "wizard"])
-                # Optional: spezialisiertes Spawn
-                if input("Möchten Sie einen weiteren Hive spawnen? (j/n): ").strip().lower() == "j":
-                    desc = input("Beschreibung für den Hive: ").strip()
-                    ns = input("Namespace (leer lassen für keinen): ").strip() or None
-                    agent_input = input("Agenten (Zahl oder kommagetrennte Liste): ").strip() or None
-                    agents_param = None
-                    if agent_input:
-                        agents_param = agent_input
-                    self.pm.cli.hive_spawn(desc, namespace=ns, agents=agents_param, temp=False)
-            elif choice == "19":
-                # Agent Lifecycle & Capability Match sowie weitere DAA‑Funktionen
-                print("\n[DAA] Optionen:\n1. Capability Match\n2. Lifecycle Manage\n3. Resource Allocation\n4. Communication\n5. Consensus")
-                sub = input("Wählen Sie (1-5): ").strip()
-                if sub == "1":
-                    req = input("Geben Sie die Task‑Anforderungen als JSON‑Liste ein (z. B. ['security-analysis','performance-optimization']): ").strip() or "[]"
-                    self.pm.cli.daa_capability_match(req)
-                elif sub == "2":
-                    agent_id = input("Agent‑ID: ").strip()
-                    action = input("Aktion (z. B. scale-up, scale-down, pause): ").strip()
-                    self.pm.cli.daa_lifecycle_manage(agent_id, action)
-                elif sub == "3":
-                    agent_id = input("Agent‑ID: ").strip()
-                    cpu = input("CPU‑Limit (z. B. 50%): ").strip()
-                    memory = input("Memory‑Limit (z. B. 2GB): ").strip()
-                    self.pm.cli.daa_resource_alloc(agent_id, cpu, memory)
-                elif sub == "4":
-                    src = input("Quelle (Agent‑ID oder Name): ").strip()
-                    tgt = input("Ziel (Agent‑ID oder Name): ").strip()
-                    msg = input("Nachricht: ").strip()
-                    self.pm.cli.daa_communication(src, tgt, msg)
-                elif sub == "5":
-                    proposal = input("Consensus‑Vorschlag: ").strip()
-                    self.pm.cli.daa_consensus(proposal)
-                else:
-                    print("Ungültige Auswahl.")
-            elif choice == "20":
-                # Neural & Cognitive Tools
-                print("\n[Neural/Cognitive] Optionen:\n1. Pattern Recognize\n2. Learning Adapt\n3. Compress Model\n4. Ensemble Create\n5. Transfer Learn\n6. Explain Model\n7. Train Model\n8. Predict with Model\n9. Cognitive Analyze")
-                sub = input("Wählen Sie (1-9): ").strip()
-                if sub == "1":
-                    pattern = input("Mustername: ").strip()
-                    input_file = input("Eingabedatei (optional): ").strip() or None
-                    self.pm.cli.pattern_recognize(pattern, input_file)
-                elif sub == "2":
-                    model = input("Modellname: ").strip()
-                    data_file = input("Datenquelle (optional): ").strip() or None
-                    self.pm.cli.learning_adapt(model, data_file)
-                elif sub == "3":
-                    model = input("Modellname: ").strip()
-                    output = input("Ausgabedatei (optional): ").strip() or None
-                    self.pm.cli.neural_compress(model, output)
-                elif sub == "4":
-                    models = input("Modelle (kommagetrennt): ").strip()
-                    output_model = input("Name des Ensemble‑Modells: ").strip()
-                    self.pm.cli.ensemble_create(models, output_model)
-                elif sub == "5":
-                    base = input("Basismodell: ").strip()
-                    new_data = input("Neue Daten: ").strip()
-                    self.pm.cli.transfer_learn(base, new_data)
-                elif sub == "6":
-                    model = input("Modellname: ").strip()
-                    input_file = input("Eingabedatei: ").strip()
-                    self.pm.cli.neural_explain(model, input_file)
-                elif sub == "7":
-                    pattern = input("Trainingsmuster/Name: ").strip()
-                    try:
-                        epochs = int(input("Anzahl der Epochen (Standard 50): ").strip() or "50")
-                    except Exception:
-                        epochs = 50
-                    data_file = input("Datenquelle (optional): ").strip() or None
-                    self.pm.cli.neural_train(pattern, epochs, data_file)
-                elif sub == "8":
-                    model = input("Modellname: ").strip()
-                    input_file = input("Eingabedatei: ").strip()
-                    self.pm.cli.neural_predict(model, input_file)
-                elif sub == "9":
-                    behaviour = input("Verhalten/Beschreibung für die Analyse: ").strip()
-                    self.pm.cli.cognitive_analyze(behaviour)
-                else:
-                    print("Ungültige Auswahl.")
-            elif choice == "21":
-                # Workflow & Automation Tools
-                print("\n[Workflow] Optionen:\n1. Workflow erstellen\n2. Workflow ausführen\n3. Workflow exportieren\n4. Pipeline erstellen\n5. Scheduler verwalten\n6. Trigger einrichten\n7. Batch Process\n8. Parallel Execute")
-                sub = input("Wählen Sie (1-8): ").strip()
-                if sub == "1":
-                    name = input("Workflow‑Name: ").strip()
-                    parallel = input("Parallele Ausführung? (j/n): ").strip().lower() == "j"
-                    self.pm.cli.workflow_create(name, parallel)
-                elif sub == "2":
-                    name = input("Workflow‑Name: ").strip()
-                    self.pm.cli.workflow_execute(name)
-                elif sub == "3":
-                    name = input("Workflow‑Name: ").strip()
-                    out = input("Ausgabedatei: ").strip() or "workflow.json"
-                    self.pm.cli.workflow_export(name, out)
-                elif sub == "4":
-                    config = input("Konfigurationsdatei: ").strip()
-                    self.pm.cli.pipeline_create(config)
-                elif sub == "5":
-                    schedule = input("Schedulername: ").strip()
-                    action = input("Aktion (start, stop, status): ").strip()
-                    self.pm.cli.scheduler_manage(schedule, action)
-                elif sub == "6":
-                    trig_name = input("Triggername: ").strip()
-                    target = input("Zielname oder Datei: ").strip()
-                    self.pm.cli.trigger_setup(trig_name, target)
-                elif sub == "7":
-                    items = input("Items (kommagetrennt): ").strip()
-                    concurrent = input("Parallel? (j/n): ").strip().lower() == "j"
-                    self.pm.cli.batch_process(items, concurrent)
-                elif sub == "8":
-                    tasks = input("Tasks (kommagetrennt): ").strip()
-                    self.pm.cli.parallel_execute(tasks)
-                else:
-                    print("Ungültige Auswahl.")
-            elif choice == "22":
-                # Speicher-Operationen
-                print("\n[Memory] Optionen:\n1. Compress\n2. Sync\n3. Analytics\n4. Usage\n5. Persist\n6. Namespace wechseln\n7. Search\n8. Export\n9. Import\n10. Store")
-                sub = input("Wählen Sie (1-10): ").strip()
-                if sub == "1":
-                    self.pm.cli.memory_compress()
-                elif sub == "2":
-                    self.pm.cli.memory_sync()
-                elif sub == "3":
-                    self.pm.cli.memory_analytics()
-                elif sub == "4":
-                    self.pm.cli.memory_usage()
-                elif sub == "5":
-                    self.pm.cli.memory_persist()
-                elif sub == "6":
-                    ns = input("Neuer Namespace: ").strip()
-                    self.pm.cli.memory_namespace(ns)
-                elif sub == "7":
-                    term = input("Suchbegriff: ").strip()
-                    ns = input("Namespace (optional): ").strip() or None
-                    self.pm.cli.memory_search(term, ns)
-                elif sub == "8":
-                    outfile = input("Name der Exportdatei: ").strip() or "memory_export.json"
-                    ns = input("Namespace (optional): ").strip() or None
-                    self.pm.cli.memory_export(outfile, ns)
-                elif sub == "9":
-                    infile = input("Datei für Import: ").strip() or "memory_export.json"
-                    ns = input("Namespace (optional): ").strip() or None
-                    self.pm.cli.memory_import(infile, ns)
-                elif sub == "10":
-                    key = input("Schlüssel: ").strip()
-                    value = input("Wert: ").strip()
-                    ns = input("Namespace (optional): ").strip() or None
-                    self.pm.cli.memory_store(key, value, ns)
-                else:
-                    print("Ungültige Auswahl.")
-            elif choice == "23":
-                # Security & Compliance Tools
-                print("\n[Security/Compliance] Optionen:\n1. GitHub Security Analyse\n2. Repo Architect Optimize\n3. Security Audit Hive\n4. Sicherheitsmetriken & Audit")
-                sub = input("Wählen Sie (1-4): ").strip()
-                if sub == "1":
-                    # Analysiert den Code auf Sicherheitsprobleme
-                    target = input("Zielverzeichnis für Sicherheitsanalyse (z. B. ./src): ").strip() or "./src"
-                    self.pm.cli.github_repo_analyze(analysis_type="security", target=target)
-                elif sub == "2":
-                    # Optimiert die Repo‑Struktur mit Fokus auf Sicherheit und Compliance
-                    security_focus = input("Sicherheitsfokus aktivieren? (j/n): ").strip().lower() == "j"
-                    compliance = input("Compliance‑Standard (z. B. SOC2) oder leer: ").strip() or None
-                    self.pm.cli.github_repo_architect_optimize(security_focus, compliance)
-                elif sub == "3":
-                    # Spawn security audit hive
-                    self.pm.cli.hive_spawn("security audit and compliance review", namespace=None, agents=None, temp=False)
-                elif sub == "4":
-                    # Führt Sicherheitsmetriken und Audit aus
-                    last = input("Zeitraum für Metriken (z. B. last-24h) oder leer: ").strip() or None
-                    self.pm.cli.security_metrics(last)
-                    full_trace = input("Vollständigen Audit‑Trace ausgeben? (j/n): ").strip().lower() == "j"
-                    self.pm.cli.security_audit(full_trace)
-                else:
-                    print("Ungültige Auswahl.")
-            elif choice == "24":
-                # Performance & Benchmark Tools
-                print("\n[Performance] Optionen:\n1. Performance Report\n2. Bottleneck Analyze\n3. Token Usage\n4. Benchmark Run\n5. Metrics Collect\n6. Trend Analysis\n7. Usage Stats\n8. Health Check\n9. Diagnostic Run")
-                sub = input("Wählen Sie (1-9): ").strip()
-                if sub == "1":
-                    self.pm.cli.performance_report()
-                elif sub == "2":
-                    self.pm.cli.bottleneck_analyze()
-                elif sub == "3":
-                    self.pm.cli.token_usage()
-                elif sub == "4":
-                    name = input("Benchmark-Name: ").strip()
-                    self.pm.cli.benchmark_run(name)
-                elif sub == "5":
-                    self.pm.cli.metrics_collect()
-                elif sub == "6":
-                    self.pm.cli.trend_analysis()
-                elif sub == "7":
-                    self.pm.cli.usage_stats()
-                elif sub == "8":
-                    components = input("Komponenten (optional, kommagetrennt) oder leer für alle: ").strip() or None
-                    self.pm.cli.health_check(components)
-                elif sub == "9":
-                    self.pm.cli.diagnostic_run()
-                else:
-                    print("Ungültige Auswahl.")
-            elif choice == "25":
-                # GitHub Tools
-                print("\n[GitHub] Optionen:\n1. Repo Analyze\n2. PR Manage\n3. Issue Track\n4. Release Coord\n5. Workflow Auto\n6. Code Review\n7. Sync Coordinator")
-                sub = input("Wählen Sie (1-7): ").strip()
-                if sub == "1":
-                    analysis = input("Analyseart (z. B. security, performance) oder leer: ").strip() or None
-                    target = input("Ziel (Dateipfad oder Repo) oder leer: ").strip() or None
-                    self.pm.cli.github_repo_analyze(analysis, target)
-                elif sub == "2":
-                    reviewers = input("Reviewer (kommagetrennt) oder leer: ").strip() or None
-                    ai_pow = input("AI-unterstützt? (j/n): ").strip().lower() == "j"
-                    self.pm.cli.github_pr_manage(reviewers, ai_pow)
-                elif sub == "3":
-                    proj = input("Projektname für Issue-Tracking: ").strip() or None
-                    self.pm.cli.github_issue_track(proj)
-                elif sub == "4":
-                    version = input("Versionsnummer (z. B. 1.0.0): ").strip() or "1.0.0"
-                    auto_changelog = input("Auto-Changelog erstellen? (j/n): ").strip().lower() == "j"
-                    self.pm.cli.github_release_coord(version, auto_changelog)
-                elif sub == "5":
-                    file = input("Workflow-Datei: ").strip()
-                    self.pm.cli.github_workflow_auto(file)
-                elif sub == "6":
-                    multi = input("Mehrere Reviewer? (j/n): ").strip().lower() == "j"
-                    ai_pow = input("AI-unterstützt? (j/n): ").strip().lower() == "j"
-                    self.pm.cli.github_code_review(multi, ai_pow)
-                elif sub == "7":
-                    multi_pkg = input("Multi-Package sync? (j/n): ").strip().lower() == "j"
-                    self.pm.cli.github_sync_coordinator(multi_pkg)
-                else:
-                    print("Ungültige Auswahl.")
-            elif choice == "26":
-                # System Tools
-                print("\n[System] Optionen:\n1. Config Manage\n2. Features Detect\n3. Log Analysis")
-                sub = input("Wählen Sie (1-3): ").strip()
-                if sub == "1":
-                    operation = input("Operation (read, write, delete): ").strip()
-                    file = input("Datei (optional): ").strip() or None
-                    self.pm.cli.config_manage(operation, file)
-                elif sub == "2":
-                    self.pm.cli.features_detect()
-                elif sub == "3":
-                    log_file = input("Log-Dateipfad: ").strip()
-                    self.pm.cli.log_analysis(log_file)
-                else:
-                    print("Ungültige Auswahl.")
-            elif choice == "27":
-                # Concurrency guidelines
-                self.show_concurrency_guidelines()
-            elif choice == "28":
-                # Swarm‑Orchestrierungswerkzeuge
-                self.swarm_tools_menu()
-            elif choice == "29":
-                # SPARC Batch & Concurrent Tools
-                self.sparc_batch_menu()
-            elif choice == "30":
-                # Spezialisierte Swarm‑Muster
-                self.specialized_patterns_menu()
-            elif choice == "31":
-                # Schnellbefehle & Historie
-                self.manage_quick_commands()
-            elif choice == "32":
-                # Rollback & Recovery
-                self.rollback_recovery_menu()
-            elif choice == "33":
-                # Befehls-Palette
-                self.command_palette()
-            elif choice == "34":
+            sys.stdout.write(_MAIN_MENU_BANNER)
+            sys.stdout.flush()
+            choice = _ask("Bitte wählen Sie eine Option (1-34): ").strip()
+            idx = _menu_index(choice)
+            handler = dispatch[idx] if 0 < idx < len(dispatch) else None
+            if handler is _EXIT:
                 print("Beende Project Manager Menü.")
                 break
+            if handler is not None:
+                handler()
             else:
                 print("Ungültige Auswahl. Bitte erneut versuchen.")
 
+    # ------------------------------------------------------------------
+    # Hauptmenüpunkte 1–24 (siehe _dispatch)
+
+    def _menu_new_project(self) -> None:
+        idea = _ask("Bitte beschreiben Sie das Programm, das Sie entwickeln möchten: ").strip()
+        tmpl = _ask("Optionales Template (Agile, DDD, HighPerformance, CICD, WebApp, CLI-Tool, DataPipeline, Microservices) oder leer: ").strip() or None
+        self.pm.create_project(idea, template=tmpl)
+
+    def _menu_monitor_session(self) -> None:
+        session_id = _ask("Bitte geben Sie die Session‑ID ein, die überwacht werden soll: ").strip()
+        self.pm.monitor_and_self_heal(session_id)
+
+    @cached_property
+    def _monitor(self) -> "MonitoringDashboard":
+        # Zustandslos – eine Instanz genügt für alle Menübesuche
+        return MonitoringDashboard(self.pm.cli)
+
+    @cached_property
+    def _queen_chat(self) -> "QueenChat":
+        return QueenChat(self.pm.cli)
+
+    def _menu_monitoring(self) -> None:
+        self._monitor.show()
+
+    def _menu_queen_chat(self) -> None:
+        session_id = _ask("Bitte geben Sie die Session‑ID für den Chat ein: ").strip()
+        self._queen_chat.start_chat(session_id)
+
+    def _menu_self_heal(self) -> None:
+        # Selbstheilung & Optimierung
+        cli = self.pm.cli
+        print("\n[Self-Healing] Starte automatische Heilung und Optimierung …")
+        cli.health_auto_heal()
+        cli.fault_tolerance_retry()
+        cli.bottleneck_auto_optimize()
+
+    def _menu_sparc_neural(self) -> None:
+        # Erweiterte SPARC- und Neural‑Funktionen
+        cli = self.pm.cli
+        print("\n[SPARC] Führe Neural‑TDD und vollständigen SPARC‑Workflow mit AI- und Memory‑Optimierungen aus …")
+        cli.sparc_mode("neural-tdd", auto_learn=True)
+        cli.sparc_workflow_all(ai_guided=True, memory_enhanced=True)
+
+    def _menu_metrics(self) -> None:
+        # Metriken & Speicher
+        print("\n[Metrics] Sammle Speicher‑ und Leistungsstatistiken …")
+        self.pm.cli.metrics_collect_full()
+
+    def _menu_security_audit(self) -> None:
+        # Sicherheits‑Audit
+        print("\n[Security] Führe Sicherheitscheck, Audit und Compliance durch …")
+        self.pm.cli.security_scan_full()
+
+    def _menu_dev_swarm(self) -> None:
+        # Vollständiger Entwicklungs‑Swarm
+        description = _ask("Beschreibung des Projekts für den Entwicklungs‑Swarm: ").strip()
+        try:
+            agents = int(_ask("Anzahl der Agenten (Standard 10): ").strip() or "10")
+        except Exception:
+            agents = 10
+        self.pm.cli.deploy_full_development_swarm(description or "Full development swarm", agents=agents)
+
+    def _menu_research_swarm(self) -> None:
+        # Forschungs- & Analyse‑Swarm starten
+        description = _ask("Beschreibung des Forschungsthemas: ").strip() or "Research topic"
+        # Standardmäßig zwei Agents: researcher und analyst
+        self.pm.cli.hive_spawn(f"Research {description}", namespace=None, agents="researcher,analyst", temp=False)
+        print("[Research] Forschungs‑Hive gestartet.")
+
+    def _menu_hooks(self) -> None:
+        # Hooks & Fix Hook Variables
+        cli = self.pm.cli
+        sys.stdout.write(_HOOKS_BANNER)
+        sys.stdout.flush()
+        sub = _ask("Bitte wählen Sie: ").strip()
+        idx = _menu_index(sub)
+        if 1 <= idx <= len(_HOOK_NAMES):
+            hook_name = _HOOK_NAMES[idx - 1]
+            params_input = _ask("Zusätzliche Parameter (leer lassen, wenn keine): ").strip()
+            cli.hook(hook_name, params_input.split() if params_input else _NO_PARAMS)
+        elif idx == 12:
+            target_file = _ask("Dateipfad für fix-hook-variables (leer für automatische Suche): ").strip() or None
+            test_flag = _yn("Testlauf durchführen? (j/n): ")
+            cli.fix_hook_variables(target=target_file, test=test_flag)
+        else:
+            _invalid()
+
+    def _menu_backup(self) -> None:
+        # Backup & Restore
+        cli = self.pm.cli
+        sys.stdout.write(_BACKUP_BANNER)
+        sys.stdout.flush()
+        br_choice = _ask("Ihre Wahl: ").strip()
+        if br_choice == "1":
+            outfile = _ask("Name der Backup-Datei: ").strip() or "backup.json"
+            cli.backup_create(outfile)
+        elif br_choice == "2":
+            infile = _ask("Name der Restore-Datei: ").strip() or "backup.json"
+            cli.restore_system(infile)
+        else:
+            _invalid()
+
+    def _menu_daa_agent(self) -> None:
+        # DAA-Agent erstellen
+        agent_type = _ask("Agententyp (z. B. specialized-researcher): ").strip()
+        capabilities = _ask("Fähigkeiten als JSON-Liste (z. B. ['analysis','pattern-recognition']): ").strip() or "[]"
+        resources = _ask("Ressourcen als JSON (z. B. {'memory': 2048,'compute': 'high'}): ").strip() or "{}"
+        security_level = _ask("Sicherheitsstufe (z. B. high) oder leer: ").strip() or None
+        sandbox = _yn("Sandbox aktivieren? (j/n): ")
+        self.pm.cli.daa_agent_create(agent_type, capabilities, resources, security_level if security_level else None, sandbox=sandbox)
+
+    def _menu_hive_wizard(self) -> None:
+        # Hive-Mind Wizard & spezialisiertes Spawn
+        cli = self.pm.cli
+        print("\n[Hive-Mind Wizard] Starte interaktiven Claude-Flow Wizard …")
+        cli._run(["hive-mind", "wizard"])
+        # Optional: spezialisiertes Spawn
+        if _yn("Möchten Sie einen weiteren Hive spawnen? (j/n): "):
+            desc = _ask("Beschreibung für den Hive: ").strip()
+            ns = _ask("Namespace (leer lassen für keinen): ").strip() or None
+            agent_input = _ask("Agenten (Zahl oder kommagetrennte Liste): ").strip() or None
+            agents_param = None
+            if agent_input:
+                agents_param = agent_input
+            cli.hive_spawn(desc, namespace=ns, agents=agents_param, temp=False)
+
+    def _menu_daa(self) -> None:
+        # Agent Lifecycle & Capability Match sowie weitere DAA‑Funktionen
+        cli = self.pm.cli
+        sys.stdout.write(_DAA_BANNER)
+        sys.stdout.flush()
+        sub = _ask("Wählen Sie (1-5): ").strip()
+        if sub == "1":
+            req = _ask("Geben Sie die Task‑Anforderungen als JSON‑Liste ein (z. B. ['security-analysis','performance-optimization']): ").strip() or "[]"
+            cli.daa_capability_match(req)
+        elif sub == "2":
+            agent_id = _ask("Agent‑ID: ").strip()
+            action = _ask("Aktion (z. B. scale-up, scale-down, pause): ").strip()
+            cli.daa_lifecycle_manage(agent_id, action)
+        elif sub == "3":
+            agent_id = _ask("Agent‑ID: ").strip()
+            cpu = _ask("CPU‑Limit (z. B. 50%): ").strip()
+            memory = _ask("Memory‑Limit (z. B. 2GB): ").strip()
+            cli.daa_resource_alloc(agent_id, cpu, memory)
+        elif sub == "4":
+            src = _ask("Quelle (Agent‑ID oder Name): ").strip()
+            tgt = _ask("Ziel (Agent‑ID oder Name): ").strip()
+            msg = _ask("Nachricht: ").strip()
+            cli.daa_communication(src, tgt, msg)
+        elif sub == "5":
+            proposal = _ask("Consensus‑Vorschlag: ").strip()
+            cli.daa_consensus(proposal)
+        else:
+            _invalid()
+
+    def _menu_neural(self) -> None:
+        # Neural & Cognitive Tools
+        cli = self.pm.cli
+        sys.stdout.write(_NEURAL_BANNER)
+        sys.stdout.flush()
+        sub = _ask("Wählen Sie (1-9): ").strip()
+        if sub == "1":
+            pattern = _ask("Mustername: ").strip()
+            input_file = _ask("Eingabedatei (optional): ").strip() or None
+            cli.pattern_recognize(pattern, input_file)
+        elif sub == "2":
+            model = _ask("Modellname: ").strip()
+            data_file = _ask("Datenquelle (optional): ").strip() or None
+            cli.learning_adapt(model, data_file)
+        elif sub == "3":
+            model = _ask("Modellname: ").strip()
+            output = _ask("Ausgabedatei (optional): ").strip() or None
+            cli.neural_compress(model, output)
+        elif sub == "4":
+            models = _ask("Modelle (kommagetrennt): ").strip()
+            output_model = _ask("Name des Ensemble‑Modells: ").strip()
+            cli.ensemble_create(models, output_model)
+        elif sub == "5":
+            base = _ask("Basismodell: ").strip()
+            new_data = _ask("Neue Daten: ").strip()
+            cli.transfer_learn(base, new_data)
+        elif sub == "6":
+            model = _ask("Modellname: ").strip()
+            input_file = _ask("Eingabedatei: ").strip()
+            cli.neural_explain(model, input_file)
+        elif sub == "7":
+            pattern = _ask("Trainingsmuster/Name: ").strip()
+            try:
+                epochs = int(_ask("Anzahl der Epochen (Standard 50): ").strip() or "50")
+            except Exception:
+                epochs = 50
+            data_file = _ask("Datenquelle (optional): ").strip() or None
+            cli.neural_train(pattern, epochs, data_file)
+        elif sub == "8":
+            model = _ask("Modellname: ").strip()
+            input_file = _ask("Eingabedatei: ").strip()
+            cli.neural_predict(model, input_file)
+        elif sub == "9":
+            behaviour = _ask("Verhalten/Beschreibung für die Analyse: ").strip()
+            cli.cognitive_analyze(behaviour)
+        else:
+            _invalid()
+
+    def _menu_workflow(self) -> None:
+        # Workflow & Automation Tools
+        cli = self.pm.cli
+        sys.stdout.write(_WORKFLOW_BANNER)
+        sys.stdout.flush()
+        sub = _ask("Wählen Sie (1-8): ").strip()
+        if sub == "1":
+            name = _ask("Workflow‑Name: ").strip()
+            parallel = _yn("Parallele Ausführung? (j/n): ")
+            cli.workflow_create(name, parallel)
+        elif sub == "2":
+            name = _ask("Workflow‑Name: ").strip()
+            cli.workflow_execute(name)
+        elif sub == "3":
+            name = _ask("Workflow‑Name: ").strip()
+            out = _ask("Ausgabedatei: ").strip() or "workflow.json"
+            cli.workflow_export(name, out)
+        elif sub == "4":
+            config = _ask("Konfigurationsdatei: ").strip()
+            cli.pipeline_create(config)
+        elif sub == "5":
+            schedule = _ask("Schedulername: ").strip()
+            action = _ask("Aktion (start, stop, status): ").strip()
+            cli.scheduler_manage(schedule, action)
+        elif sub == "6":
+            trig_name = _ask("Triggername: ").strip()
+            target = _ask("Zielname oder Datei: ").strip()
+            cli.trigger_setup(trig_name, target)
+        elif sub == "7":
+            items = _ask("Items (kommagetrennt): ").strip()
+            concurrent = _yn("Parallel? (j/n): ")
+            cli.batch_process(items, concurrent)
+        elif sub == "8":
+            tasks = _ask("Tasks (kommagetrennt): ").strip()
+            cli.parallel_execute(tasks)
+        else:
+            _invalid()
+
+    def _menu_memory(self) -> None:
+        # Speicher-Operationen
+        sys.stdout.write(_MEMORY_BANNER)
+        sys.stdout.flush()
+        sub = _ask("Wählen Sie (1-10): ").strip()
+        cli = self.pm.cli
+        # Optionen ohne Rückfragen direkt per Tabelle
+        simple = {
+            "1": cli.memory_compress,
+            "2": cli.memory_sync,
+            "3": cli.memory_analytics,
+            "4": cli.memory_usage,
+            "5": cli.memory_persist,
+        }.get(sub)
+        if simple is not None:
+            simple()
+        elif sub == "6":
+            ns = _ask("Neuer Namespace: ").strip()
+            cli.memory_namespace(ns)
+        elif sub == "7":
+            term = _ask("Suchbegriff: ").strip()
+            ns = _ask("Namespace (optional): ").strip() or None
+            cli.memory_search(term, ns)
+        elif sub == "8":
+            outfile = _ask("Name der Exportdatei: ").strip() or "memory_export.json"
+            ns = _ask("Namespace (optional): ").strip() or None
+            cli.memory_export(outfile, ns)
+        elif sub == "9":
+            infile = _ask("Datei für Import: ").strip() or "memory_export.json"
+            ns = _ask("Namespace (optional): ").strip() or None
+            cli.memory_import(infile, ns)
+        elif sub == "10":
+            key = _ask("Schlüssel: ").strip()
+            value = _ask("Wert: ").strip()
+            ns = _ask("Namespace (optional): ").strip() or None
+            cli.memory_store(key, value, ns)
+        else:
+            _invalid()
+
+    def _menu_security(self) -> None:
+        # Security & Compliance Tools
+        cli = self.pm.cli
+        sys.stdout.write(_SECURITY_BANNER)
+        sys.stdout.flush()
+        sub = _ask("Wählen Sie (1-4): ").strip()
+        if sub == "1":
+            # Analysiert den Code auf Sicherheitsprobleme
+            target = _ask("Zielverzeichnis für Sicherheitsanalyse (z. B. ./src): ").strip() or "./src"
+            cli.github_repo_analyze(analysis_type="security", target=target)
+        elif sub == "2":
+            # Optimiert die Repo‑Struktur mit Fokus auf Sicherheit und Compliance
+            security_focus = _yn("Sicherheitsfokus aktivieren? (j/n): ")
+            compliance = _ask("Compliance‑Standard (z. B. SOC2) oder leer: ").strip() or None
+            cli.github_repo_architect_optimize(security_focus, compliance)
+        elif sub == "3":
+            # Spawn security audit hive
+            cli.hive_spawn("security audit and compliance review", namespace=None, agents=None, temp=False)
+        elif sub == "4":
+            # Führt Sicherheitsmetriken und Audit aus
+            last = _ask("Zeitraum für Metriken (z. B. last-24h) oder leer: ").strip() or None
+            cli.security_metrics(last)
+            full_trace = _yn("Vollständigen Audit‑Trace ausgeben? (j/n): ")
+            cli.security_audit(full_trace)
+        else:
+            _invalid()
+
+    def _menu_performance(self) -> None:
+        # Performance & Benchmark Tools
+        sys.stdout.write(_PERFORMANCE_BANNER)
+        sys.stdout.flush()
+        sub = _ask("Wählen Sie (1-9): ").strip()
+        cli = self.pm.cli
+        # Optionen ohne Rückfragen direkt per Tabelle
+        simple = {
+            "1": cli.performance_report,
+            "2": cli.bottleneck_analyze,
+            "3": cli.token_usage,
+            "5": cli.metrics_collect,
+            "6": cli.trend_analysis,
+            "7": cli.usage_stats,
+            "9": cli.diagnostic_run,
+        }.get(sub)
+        if simple is not None:
+            simple()
+        elif sub == "4":
+            name = _ask("Benchmark-Name: ").strip()
+            cli.benchmark_run(name)
+        elif sub == "8":
+            components = _ask("Komponenten (optional, kommagetrennt) oder leer für alle: ").strip() or None
+            cli.health_check(components)
+        else:
+            _invalid()
+
+    def _menu_github(self) -> None:
+        """Untermenü mit den GitHub‑Werkzeugen (Hauptmenüpunkt 25)."""
+        cli = self.pm.cli
+        sys.stdout.write(_GITHUB_BANNER)
+        sys.stdout.flush()
+        sub = _ask("Wählen Sie (1-7): ").strip()
+        if sub == "1":
+            analysis = _ask("Analyseart (z. B. security, performance) oder leer: ").strip() or None
+            target = _ask("Ziel (Dateipfad oder Repo) oder leer: ").strip() or None
+            cli.github_repo_analyze(analysis, target)
+        elif sub == "2":
+            reviewers = _ask("Reviewer (kommagetrennt) oder leer: ").strip() or None
+            ai_pow = _yn("AI-unterstützt? (j/n): ")
+            cli.github_pr_manage(reviewers, ai_pow)
+        elif sub == "3":
+            proj = _ask("Projektname für Issue-Tracking: ").strip() or None
+            cli.github_issue_track(proj)
+        elif sub == "4":
+            version = _ask("Versionsnummer (z. B. 1.0.0): ").strip() or "1.0.0"
+            auto_changelog = _yn("Auto-Changelog erstellen? (j/n): ")
+            cli.github_release_coord(version, auto_changelog)
+        elif sub == "5":
+            file = _ask("Workflow-Datei: ").strip()
+            cli.github_workflow_auto(file)
+        elif sub == "6":
+            multi = _yn("Mehrere Reviewer? (j/n): ")
+            ai_pow = _yn("AI-unterstützt? (j/n): ")
+            cli.github_code_review(multi, ai_pow)
+        elif sub == "7":
+            multi_pkg = _yn("Multi-Package sync? (j/n): ")
+            cli.github_sync_coordinator(multi_pkg)
+        else:
+            _invalid()
+
+    def _menu_system(self) -> None:
+        """Untermenü mit den System‑Werkzeugen (Hauptmenüpunkt 26)."""
+        cli = self.pm.cli
+        sys.stdout.write(_SYSTEM_TOOLS_BANNER)
+        sys.stdout.flush()
+        sub = _ask("Wählen Sie (1-3): ").strip()
+        if sub == "1":
+            operation = _ask("Operation (read, write, delete): ").strip()
+            file = _ask("Datei (optional): ").strip() or None
+            cli.config_manage(operation, file)
+        elif sub == "2":
+            cli.features_detect()
+        elif sub == "3":
+            log_file = _ask("Log-Dateipfad: ").strip()
+            cli.log_analysis(log_file)
+        else:
+            _invalid()
+
     def show_concurrency_guidelines(self) -> None:
         """
         Gibt Hinweise zur "Goldenen Regel" der Concurrency aus dem Dokument
@@ -600,13 +920,8 @@ class ProjectManagerMenu:
         kombiniert werden können. Sie dient lediglich der Information
         und führt keine Befehle aus.
         """
-        print("\n[Concurrency] Goldene Regel der SPARC‑Entwicklung:")
-        print("- Fasse alle zusammengehörigen Operationen in einer einzigen Nachricht zusammen.")
-        print("  Dazu zählen TodoWrite‑Aufgaben, File‑Operations, Memory‑Calls und Shell‑Kommandos.")
-        print("- Vermeide es, einzelne Schritte über mehrere Nachrichten zu verteilen, da dies die\n  Performance reduziert.")
-        print("- Beispiel (korrekt): Erstelle mehrere Dateien und pushe sie in einem einzigen SPARC‑Run.")
-        print("- Beispiel (falsch): Sende erst eine Datei, warte auf Antwort, sende dann die nächste.")
-        print("Diese Guidelines sind im offiziellen Claude‑Flow‑Handbuch dokumentiert【942476186100460†L0-L17】.\n")
+        sys.stdout.write(_CONCURRENCY_TEXT)
+        sys.stdout.flush()
 
     def configure_tokens(self) -> None:
         """
@@ -615,9 +930,9 @@ class ProjectManagerMenu:
         werden in os.environ gesetzt und in einer .env‑Datei gespeichert.
         """
         print("\n[Konfiguration] Bitte geben Sie die folgenden Werte ein (leer lassen zum Überspringen):")
-        git_token = input("GitHub‑Token (GIT_TOKEN): ").strip()
-        openrouter_token = input("OpenRouter‑Token (OPENROUTER_TOKEN): ").strip()
-        openrouter_model = input(f"OpenRouter‑Modell (OPENROUTER_MODEL) [aktuell {os.environ.get('OPENROUTER_MODEL', 'qwen/qwen3-coder:free')}]: ").strip()
+        git_token = _ask("GitHub‑Token (GIT_TOKEN): ").strip()
+        openrouter_token = _ask("OpenRouter‑Token (OPENROUTER_TOKEN): ").strip()
+        openrouter_model = _ask(f"OpenRouter‑Modell (OPENROUTER_MODEL) [aktuell {os.environ.get('OPENROUTER_MODEL', 'qwen/qwen3-coder:free')}]: ").strip()
         # Setze Umgebungsvariablen, wenn Werte angegeben wurden
         if git_token:
             os.environ["GIT_TOKEN"] = git_token
@@ -625,14 +940,9 @@ class ProjectManagerMenu:
             os.environ["OPENROUTER_TOKEN"] = openrouter_token
         if openrouter_model:
             os.environ["OPENROUTER_MODEL"] = openrouter_model
-        # Schreibe in .env
-        with open(".env", "w", encoding="utf-8") as f:
-            if os.environ.get("GIT_TOKEN"):
-                f.write(f"GIT_TOKEN={os.environ['GIT_TOKEN']}\n")
-            if os.environ.get("OPENROUTER_TOKEN"):
-                f.write(f"OPENROUTER_TOKEN={os.environ['OPENROUTER_TOKEN']}\n")
-            if os.environ.get("OPENROUTER_MODEL"):
-                f.write(f"OPENROUTER_MODEL={os.environ['OPENROUTER_MODEL']}\n")
+        self.pm.refresh_openrouter_settings()
+        # Schreibe atomar in .env
+        SetupManager.write_env_file(SetupManager.env_tokens_content())
         print("[Konfiguration] Tokens und Modell wurden gespeichert.")
 
     def show_logs(self) -> None:
@@ -640,17 +950,16 @@ class ProjectManagerMenu:
         Zeigt die letzten Zeilen der wichtigsten Logdatei an. Standardmäßig wird
         flow_autogen.log im aktuellen Arbeitsverzeichnis verwendet, falls vorhanden.
         """
-        log_file = Path("flow_autogen.log")
-        if not log_file.exists():
+        try:
+            size = _LOG_PATH.stat().st_size
+        except FileNotFoundError:
             print("[Logs] Keine Logdatei 'flow_autogen.log' gefunden.")
             return
         try:
-            with log_file.open("r", encoding="utf-8", errors="ignore") as f:
-                lines = f.readlines()
-                tail = lines[-20:] if len(lines) > 20 else lines
-                print("\n[Logs] Letzte Zeilen von flow_autogen.log:\n")
-                for line in tail:
-                    print(line.rstrip())
+            tail = _tail_lines(_LOG_PATH, 20) if size else []
+            print("\n[Logs] Letzte Zeilen von flow_autogen.log:\n")
+            for line in tail:
+                print(line.rstrip())
         except Exception as e:
             print(f"[Logs] Fehler beim Lesen der Logdatei: {e}")
 
@@ -661,22 +970,15 @@ class ProjectManagerMenu:
         anschließend die Projekterstellung.
         """
         print("\n[Wizard] Willkommen zum Projekt‑Assistenten! Beantworten Sie die folgenden Fragen.")
-        idea = input("1) Was soll die Anwendung machen? Beschreiben Sie die Idee in einem Satz: ").strip()
-        print("2) Wählen Sie ein Template:")
-        templates = ["Agile", "DDD", "HighPerformance", "CICD", "WebApp", "CLI-Tool", "DataPipeline", "Microservices", "Keines"]
-        for idx, t in enumerate(templates, 1):
-            print(f"  {idx}. {t}")
-        tmpl_choice = input("Bitte Auswahl (1-{len(templates)}): ").strip()
-        selected_template = None
-        try:
-            idx = int(tmpl_choice)
-            if 1 <= idx <= len(templates) and templates[idx - 1].lower() != "keines":
-                selected_template = templates[idx - 1]
-        except Exception:
-            pass
-        model = input(f"3) Welches OpenRouter‑Modell möchten Sie verwenden? [Aktuell {os.environ.get('OPENROUTER_MODEL', 'qwen/qwen3-coder:free')}]: ").strip()
+        idea = _ask("1) Was soll die Anwendung machen? Beschreiben Sie die Idee in einem Satz: ").strip()
+        sys.stdout.write(_WIZARD_TEMPLATE_MENU)
+        idx = _menu_index(_ask(_WIZARD_TEMPLATE_PROMPT).strip())
+        # Der letzte Menüpunkt („Keines“) liegt außerhalb von _WIZARD_TEMPLATES
+        selected_template = _WIZARD_TEMPLATES[idx - 1] if 0 < idx <= len(_WIZARD_TEMPLATES) else None
+        model = _ask(f"3) Welches OpenRouter‑Modell möchten Sie verwenden? [Aktuell {os.environ.get('OPENROUTER_MODEL', 'qwen/qwen3-coder:free')}]: ").strip()
         if model:
             os.environ["OPENROUTER_MODEL"] = model
+            self.pm.refresh_openrouter_settings()
         self.pm.create_project(idea, template=selected_template)
 
     def run_simple_menu(self) -> None:
@@ -687,43 +989,38 @@ class ProjectManagerMenu:
         richtet sich an unerfahrene Anwender, die nicht das komplette
         Funktionsspektrum benötigen.
         """
+        actions = {
+            "1": self._simple_new_project,
+            "2": self.list_projects,
+            "3": self._menu_monitor_session,
+            "4": self.show_logs,
+            "5": self.configure_tokens,
+            "6": self.start_wizard,
+        }
         while True:
-            print("\n--- Einfaches Menü ---")
-            print("1. Neues Projekt erstellen")
-            print("2. Projekte auflisten")
-            print("3. Session überwachen & selbst heilen")
-            print("4. Logs anzeigen")
-            print("5. Konfiguration (API‑Tokens & Modell)")
-            print("6. Wizard für Einsteiger")
-            print("7. Beenden")
-            choice = input("Bitte wählen Sie eine Option (1-7): ").strip()
-            if choice == "1":
-                idea = input("Bitte beschreiben Sie das Programm, das Sie entwickeln möchten: ").strip()
-                tmpl_input = input("Optionales Template (Agile, DDD, HighPerformance, CICD, WebApp, CLI-Tool, DataPipeline, Microservices) oder leer: ").strip() or None
-                # Wenn kein Template angegeben wurde, versuche, eines anhand der Idee abzuleiten
-                if not tmpl_input:
-                    suggestion = self.pm.infer_template(idea)
-                    if suggestion:
-                        use_sugg = input(f"Soll das vorgeschlagene Template '{suggestion}' verwendet werden? (j/n): ").strip().lower() == "j"
-                        if use_sugg:
-                            tmpl_input = suggestion
-                self.pm.create_project(idea, template=tmpl_input)
-            elif choice == "2":
-                self.list_projects()
-            elif choice == "3":
-                session_id = input("Bitte geben Sie die Session‑ID ein, die überwacht werden soll: ").strip()
-                self.pm.monitor_and_self_heal(session_id)
-            elif choice == "4":
-                self.show_logs()
-            elif choice == "5":
-                self.configure_tokens()
-            elif choice == "6":
-                self.start_wizard()
+            sys.stdout.write(_SIMPLE_MENU_BANNER)
+            sys.stdout.flush()
+            choice = _ask("Bitte wählen Sie eine Option (1-7): ").strip()
+            action = actions.get(choice)
+            if action is not None:
+                action()
             elif choice == "7":
                 print("Beende Einfaches Menü.")
                 break
             else:
-                print("Ungültige Auswahl.")
+                _invalid()
+
+    def _simple_new_project(self) -> None:
+        idea = _ask("Bitte beschreiben Sie das Programm, das Sie entwickeln möchten: ").strip()
+        tmpl_input = _ask("Optionales Template (Agile, DDD, HighPerformance, CICD, WebApp, CLI-Tool, DataPipeline, Microservices) oder leer: ").strip() or None
+        # Wenn kein Template angegeben wurde, versuche, eines anhand der Idee abzuleiten
+        if not tmpl_input:
+            suggestion = self.pm.infer_template(idea)
+            if suggestion:
+                use_sugg = _yn(f"Soll das vorgeschlagene Template '{suggestion}' verwendet werden? (j/n): ")
+                if use_sugg:
+                    tmpl_input = suggestion
+        self.pm.create_project(idea, template=tmpl_input)
 
     # Neue Hilfsmenüs für Swarm‑Orchestrierung, SPARC Batch/Concurrent und spezialisierte Muster
 
@@ -734,62 +1031,68 @@ class ProjectManagerMenu:
         Aufgaben orchestrieren, Monitoring aktivieren, Topologien optimieren
         und Schwärme skalieren oder zerstören.
         """
+        cli = self.pm.cli
+        # Punkte ohne Rückfragen werden direkt über die Tabelle aufgerufen
+        actions = {
+            "5": cli.topology_optimize,
+            "6": cli.load_balance,
+            "7": cli.coordination_sync,
+            "9": cli.swarm_destroy,
+        }
         while True:
-            print("\n[Swarm Tools] Optionen:\n1. Swarm init\n2. Agent spawn\n3. Task orchestrate\n4. Swarm monitor\n5. Topology optimize\n6. Load balance\n7. Coordination sync\n8. Swarm scale\n9. Swarm destroy\n0. Zurück")
-            sub = input("Wählen Sie (0-9): ").strip()
-            if sub == "1":
-                desc = input("Beschreibung für den Swarm (optional): ").strip() or None
-                self.pm.cli.swarm_init(desc)
+            sys.stdout.write(_SWARM_TOOLS_BANNER)
+            sys.stdout.flush()
+            sub = _ask("Wählen Sie (0-9): ").strip()
+            action = actions.get(sub)
+            if action is not None:
+                action()
+            elif sub == "1":
+                desc = _ask("Beschreibung für den Swarm (optional): ").strip() or None
+                cli.swarm_init(desc)
             elif sub == "2":
-                agent_type = input("Agententyp: ").strip()
-                capabilities = input("Fähigkeiten als JSON-Liste oder Komma‑Liste: ").strip()
-                resources = input("Ressourcen als JSON (z. B. {'memory': 1024,'compute':'medium'}): ").strip()
-                self.pm.cli.agent_spawn(agent_type, capabilities, resources)
+                agent_type = _ask("Agententyp: ").strip()
+                capabilities = _ask("Fähigkeiten als JSON-Liste oder Komma‑Liste: ").strip()
+                resources = _ask("Ressourcen als JSON (z. B. {'memory': 1024,'compute':'medium'}): ").strip()
+                cli.agent_spawn(agent_type, capabilities, resources)
             elif sub == "3":
-                task_desc = input("Aufgabenbeschreibung: ").strip()
-                self.pm.cli.task_orchestrate(task_desc)
+                task_desc = _ask("Aufgabenbeschreibung: ").strip()
+                cli.task_orchestrate(task_desc)
             elif sub == "4":
-                dashboard = input("Dashboard anzeigen? (j/n): ").strip().lower() == "j"
-                realtime = input("Echtzeit-Monitoring? (j/n): ").strip().lower() == "j"
-                self.pm.cli.swarm_monitor(dashboard, realtime)
-            elif sub == "5":
-                self.pm.cli.topology_optimize()
-            elif sub == "6":
-                self.pm.cli.load_balance()
-            elif sub == "7":
-                self.pm.cli.coordination_sync()
+                dashboard = _yn("Dashboard anzeigen? (j/n): ")
+                realtime = _yn("Echtzeit-Monitoring? (j/n): ")
+                cli.swarm_monitor(dashboard, realtime)
             elif sub == "8":
-                scale = input("Skalierung (z. B. up, down, 2x): ").strip()
-                self.pm.cli.swarm_scale(scale)
-            elif sub == "9":
-                self.pm.cli.swarm_destroy()
+                scale = _ask("Skalierung (z. B. up, down, 2x): ").strip()
+                cli.swarm_scale(scale)
             elif sub == "0":
                 break
             else:
-                print("Ungültige Auswahl.")
+                _invalid()
 
     def sparc_batch_menu(self) -> None:
         """
         Menü für parallele SPARC‑Ausführungen: Batch‑Runs, Pipelines und Concurrent‑Tasks.
         """
+        cli = self.pm.cli
         while True:
-            print("\n[SPARC Batch/Concurrent] Optionen:\n1. SPARC Batch\n2. SPARC Pipeline\n3. SPARC Concurrent\n0. Zurück")
-            sub = input("Wählen Sie (0-3): ").strip()
+            sys.stdout.write(_SPARC_BATCH_BANNER)
+            sys.stdout.flush()
+            sub = _ask("Wählen Sie (0-3): ").strip()
             if sub == "1":
-                modes = input("Modi (kommagetrennt): ").strip()
-                task = input("Aufgabe: ").strip()
-                self.pm.cli.sparc_batch(modes, task)
+                modes = _ask("Modi (kommagetrennt): ").strip()
+                task = _ask("Aufgabe: ").strip()
+                cli.sparc_batch(modes, task)
             elif sub == "2":
-                task = input("Aufgabe für Pipeline: ").strip()
-                self.pm.cli.sparc_pipeline(task)
+                task = _ask("Aufgabe für Pipeline: ").strip()
+                cli.sparc_pipeline(task)
             elif sub == "3":
-                mode = input("Modus: ").strip()
-                tasks_file = input("Pfad zur Datei mit Aufgaben (z. B. tasks.txt): ").strip()
-                self.pm.cli.sparc_concurrent(mode, tasks_file)
+                mode = _ask("Modus: ").strip()
+                tasks_file = _ask("Pfad zur Datei mit Aufgaben (z. B. tasks.txt): ").strip()
+                cli.sparc_concurrent(mode, tasks_file)
             elif sub == "0":
                 break
             else:
-                print("Ungültige Auswahl.")
+                _invalid()
 
     def specialized_patterns_menu(self) -> None:
         """
@@ -799,26 +1102,28 @@ class ProjectManagerMenu:
         Muster wählen. Für benutzerdefinierte Muster können Beschreibung,
         Namespace und Agentenliste frei eingegeben werden.
         """
+        cli = self.pm.cli
         patterns = {
             "1": ("full-stack-development", "full-stack swarm", "architect,coder,tester,devops,planner"),
             "2": ("frontend-development", "front-end swarm", "frontend-developer,designer,tester"),
             "3": ("backend-development", "back-end swarm", "backend-developer,db-admin,security"),
             "4": ("distributed-system", "distributed system swarm", "architect,backend-developer,network-engineer,security,devops,tester"),
         }
-        print("\n[Spezialisierte Muster] Optionen:\n1. Full‑Stack Development\n2. Front‑End Development\n3. Back‑End Development\n4. Distributed System\n5. Benutzerdefiniertes Muster\n0. Zurück")
-        sub = input("Wählen Sie (0-5): ").strip()
+        sys.stdout.write(_PATTERNS_BANNER)
+        sys.stdout.flush()
+        sub = _ask("Wählen Sie (0-5): ").strip()
         if sub in patterns:
             desc, ns, agents = patterns[sub]
-            self.pm.cli.hive_spawn(desc, namespace=ns, agents=agents, temp=False)
+            cli.hive_spawn(desc, namespace=ns, agents=agents, temp=False)
         elif sub == "5":
-            desc = input("Beschreibung des benutzerdefinierten Swarms: ").strip()
-            namespace = input("Namespace (optional): ").strip() or None
-            agents = input("Agentenliste (kommagetrennt) oder Zahl: ").strip() or None
-            self.pm.cli.hive_spawn(desc, namespace=namespace, agents=agents, temp=False)
+            desc = _ask("Beschreibung des benutzerdefinierten Swarms: ").strip()
+            namespace = _ask("Namespace (optional): ").strip() or None
+            agents = _ask("Agentenliste (kommagetrennt) oder Zahl: ").strip() or None
+            cli.hive_spawn(desc, namespace=namespace, agents=agents, temp=False)
         elif sub == "0":
             return
         else:
-            print("Ungültige Auswahl.")
+            _invalid()
 
 
 class MonitoringDashboard:
@@ -841,17 +1146,17 @@ class MonitoringDashboard:
         als Beispiel, da in dieser Umgebung keine echte Session läuft und das
         Format der CLI‑Befehle nicht bekannt ist.
         """
-        sessions = self.cli._run_capture(["hive-mind", "sessions"])
-        status = self.cli._run_capture(["hive-mind", "status"])
-        swarm = self.cli._run_capture(["swarm", "monitor"])
+        # Die drei Abfragen sind unabhängig und starten jeweils einen eigenen
+        # Node‑Prozess; parallel ausgeführt bestimmt nur die langsamste die Wartezeit.
+        with ThreadPoolExecutor(max_workers=len(_MONITOR_QUERIES)) as pool:
+            sessions, status, swarm = pool.map(self.cli._run_capture, _MONITOR_QUERIES)
 
-        print("\n=== Monitoring Dashboard ===")
-        print("-- Sessions --")
-        print(sessions or "(keine)")
-        print("\n-- Status --")
-        print(status or "(keine)")
-        print("\n-- Swarm --")
-        print(swarm or "(keine Daten)")
+        sys.stdout.write(
+            "\n=== Monitoring Dashboard ===\n"
+            f"-- Sessions --\n{sessions or '(keine)'}\n"
+            f"\n-- Status --\n{status or '(keine)'}\n"
+            f"\n-- Swarm --\n{swarm or '(keine Daten)'}\n"
+        )
 
 
 class QueenChat:
@@ -870,7 +1175,7 @@ class QueenChat:
     def start_chat(self, session_id: str) -> None:
         print(f"[Chat] Starte Chat mit Queen für Session {session_id}. Tippen Sie 'exit', um den Chat zu beenden.")
         while True:
-            user_input = input("Sie: ").strip()
+            user_input = _ask("Sie: ").strip()
             if user_input.lower() in {"exit", "quit", "bye"}:
                 print("[Chat] Chat beendet.")
                 break
@@ -1,5 +1,14 @@
-from typing import Dict
+import json
+import socket
+import threading
+from typing import Callable, Dict, List, Optional
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+from flo_log import get_logger
+
+logger = get_logger("openrouter")
 
 
 class OpenRouterClient:
@@ -7,88 +16,248 @@ class OpenRouterClient:
 
     API_URL = "https://openrouter.ai/api/v1/chat/completions"
 
+    # Vorübergehende Fehler (Rate-Limit, 5xx) werden mit exponentiellem
+    # Backoff wiederholt, statt sofort auf Platzhaltertext zurückzufallen.
+    RETRY = Retry(
+        total=3,
+        backoff_factor=0.4,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["POST"]),
+        respect_retry_after_header=True,
+    )
+
+    # Statuscodes, mit denen Modelle ein nicht unterstütztes ``response_format``
+    # ablehnen; der Sammel‑Request wird dann ohne JSON‑Modus wiederholt.
+    JSON_MODE_REJECTED = frozenset((400, 404, 422))
+
     def __init__(self, api_key: str, model: str) -> None:
         self.api_key = api_key
         self.model = model
-
-    def generate_document(self, idea: str, doc_type: str = "concept") -> str:
-        import json
-
-        prompts = {
-            "concept": (
-                "Du bist eine technische Projektplanungs‑KI. Nimm die folgende "
-                "App‑Beschreibung und erstelle ein detailliertes Konzept. Das "
-                "Konzept sollte Anforderungen, Benutzerrollen, Funktionsumfang, "
-                "empfohlene Programmiersprachen und Bibliotheken, Datenmodelle "
-                "und einen groben Projektplan enthalten. Nutze Markdown‑Syntax "
-                "und strukturiere das Ergebnis mit Überschriften und Listen."
-            ),
-            "requirements": (
-                "Du bist ein Requirements‑Engineer. Verwandle die folgende App‑Idee "
-                "in eine detaillierte Liste von Anforderungen. Formuliere klare User Stories, "
-                "Edge Cases, Akzeptanzkriterien und technischen Einschränkungen. Nutze "
-                "Markdown mit Überschriften, Listen und Tabellen, wo sinnvoll."
-            ),
-            "design": (
-                "Du bist ein Softwarearchitekt. Erstelle auf Grundlage der folgenden Idee "
-                "einen architektonischen Entwurf. Beschreibe die wichtigsten Komponenten, "
-                "deren Schnittstellen, Datenflüsse und Speicherstrukturen. Verwende Markdown mit "
-                "Diagrammen in ASCII oder PlantUML, wo hilfreich."
-            ),
-            "testing": (
-                "Du bist ein QA‑Ingenieur. Erstelle einen Testplan für die folgende App. "
-                "Liste Unit‑Tests, Integrations‑Tests, Performance‑Tests, Security‑Tests "
-                "und Usability‑Tests auf. Gib außerdem Beispiel‑Testdaten und erwartete "
-                "Ergebnisse an. Nutze Markdown zur Strukturierung."
-            ),
-        }
-        system_prompt = prompts.get(doc_type, prompts["concept"])
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": idea},
-        ]
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
+        # Wird auf False gesetzt, sobald das Modell den JSON‑Modus ablehnt, damit
+        # folgende Projekte nicht erneut einen abgelehnten Request bezahlen.
+        self.json_mode = True
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(max_retries=self.RETRY))
+        # Gemeinsame Header einmalig an der Session setzen statt pro Request
+        self.session.headers.update({
+            "Authorization": f"Bearer {api_key}",
             "HTTP-Referer": "https://example.com/",
             "X-Title": "FlowProjectPlanner",
-        }
+        })
+
+    @staticmethod
+    def placeholder(idea: str, doc_type: str) -> str:
+        """Platzhaltertext, der bei Zeitüberschreitungen zurückgegeben wird."""
+        return f"# {doc_type.title()}\n{idea}"
+
+    # Systemprompts je Dokumenttyp
+    PROMPTS: Dict[str, str] = {
+        "concept": (
+            "Du bist eine technische Projektplanungs‑KI. Nimm die folgende "
+            "App‑Beschreibung und erstelle ein detailliertes Konzept. Das "
+            "Konzept sollte Anforderungen, Benutzerrollen, Funktionsumfang, "
+            "empfohlene Programmiersprachen und Bibliotheken, Datenmodelle "
+            "und einen groben Projektplan enthalten. Nutze Markdown‑Syntax "
+            "und strukturiere das Ergebnis mit Überschriften und Listen."
+        ),
+        "requirements": (
+            "Du bist ein Requirements‑Engineer. Verwandle die folgende App‑Idee "
+            "in eine detaillierte Liste von Anforderungen. Formuliere klare User Stories, "
+            "Edge Cases, Akzeptanzkriterien und technischen Einschränkungen. Nutze "
+            "Markdown mit Überschriften, Listen und Tabellen, wo sinnvoll."
+        ),
+        "design": (
+            "Du bist ein Softwarearchitekt. Erstelle auf Grundlage der folgenden Idee "
+            "einen architektonischen Entwurf. Beschreibe die wichtigsten Komponenten, "
+            "deren Schnittstellen, Datenflüsse und Speicherstrukturen. Verwende Markdown mit "
+            "Diagrammen in ASCII oder PlantUML, wo hilfreich."
+        ),
+        "testing": (
+            "Du bist ein QA‑Ingenieur. Erstelle einen Testplan für die folgende App. "
+            "Liste Unit‑Tests, Integrations‑Tests, Performance‑Tests, Security‑Tests "
+            "und Usability‑Tests auf. Gib außerdem Beispiel‑Testdaten und erwartete "
+            "Ergebnisse an. Nutze Markdown zur Strukturierung."
+        ),
+    }
+
+    def _chat(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int,
+        json_mode: bool = False,
+        on_delta: Optional[Callable[[str], object]] = None,
+        deadline: float = 10,
+    ) -> str:
+        """
+        Sendet eine Chat‑Completion im SSE‑Streaming‑Modus und liefert den
+        Antworttext. Jeder empfangene Textteil wird zusätzlich an ``on_delta``
+        übergeben (z. B. ``file.write``), sodass Aufrufer ihn sofort auf die
+        Platte schreiben können. ``deadline`` begrenzt die gesamte Lesedauer in
+        Sekunden. Zeitüberschreitungen und sonstige Fehler werden an den
+        Aufrufer weitergereicht.
+        """
         body: Dict[str, object] = {
             "model": self.model,
             "messages": messages,
-            "max_tokens": 1024,
+            "max_tokens": max_tokens,
             "temperature": 0.3,
+            "stream": True,
         }
-        print(f"[OpenRouter] Generiere {doc_type}-Dokument mit Modell {self.model} …")
-        try:
-            # Begrenze die Gesamtdauer eines Requests, da die API teilweise
-            # sehr lange Antworten streamt. Nach 10 Sekunden brechen wir ab.
-            response = requests.post(
-                self.API_URL,
-                headers=headers,
-                data=json.dumps(body),
-                timeout=5,
-                stream=True,
-            )
+        if json_mode:
+            body["response_format"] = {"type": "json_object"}
+        # Begrenze die Gesamtdauer eines Requests, da die API teilweise
+        # sehr lange Antworten streamt. Nach ``deadline`` Sekunden brechen wir ab.
+        # ``with`` gibt die Verbindung auch bei Fehlern sofort an den Pool zurück.
+        with self.session.post(
+            self.API_URL,
+            json=body,
+            timeout=5,
+            stream=True,
+        ) as response:
             response.raise_for_status()
-            chunks = []
-            start = __import__("time").time()
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    chunks.append(chunk.decode("utf-8", errors="ignore"))
-                if __import__("time").time() - start > 10:
-                    raise RuntimeError("Zeitüberschreitung beim Lesen der Antwort")
-            data = json.loads("".join(chunks))
-            content = data.get("choices", [{}])[0].get("message", {}).get("content")
-            if not content:
-                raise RuntimeError("Keine Antwort von OpenRouter erhalten.")
-            return content.strip()
-        except requests.exceptions.RequestException as e:
-            # Netzwerkausfälle oder Zeitüberschreitungen werden hier behandelt
-            print(f"[OpenRouter] Fehler beim Abruf: {e}. Verwende Platzhaltertext.")
-            return f"# {doc_type.title()}\n{idea}"
-        except Exception as e:
-            print(f"[OpenRouter] Unbekannter Fehler: {e}. Verwende Platzhaltertext.")
-            return f"# {doc_type.title()}\n{idea}"
+            # Der Timer schließt die Antwort bei Fristablauf und beendet damit auch
+            # einen gerade blockierenden Lesevorgang (etwa bei Keep‑Alive‑Pausen).
+            expired = threading.Event()
+
+            def expire() -> None:
+                expired.set()
+                # close() allein weckt einen blockierten recv() nicht auf
+                sock = getattr(getattr(response.raw, "connection", None), "sock", None)
+                if sock is not None:
+                    try:
+                        sock.shutdown(socket.SHUT_RDWR)
+                    except OSError:
+                        pass
+                response.close()
+
+            killer = threading.Timer(deadline, expire)
+            killer.start()
+            try:
+                parts = self._read_stream(response, on_delta, expired)
+            except Exception:
+                if expired.is_set():
+                    raise requests.exceptions.ReadTimeout("Zeitüberschreitung beim Lesen der Antwort") from None
+                raise
+            finally:
+                killer.cancel()
+            if expired.is_set():
+                raise requests.exceptions.ReadTimeout("Zeitüberschreitung beim Lesen der Antwort")
+        content = "".join(parts).rstrip()
+        if not content:
+            raise RuntimeError("Keine Antwort von OpenRouter erhalten.")
+        return content
+
+    @staticmethod
+    def _read_stream(
+        response: requests.Response,
+        on_delta: Optional[Callable[[str], object]],
+        expired: threading.Event,
+    ) -> List[str]:
+        """Sammelt die Textteile der SSE‑Events, bis ``[DONE]`` oder ``expired`` eintritt."""
+        parts: List[str] = []
+        for line in response.iter_lines():
+            if expired.is_set():
+                break
+            # Leere Zeilen trennen Events, ":"‑Zeilen sind Keep‑Alive‑Kommentare
+            if not line.startswith(b"data:"):
+                continue
+            payload = line[5:].strip()
+            if payload == b"[DONE]":
+                break
+            event = json.loads(payload)
+            if "error" in event:
+                raise RuntimeError(f"OpenRouter meldet Fehler: {event['error']}")
+            delta = (event.get("choices") or [{}])[0].get("delta", {}).get("content")
+            if not delta:
+                continue
+            if not parts:
+                # Führende Leerzeichen wie bisher verwerfen (entspricht .strip())
+                delta = delta.lstrip()
+                if not delta:
+                    continue
+            parts.append(delta)
+            if on_delta is not None:
+                on_delta(delta)
+        return parts
+
+    def generate_document(
+        self, idea: str, doc_type: str = "concept", write_chunk: Optional[Callable[[str], object]] = None
+    ) -> str:
+        """
+        Generiert ein einzelnes Dokument. Ist ``write_chunk`` gesetzt, erhält es
+        jeden Textteil, sobald er eintrifft.
+        """
+        system_prompt = self.PROMPTS.get(doc_type, self.PROMPTS["concept"])
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": idea},
+        ]
+        logger.info("[OpenRouter] Generiere %s-Dokument mit Modell %s …", doc_type, self.model)
+        try:
+            return self._chat(messages, max_tokens=1024, on_delta=write_chunk)
+        except requests.exceptions.Timeout as e:
+            # Nur echte Zeitüberschreitungen führen zum Platzhaltertext. Andere
+            # Fehler (z. B. 401 oder erschöpfte Retries) werden an den Aufrufer
+            # weitergereicht, damit keine unbrauchbaren Dokumente entstehen.
+            logger.warning("[OpenRouter] Zeitüberschreitung beim Abruf: %s. Verwende Platzhaltertext.", e)
+            return self.placeholder(idea, doc_type)
+
+    def generate_documents(self, idea: str, kinds: List[str]) -> Optional[Dict[str, str]]:
+        """
+        Erzeugt mehrere Dokumente mit einem einzigen Request. Das Modell soll ein
+        JSON‑Objekt mit genau den angefragten Schlüsseln liefern, deren Werte
+        Markdown‑Texte sind. Gibt ``None`` zurück, wenn die Antwort nicht dem
+        Schema entspricht oder der Abruf scheitert – der Aufrufer fällt dann auf
+        einzelne ``generate_document``‑Aufrufe zurück.
+        """
+        sections = "\n\n".join(
+            f"## {kind}\n{self.PROMPTS.get(kind, self.PROMPTS['concept'])}" for kind in kinds
+        )
+        system_prompt = (
+            "Erstelle für die folgende App‑Idee mehrere Dokumente. Antworte "
+            "ausschließlich mit einem JSON‑Objekt mit genau den Schlüsseln "
+            f"{', '.join(kinds)}; jeder Wert ist das jeweilige Dokument als "
+            "Markdown‑String. Anweisungen je Dokument:\n\n" + sections
+        )
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": idea},
+        ]
+        logger.info("[OpenRouter] Generiere %s in einem Request mit Modell %s …", ", ".join(kinds), self.model)
+        # Mehr Tokens brauchen mehr Zeit: das Leselimit wächst mit der Anzahl
+        # der Dokumente, statt für alle zusammen bei 10 Sekunden zu bleiben.
+        request = dict(messages=messages, max_tokens=1024 * len(kinds), deadline=10 * len(kinds))
+        try:
+            try:
+                raw = self._chat(**request, json_mode=self.json_mode)
+            except requests.exceptions.HTTPError as e:
+                status = e.response.status_code if e.response is not None else None
+                if not self.json_mode or status not in self.JSON_MODE_REJECTED:
+                    raise
+                logger.info("[OpenRouter] Modell %s lehnt JSON‑Modus ab (HTTP %s), wiederhole ohne.", self.model, status)
+                self.json_mode = False
+                raw = self._chat(**request)
+            docs = json.loads(self._strip_fence(raw))
+        except (requests.exceptions.RequestException, RuntimeError, ValueError) as e:
+            logger.warning("[OpenRouter] Sammel‑Request fehlgeschlagen: %s", e)
+            return None
+        if (
+            not isinstance(docs, dict)
+            or set(docs) != set(kinds)
+            or not all(isinstance(v, str) and v.strip() for v in docs.values())
+        ):
+            logger.warning("[OpenRouter] Sammel‑Antwort entspricht nicht dem erwarteten Schema.")
+            return None
+        return {kind: docs[kind].strip() for kind in kinds}
+
+    @staticmethod
+    def _strip_fence(raw: str) -> str:
+        """Entfernt einen umschließenden ```‑Codeblock, wie ihn Modelle ohne JSON‑Modus oft liefern."""
+        if raw.startswith("```"):
+            raw = raw.split("\n", 1)[1] if "\n" in raw else ""
+            if raw.rstrip().endswith("```"):
+                raw = raw.rstrip()[:-3]
+        return raw
 
     def generate_concept(self, idea: str) -> str:
         return self.generate_document(idea, doc_type="concept")
@@ -1,305 +1,587 @@
-import argparse
-from typing import List, Optional
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:  # argparse wird erst beim Aufbau des Parsers importiert
+    import argparse
+
+_DESCRIPTION = "Python‑Wrapper für Claude‑Flow v2.0.0 Alpha. Voraussetzung: npx claude-flow@alpha ist installiert."
+
+# Mit FLO_NO_HELP=1 werden alle Hilfetexte weggelassen (schnellerer Aufbau,
+# sinnvoll für Skripte, die ``--help`` nie benötigen).
+_NO_HELP = bool(os.environ.get("FLO_NO_HELP"))
+
+# Kurzformen für häufige Argumentoptionen in der Tabelle unten.
+_FLAG: Dict[str, Any] = {"action": "store_true"}
+_REMAINDER = "..."  # entspricht argparse.REMAINDER
+_REST: Dict[str, Any] = {"nargs": _REMAINDER}
+
+# Mehrfach verwendete Hilfetexte.
+_H_MODEL = "Modellname"
+_H_TERM = "Suchbegriff"
+_H_WORKFLOW = "Name des Workflows"
+_H_MODE = "Name des Modus"
+_H_CAPS = "JSON‑Liste der Fähigkeiten"
+_H_INPUT = "Eingabedatei"
+_H_TASK = "Beschreibung der Aufgabe"
+_H_TASK_SHORT = "Aufgabenbeschreibung"
+
+# ----------------------------------------------------------------------
+# Statische Befehlstabelle: (Name, Hilfetext, Argumente). Jedes Argument ist
+# ein Tupel (Name[, Hilfetext[, weitere add_argument‑Optionen]]).
+_SPEC: Tuple[Tuple[str, str, Tuple[tuple, ...]], ...] = (
+    # init
+    ("init", "Initialisiert ein neues Claude‑Flow‑Projekt", (
+        ("--project-name", "Name des Projekts"),
+        ("--hive-mind", "Hive‑Mind initialisieren", _FLAG),
+        ("--neural-enhanced", "Neural‑Features aktivieren", _FLAG),
+    )),
+    # hive spawn
+    ("spawn", "Erzeugt einen neuen Hive für ein Feature oder Experiment", (
+        ("description", "Beschreibung der Mission / Feature"),
+        ("--namespace", "Namespace des Hives"),
+        ("--agents", "Anzahl der Agenten im Hive", {"type": int}),
+        ("--temp", "Temporären Hive erstellen", _FLAG),
+    )),
+    # hive resume
+    ("resume", "Setzt die Arbeit in einem bestehenden Hive fort", (
+        ("session_id", "Sitzungs‑ID des Hives"),
+    )),
+    # hive status, sessions
+    ("status", "Zeigt den Status des aktuellen Hives an", ()),
+    ("sessions", "Listet alle Hives/Sessions auf", ()),
+    # swarm
+    ("swarm", "Startet eine Swarm‑Aufgabe für eine Teilaufgabe", (
+        ("task", _H_TASK),
+        ("--continue-session", "Auf bestehender Sitzung fortsetzen", _FLAG),
+        ("--strategy", "Koordinationsstrategie, z. B. development, research"),
+    )),
+    # memory
+    ("memory-stats", "Zeigt Statistiken über den Speicher an", ()),
+    ("memory-query", "Durchsucht den Speicher nach einem Begriff", (
+        ("term", _H_TERM),
+        ("--namespace", "Namespace einschränken"),
+        ("--limit", "Anzahl der Ergebnisse begrenzen", {"type": int}),
+    )),
+    ("memory-store", "Speichert einen Schlüssel/Wert im Speicher", (
+        ("key",),
+        ("value",),
+        ("--namespace",),
+    )),
+    ("memory-export", "Exportiert den Speicher in eine Datei", (
+        ("output_file",),
+        ("--namespace",),
+    )),
+    ("memory-import", "Importiert eine Speicherdatei", (
+        ("input_file",),
+        ("--namespace",),
+    )),
+    # neural
+    ("neural-train", "Trainiert ein neuronales Muster", (
+        ("pattern", "Name des Musters"),
+        ("--epochs", None, {"type": int, "default": 50}),
+        ("--data",),
+    )),
+    ("neural-predict", "Führt eine Vorhersage durch", (
+        ("model", "Name des Modells"),
+        ("input_file", _H_INPUT),
+    )),
+    ("cognitive-analyze", "Analysiert ein Verhalten", (
+        ("behavior", "Verhaltensbeschreibung"),
+    )),
+    # workflow
+    ("workflow-create", "Erstellt einen neuen Workflow", (
+        ("name",),
+        ("--parallel", None, _FLAG),
+    )),
+    ("batch-process", "Verarbeitet eine Liste von Items im Batch", (
+        ("items", "Kommagetrennte Liste von Items"),
+        ("--concurrent", None, _FLAG),
+    )),
+    ("pipeline-create", "Erstellt eine Pipeline aus einer Konfigurationsdatei", (
+        ("config_file",),
+    )),
+    # github (generischer Aufruf)
+    ("github", "Ruft einen GitHub‑Modus von Claude‑Flow auf", (
+        ("mode", "Name des GitHub‑Modus (z. B. pr-manager, repo-architect)"),
+        ("args", "Weitere Argumente für den Modus", _REST),
+    )),
+    # DAA
+    ("daa-create", "Erstellt einen Agenten", (
+        ("agent_type",),
+        ("capabilities", _H_CAPS),
+        ("resources", "Ressourcenbeschreibung als JSON"),
+        ("--security-level",),
+        ("--sandbox", None, _FLAG),
+    )),
+    ("daa-match", "Ordnet Fähigkeiten Anforderungen zu", (
+        ("task_requirements", "JSON‑Liste der Anforderungen"),
+    )),
+    ("daa-lifecycle", "Verwaltet den Lebenszyklus eines Agenten", (
+        ("agent_id",),
+        ("action", "Aktion, z. B. scale-up"),
+    )),
+    # security
+    ("security-scan", "Führt einen Sicherheitscheck durch", (
+        ("--deep", None, _FLAG),
+        ("--report", None, _FLAG),
+    )),
+    ("security-metrics", "Zeigt Sicherheitsmetriken an", (
+        ("--last",),
+    )),
+    ("security-audit", "Führt ein Sicherheitsaudit durch", (
+        ("--full-trace", None, _FLAG),
+    )),
+    # Zusätzliche Swarm‑Befehle
+    ("swarm-init", "Initialisiert einen neuen Swarm", (
+        ("--description", "Optionale Beschreibung für den Swarm"),
+    )),
+    ("agent-spawn", "Startet einen Agenten im Swarm", (
+        ("agent_type", "Typ des Agenten"),
+        ("capabilities", _H_CAPS),
+        ("resources", "JSON‑Beschreibung der Ressourcen"),
+    )),
+    ("task-orchestrate", "Orchestriert eine Aufgabe im Swarm", (
+        ("task_description", _H_TASK),
+    )),
+    ("swarm-monitor", "Überwacht einen Swarm", (
+        ("--dashboard", "Dashboard anzeigen", _FLAG),
+        ("--real-time", "Echtzeitüberwachung aktivieren", _FLAG),
+    )),
+    ("topology-optimize", "Optimiert die Topologie eines Swarms", ()),
+    ("load-balance", "Führt Lastverteilung im Swarm durch", ()),
+    ("coordination-sync", "Synchronisiert die Koordination eines Swarms", ()),
+    ("swarm-scale", "Skaliert die Größe eines Swarms", (
+        ("scale", "Skalierungsangabe, z. B. 'up', 'down' oder konkrete Zahl"),
+    )),
+    ("swarm-destroy", "Zerstört den aktuellen Swarm", ()),
+    # Zusätzliche Neural & Cognitive Befehle
+    ("pattern-recognize", "Führt eine Mustererkennung durch", (
+        ("pattern", "Name oder ID des Musters"),
+        ("--input-file", "Optionale Eingabedatei"),
+    )),
+    ("learning-adapt", "Passt ein Modell an neue Daten an", (
+        ("model", _H_MODEL),
+        ("--data", "Datenquelle"),
+    )),
+    ("neural-compress", "Komprimiert ein bestehendes Modell", (
+        ("model", _H_MODEL),
+        ("--output", "Zieldatei für das komprimierte Modell"),
+    )),
+    ("ensemble-create", "Erstellt ein Ensemble aus mehreren Modellen", (
+        ("models", "Kommagetrennte Liste von Modellen"),
+        ("output_model", "Name des Ergebnis‑Modells"),
+    )),
+    ("transfer-learn", "Führt Transfer Learning durch", (
+        ("base_model", "Basismodell"),
+        ("new_data", "Neue Daten für das Training"),
+    )),
+    ("neural-explain", "Erklärt ein Modell", (
+        ("model", _H_MODEL),
+        ("input_file", _H_INPUT),
+    )),
+    # Zusätzliche Speicherbefehle
+    ("memory-usage", "Zeigt die aktuelle Speichernutzung an", ()),
+    ("memory-search", "Sucht im Speicher nach einem Begriff", (
+        ("term", _H_TERM),
+        ("--namespace", "Optionales Namespace"),
+    )),
+    ("memory-persist", "Persistiert den aktuellen Speicherzustand", ()),
+    ("memory-namespace", "Legt ein Namespace fest", (
+        ("namespace", "Namespace-Name"),
+    )),
+    ("memory-backup", "Erstellt ein Speicher‑Backup", (
+        ("output_file", "Zieldatei für das Backup"),
+    )),
+    ("memory-restore", "Stellt Speicher aus einem Backup wieder her", (
+        ("input_file", "Backupdatei"),
+    )),
+    ("memory-compress", "Komprimiert den Speicher", ()),
+    ("memory-sync", "Synchronisiert Speicher zwischen Instanzen", ()),
+    ("memory-analytics", "Führt Analyse auf dem Speicher durch", ()),
+    # Zusätzliche Performance‑Befehle
+    ("performance-report", "Erstellt einen detaillierten Leistungsbericht", ()),
+    ("bottleneck-analyze", "Analysiert systemische Engpässe", ()),
+    ("token-usage", "Zeigt Tokenverbrauch an", ()),
+    ("benchmark-run", "Führt einen Benchmark aus", (
+        ("benchmark_name", "Name des Benchmarks"),
+    )),
+    ("metrics-collect", "Sammelt aktuelle Metriken", ()),
+    ("trend-analysis", "Führt eine Trendanalyse aus", ()),
+    ("health-check", "Überprüft den Gesundheitszustand des Systems", (
+        ("--components", "Zu überprüfende Komponenten"),
+    )),
+    ("diagnostic-run", "Führt einen Diagnoselauf durch", ()),
+    ("usage-stats", "Gibt Nutzungsstatistiken aus", ()),
+    # Zusätzliche Workflow‑Befehle
+    ("workflow-execute", "Führt einen bestehenden Workflow aus", (
+        ("name", _H_WORKFLOW),
+    )),
+    ("workflow-export", "Exportiert einen Workflow in eine Datei", (
+        ("name", _H_WORKFLOW),
+        ("output_file", "Zieldatei"),
+    )),
+    ("automation-setup", "Richtet Automatisierungsoptionen ein", (
+        ("config_file", "Konfigurationsdatei"),
+    )),
+    ("scheduler-manage", "Verwaltet einen Scheduler", (
+        ("schedule_name", "Schedulername"),
+        ("action", "Aktion (start, stop, status)"),
+    )),
+    ("trigger-setup", "Richtet einen Trigger ein", (
+        ("trigger_name", "Triggername"),
+        ("target", "Zielname oder Datei"),
+    )),
+    ("parallel-execute", "Führt mehrere Tasks parallel aus", (
+        ("tasks", "Kommagetrennte Liste von Tasks"),
+    )),
+    # Zusätzliche GitHub‑Befehle
+    ("github-repo-analyze", "Analysiert ein Repository", (
+        ("--analysis-type", "Analyseart"),
+        ("--target", "Zielpfad"),
+    )),
+    ("github-pr-manage", "Verwaltet Pull‑Requests", (
+        ("--reviewers", "Reviewerliste"),
+        ("--ai-powered", None, _FLAG),
+    )),
+    ("github-issue-track", "Issue‑Tracker ansprechen", (
+        ("--project", "Projektname"),
+    )),
+    ("github-release-coord", "Koordiniert ein Release", (
+        ("version", "Versionsnummer"),
+        ("--auto-changelog", None, _FLAG),
+    )),
+    ("github-workflow-auto", "Automatisiert einen Workflow", (
+        ("file", "Workflowdatei"),
+    )),
+    ("github-code-review", "Führt Code‑Reviews durch", (
+        ("--multi-reviewer", None, _FLAG),
+        ("--ai-powered", None, _FLAG),
+    )),
+    ("github-sync-coordinator", "Synchronisiert mehrere Pakete", (
+        ("--multi-package", None, _FLAG),
+    )),
+    # Zusätzliche DAA‑Befehle
+    ("daa-resource-alloc", "Weist Ressourcen zu", (
+        ("agent_id",),
+        ("cpu",),
+        ("memory",),
+    )),
+    ("daa-communication", "Kommunikation zwischen Agenten", (
+        ("source",),
+        ("target",),
+        ("message",),
+    )),
+    ("daa-consensus", "Startet einen Konsensprozess", (
+        ("proposal",),
+    )),
+    # Zusätzliche Systembefehle
+    ("backup-create", "Erstellt ein Backup", (
+        ("output_file",),
+    )),
+    ("restore-system", "Stellt das System wieder her", (
+        ("backup_file",),
+    )),
+    ("config-manage", "Verwaltet die Konfiguration", (
+        ("operation",),
+        ("file", None, {"nargs": "?"}),
+    )),
+    ("features-detect", "Erkennt verfügbare Features", ()),
+    ("log-analysis", "Analysiert Logdateien", (
+        ("log_file",),
+    )),
+    # Hook‑Befehle
+    ("hook", "Führt einen Hook aus", (
+        ("hook_name", "Name des Hooks"),
+        ("params", "Zusätzliche Parameter", _REST),
+    )),
+    ("fix-hook-variables", "Repariert Hook‑Variablen", (
+        ("target", None, {"nargs": "?"}),
+        ("--test", None, _FLAG),
+    )),
+    # SPARC‑Befehle nach CLAUDE.md
+    ("sparc-modes", "Listet alle verfügbaren SPARC‑Modi auf", ()),
+    ("sparc-run", "Führt einen SPARC‑Modus für eine Aufgabe aus", (
+        ("mode", "Name des SPARC‑Modus"),
+        ("task", "Beschreibung der Aufgabe in Anführungszeichen"),
+        ("--parallel", "Aktiviere parallele Verarbeitung", _FLAG),
+        ("--batch-optimize", "Aktiviere Batchtools‑Optimierung", _FLAG),
+    )),
+    ("sparc-tdd", "Führt einen vollständigen TDD‑Workflow aus", (
+        ("feature", "Beschreibung des Features"),
+        ("--batch-tdd", "Aktiviere parallele TDD‑Tests", _FLAG),
+    )),
+    ("sparc-info", "Zeigt Details zu einem SPARC‑Modus", (
+        ("mode", _H_MODE),
+    )),
+    ("sparc-batch", "Führt mehrere SPARC‑Modi parallel aus", (
+        ("modes", "Kommagetrennte Liste von Modi"),
+        ("task", _H_TASK_SHORT),
+    )),
+    ("sparc-pipeline", "Startet eine SPARC‑Pipeline für eine Aufgabe", (
+        ("task", _H_TASK_SHORT),
+    )),
+    ("sparc-concurrent", "Verarbeitet mehrere Aufgaben parallel in einem Modus", (
+        ("mode", _H_MODE),
+        ("tasks_file", "Datei mit Aufgabenliste"),
+    )),
+    # SPARC Full Workflow
+    ("sparc-full", "Führt einen vollständigen SPARC‑Workflow für ein Feature aus", (
+        ("feature", "Bezeichnung des Features, z. B. 'user authentication'"),
+    )),
+    # Automatisierter Projekt‑Workflow
+    ("new-project", "Erstellt ein neues Projekt aus einer Idee und startet den gesamten Claude‑Flow‑Workflow", (
+        ("idea", "Kurze Beschreibung der App oder des Features"),
+        ("--base-dir", "Basisverzeichnis für Projekte (Default: ./projects)", {"dest": "base_dir", "default": "projects"}),
+        ("--template", "Optionales Template (Agile, DDD, HighPerformance, CICD)", {"dest": "template"}),
+    )),
+    # Hintergrundausführung
+    ("run-bg", "Führt einen beliebigen claude-flow Befehl im Hintergrund aus", (
+        ("cli_args", "Der Befehl und seine Parameter für claude-flow", _REST),
+    )),
+    # Interaktiver Projektmanager
+    ("manager", "Startet das interaktive Projektmanager-Menü", ()),
+)
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(
-        description="Python‑Wrapper für Claude‑Flow v2.0.0 Alpha. Voraussetzung: npx claude-flow@alpha ist installiert."
-    )
-    sub = parser.add_subparsers(dest="command")
+_SPEC_BY_NAME: Dict[str, Tuple[str, Tuple[tuple, ...]]] = {name: (help_text, args) for name, help_text, args in _SPEC}
 
-    # init
-    init_p = sub.add_parser("init", help="Initialisiert ein neues Claude‑Flow‑Projekt")
-    init_p.add_argument("--project-name", help="Name des Projekts")
-    init_p.add_argument("--hive-mind", action="store_true", help="Hive‑Mind initialisieren")
-    init_p.add_argument("--neural-enhanced", action="store_true", help="Neural‑Features aktivieren")
+# Alle bekannten Befehlsnamen – nutzbar, ohne argparse zu importieren.
+COMMAND_NAMES = frozenset(_SPEC_BY_NAME)
 
-    # hive spawn
-    spawn_p = sub.add_parser("spawn", help="Erzeugt einen neuen Hive für ein Feature oder Experiment")
-    spawn_p.add_argument("description", help="Beschreibung der Mission / Feature")
-    spawn_p.add_argument("--namespace", help="Namespace des Hives")
-    spawn_p.add_argument("--agents", type=int, help="Anzahl der Agenten im Hive")
-    spawn_p.add_argument("--temp", action="store_true", help="Temporären Hive erstellen")
 
-    # hive resume
-    resume_p = sub.add_parser("resume", help="Setzt die Arbeit in einem bestehenden Hive fort")
-    resume_p.add_argument("session_id", help="Sitzungs‑ID des Hives")
+@dataclass(frozen=True, slots=True)
+class ArgSpec:
+    """Kompakte Beschreibung eines Arguments für den schnellen Parser."""
 
-    # hive status, sessions
-    sub.add_parser("status", help="Zeigt den Status des aktuellen Hives an")
-    sub.add_parser("sessions", help="Listet alle Hives/Sessions auf")
+    name: str
+    dest: str
+    positional: bool
+    store_true: bool = False
+    type: Callable[[str], Any] = str
+    default: Any = None
+    nargs: Optional[str] = None
 
-    # swarm
-    swarm_p = sub.add_parser("swarm", help="Startet eine Swarm‑Aufgabe für eine Teilaufgabe")
-    swarm_p.add_argument("task", help="Beschreibung der Aufgabe")
-    swarm_p.add_argument("--continue-session", action="store_true", help="Auf bestehender Sitzung fortsetzen")
-    swarm_p.add_argument("--strategy", help="Koordinationsstrategie, z. B. development, research")
 
-    # memory
-    sub.add_parser("memory-stats", help="Zeigt Statistiken über den Speicher an")
-    query_p = sub.add_parser("memory-query", help="Durchsucht den Speicher nach einem Begriff")
-    query_p.add_argument("term", help="Suchbegriff")
-    query_p.add_argument("--namespace", help="Namespace einschränken")
-    query_p.add_argument("--limit", type=int, help="Anzahl der Ergebnisse begrenzen")
+@dataclass(frozen=True, slots=True)
+class CommandSpec:
+    """Hilfetext und Argumente eines Unterbefehls."""
 
-    store_p = sub.add_parser("memory-store", help="Speichert einen Schlüssel/Wert im Speicher")
-    store_p.add_argument("key")
-    store_p.add_argument("value")
-    store_p.add_argument("--namespace")
+    help: str
+    args: Tuple[ArgSpec, ...]
 
-    export_p = sub.add_parser("memory-export", help="Exportiert den Speicher in eine Datei")
-    export_p.add_argument("output_file")
-    export_p.add_argument("--namespace")
 
-    import_p = sub.add_parser("memory-import", help="Importiert eine Speicherdatei")
-    import_p.add_argument("input_file")
-    import_p.add_argument("--namespace")
+def _arg_spec(entry: tuple) -> ArgSpec:
+    name, _help, opts = (entry + (None, None))[:3]
+    opts = opts or {}
+    positional = not name.startswith("-")
+    store_true = opts.get("action") == "store_true"
+    return ArgSpec(
+        name=name,
+        dest=opts.get("dest") or name.lstrip("-").replace("-", "_"),
+        positional=positional,
+        store_true=store_true,
+        type=opts.get("type", str),
+        default=opts.get("default", False if store_true else None),
+        nargs=opts.get("nargs"),
+    )
 
-    # neural
-    neural_train_p = sub.add_parser("neural-train", help="Trainiert ein neuronales Muster")
-    neural_train_p.add_argument("pattern", help="Name des Musters")
-    neural_train_p.add_argument("--epochs", type=int, default=50)
-    neural_train_p.add_argument("--data")
 
-    neural_predict_p = sub.add_parser("neural-predict", help="Führt eine Vorhersage durch")
-    neural_predict_p.add_argument("model", help="Name des Modells")
-    neural_predict_p.add_argument("input_file", help="Eingabedatei")
+_COMMANDS: Dict[str, CommandSpec] = {
+    name: CommandSpec(help_text, tuple(_arg_spec(a) for a in args)) for name, help_text, args in _SPEC
+}
 
-    cognitive_p = sub.add_parser("cognitive-analyze", help="Analysiert ein Verhalten")
-    cognitive_p.add_argument("behavior", help="Verhaltensbeschreibung")
 
-    # workflow
-    workflow_p = sub.add_parser("workflow-create", help="Erstellt einen neuen Workflow")
-    workflow_p.add_argument("name")
-    workflow_p.add_argument("--parallel", action="store_true")
+def _sniff_subcommand(argv: Sequence[str]) -> Optional[str]:
+    """Liefert den ersten Nicht‑Flag‑Token aus ``argv``, sofern er ein bekannter Befehl ist."""
+    for token in argv:
+        if token.startswith("-"):
+            continue
+        return token if token in COMMAND_NAMES else None
+    return None
 
-    batch_p = sub.add_parser("batch-process", help="Verarbeitet eine Liste von Items im Batch")
-    batch_p.add_argument("items", help="Kommagetrennte Liste von Items")
-    batch_p.add_argument("--concurrent", action="store_true")
 
-    pipeline_p = sub.add_parser("pipeline-create", help="Erstellt eine Pipeline aus einer Konfigurationsdatei")
-    pipeline_p.add_argument("config_file")
+def _sp(sub: Any, name: str, help: Optional[str] = None) -> argparse.ArgumentParser:
+    """``sub.add_parser`` mit Hilfetext, sofern FLO_NO_HELP nicht gesetzt ist."""
+    return sub.add_parser(name, help=None if _NO_HELP else help)
 
-    # github (generischer Aufruf)
-    github_p = sub.add_parser("github", help="Ruft einen GitHub‑Modus von Claude‑Flow auf")
-    github_p.add_argument("mode", help="Name des GitHub‑Modus (z. B. pr-manager, repo-architect)")
-    github_p.add_argument("args", nargs=argparse.REMAINDER, help="Weitere Argumente für den Modus")
 
-    # DAA
-    daa_create_p = sub.add_parser("daa-create", help="Erstellt einen Agenten")
-    daa_create_p.add_argument("agent_type")
-    daa_create_p.add_argument("capabilities", help="JSON‑Liste der Fähigkeiten")
-    daa_create_p.add_argument("resources", help="Ressourcenbeschreibung als JSON")
-    daa_create_p.add_argument("--security-level")
-    daa_create_p.add_argument("--sandbox", action="store_true")
+def _aa(p: argparse.ArgumentParser, *names: str, help: Optional[str] = None, **kwargs: Any) -> None:
+    """``p.add_argument`` mit Hilfetext, sofern FLO_NO_HELP nicht gesetzt ist."""
+    if help is not None and not _NO_HELP:
+        kwargs["help"] = help
+    if kwargs.get("nargs") == _REMAINDER:
+        import argparse
 
-    daa_match_p = sub.add_parser("daa-match", help="Ordnet Fähigkeiten Anforderungen zu")
-    daa_match_p.add_argument("task_requirements", help="JSON‑Liste der Anforderungen")
+        kwargs["nargs"] = argparse.REMAINDER
+    p.add_argument(*names, **kwargs)
 
-    daa_lifecycle_p = sub.add_parser("daa-lifecycle", help="Verwaltet den Lebenszyklus eines Agenten")
-    daa_lifecycle_p.add_argument("agent_id")
-    daa_lifecycle_p.add_argument("action", help="Aktion, z. B. scale-up")
 
-    # security
-    sec_scan_p = sub.add_parser("security-scan", help="Führt einen Sicherheitscheck durch")
-    sec_scan_p.add_argument("--deep", action="store_true")
-    sec_scan_p.add_argument("--report", action="store_true")
+def _add_arguments(p: argparse.ArgumentParser, args: Tuple[tuple, ...]) -> None:
+    for name, help_text, opts in ((a + (None, None))[:3] for a in args):
+        _aa(p, name, help=help_text, **(opts or {}))
 
-    sec_metrics_p = sub.add_parser("security-metrics", help="Zeigt Sicherheitsmetriken an")
-    sec_metrics_p.add_argument("--last")
 
-    sec_audit_p = sub.add_parser("security-audit", help="Führt ein Sicherheitsaudit durch")
-    sec_audit_p.add_argument("--full-trace", action="store_true")
+@lru_cache(maxsize=None)
+def _fast_parser_class() -> type:
+    """Erzeugt (einmalig) die Parser‑Klasse; argparse wird erst hier importiert."""
+    import argparse
 
-    # ------------------------------------------------------------------
-    # Zusätzliche Swarm‑Befehle
-    swarm_init_p = sub.add_parser("swarm-init", help="Initialisiert einen neuen Swarm")
-    swarm_init_p.add_argument("--description", help="Optionale Beschreibung für den Swarm")
-    agent_spawn_p = sub.add_parser("agent-spawn", help="Startet einen Agenten im Swarm")
-    agent_spawn_p.add_argument("agent_type", help="Typ des Agenten")
-    agent_spawn_p.add_argument("capabilities", help="JSON‑Liste der Fähigkeiten")
-    agent_spawn_p.add_argument("resources", help="JSON‑Beschreibung der Ressourcen")
-    task_orchestrate_p = sub.add_parser("task-orchestrate", help="Orchestriert eine Aufgabe im Swarm")
-    task_orchestrate_p.add_argument("task_description", help="Beschreibung der Aufgabe")
-    swarm_monitor_p = sub.add_parser("swarm-monitor", help="Überwacht einen Swarm")
-    swarm_monitor_p.add_argument("--dashboard", action="store_true", help="Dashboard anzeigen")
-    swarm_monitor_p.add_argument("--real-time", action="store_true", help="Echtzeitüberwachung aktivieren")
-    sub.add_parser("topology-optimize", help="Optimiert die Topologie eines Swarms")
-    sub.add_parser("load-balance", help="Führt Lastverteilung im Swarm durch")
-    sub.add_parser("coordination-sync", help="Synchronisiert die Koordination eines Swarms")
-    swarm_scale_p = sub.add_parser("swarm-scale", help="Skaliert die Größe eines Swarms")
-    swarm_scale_p.add_argument("scale", help="Skalierungsangabe, z. B. 'up', 'down' oder konkrete Zahl")
-    sub.add_parser("swarm-destroy", help="Zerstört den aktuellen Swarm")
-
-    # ------------------------------------------------------------------
-    # Zusätzliche Neural & Cognitive Befehle
-    pattern_p = sub.add_parser("pattern-recognize", help="Führt eine Mustererkennung durch")
-    pattern_p.add_argument("pattern", help="Name oder ID des Musters")
-    pattern_p.add_argument("--input-file", help="Optionale Eingabedatei")
-    learn_p = sub.add_parser("learning-adapt", help="Passt ein Modell an neue Daten an")
-    learn_p.add_argument("model", help="Modellname")
-    learn_p.add_argument("--data", help="Datenquelle")
-    compress_p = sub.add_parser("neural-compress", help="Komprimiert ein bestehendes Modell")
-    compress_p.add_argument("model", help="Modellname")
-    compress_p.add_argument("--output", help="Zieldatei für das komprimierte Modell")
-    ensemble_p = sub.add_parser("ensemble-create", help="Erstellt ein Ensemble aus mehreren Modellen")
-    ensemble_p.add_argument("models", help="Kommagetrennte Liste von Modellen")
-    ensemble_p.add_argument("output_model", help="Name des Ergebnis‑Modells")
-    transfer_p = sub.add_parser("transfer-learn", help="Führt Transfer Learning durch")
-    transfer_p.add_argument("base_model", help="Basismodell")
-    transfer_p.add_argument("new_data", help="Neue Daten für das Training")
-    explain_p = sub.add_parser("neural-explain", help="Erklärt ein Modell")
-    explain_p.add_argument("model", help="Modellname")
-    explain_p.add_argument("input_file", help="Eingabedatei")
-
-    # ------------------------------------------------------------------
-    # Zusätzliche Speicherbefehle
-    sub.add_parser("memory-usage", help="Zeigt die aktuelle Speichernutzung an")
-    mem_search_p = sub.add_parser("memory-search", help="Sucht im Speicher nach einem Begriff")
-    mem_search_p.add_argument("term", help="Suchbegriff")
-    mem_search_p.add_argument("--namespace", help="Optionales Namespace")
-    sub.add_parser("memory-persist", help="Persistiert den aktuellen Speicherzustand")
-    mem_ns_p = sub.add_parser("memory-namespace", help="Legt ein Namespace fest")
-    mem_ns_p.add_argument("namespace", help="Namespace-Name")
-    mem_backup_p = sub.add_parser("memory-backup", help="Erstellt ein Speicher‑Backup")
-    mem_backup_p.add_argument("output_file", help="Zieldatei für das Backup")
-    mem_restore_p = sub.add_parser("memory-restore", help="Stellt Speicher aus einem Backup wieder her")
-    mem_restore_p.add_argument("input_file", help="Backupdatei")
-    sub.add_parser("memory-compress", help="Komprimiert den Speicher")
-    sub.add_parser("memory-sync", help="Synchronisiert Speicher zwischen Instanzen")
-    sub.add_parser("memory-analytics", help="Führt Analyse auf dem Speicher durch")
-
-    # ------------------------------------------------------------------
-    # Zusätzliche Performance‑Befehle
-    sub.add_parser("performance-report", help="Erstellt einen detaillierten Leistungsbericht")
-    sub.add_parser("bottleneck-analyze", help="Analysiert systemische Engpässe")
-    sub.add_parser("token-usage", help="Zeigt Tokenverbrauch an")
-    bench_p2 = sub.add_parser("benchmark-run", help="Führt einen Benchmark aus")
-    bench_p2.add_argument("benchmark_name", help="Name des Benchmarks")
-    sub.add_parser("metrics-collect", help="Sammelt aktuelle Metriken")
-    sub.add_parser("trend-analysis", help="Führt eine Trendanalyse aus")
-    health2_p = sub.add_parser("health-check", help="Überprüft den Gesundheitszustand des Systems")
-    health2_p.add_argument("--components", help="Zu überprüfende Komponenten")
-    sub.add_parser("diagnostic-run", help="Führt einen Diagnoselauf durch")
-    sub.add_parser("usage-stats", help="Gibt Nutzungsstatistiken aus")
-
-    # ------------------------------------------------------------------
-    # Zusätzliche Workflow‑Befehle
-    wf_exec2_p = sub.add_parser("workflow-execute", help="Führt einen bestehenden Workflow aus")
-    wf_exec2_p.add_argument("name", help="Name des Workflows")
-    wf_export2_p = sub.add_parser("workflow-export", help="Exportiert einen Workflow in eine Datei")
-    wf_export2_p.add_argument("name", help="Name des Workflows")
-    wf_export2_p.add_argument("output_file", help="Zieldatei")
-    auto_setup2_p = sub.add_parser("automation-setup", help="Richtet Automatisierungsoptionen ein")
-    auto_setup2_p.add_argument("config_file", help="Konfigurationsdatei")
-    sched_manage2_p = sub.add_parser("scheduler-manage", help="Verwaltet einen Scheduler")
-    sched_manage2_p.add_argument("schedule_name", help="Schedulername")
-    sched_manage2_p.add_argument("action", help="Aktion (start, stop, status)")
-    trigger2_p = sub.add_parser("trigger-setup", help="Richtet einen Trigger ein")
-    trigger2_p.add_argument("trigger_name", help="Triggername")
-    trigger2_p.add_argument("target", help="Zielname oder Datei")
-    parallel2_p = sub.add_parser("parallel-execute", help="Führt mehrere Tasks parallel aus")
-    parallel2_p.add_argument("tasks", help="Kommagetrennte Liste von Tasks")
-
-    # ------------------------------------------------------------------
-    # Zusätzliche GitHub‑Befehle
-    gha2_p = sub.add_parser("github-repo-analyze", help="Analysiert ein Repository")
-    gha2_p.add_argument("--analysis-type", help="Analyseart")
-    gha2_p.add_argument("--target", help="Zielpfad")
-    gpr2_p = sub.add_parser("github-pr-manage", help="Verwaltet Pull‑Requests")
-    gpr2_p.add_argument("--reviewers", help="Reviewerliste")
-    gpr2_p.add_argument("--ai-powered", action="store_true")
-    gitrack_p = sub.add_parser("github-issue-track", help="Issue‑Tracker ansprechen")
-    gitrack_p.add_argument("--project", help="Projektname")
-    grelease_p = sub.add_parser("github-release-coord", help="Koordiniert ein Release")
-    grelease_p.add_argument("version", help="Versionsnummer")
-    grelease_p.add_argument("--auto-changelog", action="store_true")
-    gwa2_p = sub.add_parser("github-workflow-auto", help="Automatisiert einen Workflow")
-    gwa2_p.add_argument("file", help="Workflowdatei")
-    gcr2_p = sub.add_parser("github-code-review", help="Führt Code‑Reviews durch")
-    gcr2_p.add_argument("--multi-reviewer", action="store_true")
-    gcr2_p.add_argument("--ai-powered", action="store_true")
-    gsync_p = sub.add_parser("github-sync-coordinator", help="Synchronisiert mehrere Pakete")
-    gsync_p.add_argument("--multi-package", action="store_true")
-
-    # ------------------------------------------------------------------
-    # Zusätzliche DAA‑Befehle
-    dra2_p = sub.add_parser("daa-resource-alloc", help="Weist Ressourcen zu")
-    dra2_p.add_argument("agent_id")
-    dra2_p.add_argument("cpu")
-    dra2_p.add_argument("memory")
-    dcomm2_p = sub.add_parser("daa-communication", help="Kommunikation zwischen Agenten")
-    dcomm2_p.add_argument("source")
-    dcomm2_p.add_argument("target")
-    dcomm2_p.add_argument("message")
-    dcon2_p = sub.add_parser("daa-consensus", help="Startet einen Konsensprozess")
-    dcon2_p.add_argument("proposal")
-
-    # ------------------------------------------------------------------
-    # Zusätzliche Systembefehle
-    backup2_p = sub.add_parser("backup-create", help="Erstellt ein Backup")
-    backup2_p.add_argument("output_file")
-    restore2_p = sub.add_parser("restore-system", help="Stellt das System wieder her")
-    restore2_p.add_argument("backup_file")
-    config2_p = sub.add_parser("config-manage", help="Verwaltet die Konfiguration")
-    config2_p.add_argument("operation")
-    config2_p.add_argument("file", nargs="?")
-    sub.add_parser("features-detect", help="Erkennt verfügbare Features")
-    log2_p = sub.add_parser("log-analysis", help="Analysiert Logdateien")
-    log2_p.add_argument("log_file")
-
-    # ------------------------------------------------------------------
-    # Hook‑Befehle
-    hook2_p = sub.add_parser("hook", help="Führt einen Hook aus")
-    hook2_p.add_argument("hook_name", help="Name des Hooks")
-    hook2_p.add_argument("params", nargs=argparse.REMAINDER, help="Zusätzliche Parameter")
-    fhv2_p = sub.add_parser("fix-hook-variables", help="Repariert Hook‑Variablen")
-    fhv2_p.add_argument("target", nargs="?")
-    fhv2_p.add_argument("--test", action="store_true")
-
-    # ------------------------------------------------------------------
-    # SPARC‑Befehle nach CLAUDE.md
-    sub.add_parser("sparc-modes", help="Listet alle verfügbaren SPARC‑Modi auf")
-    sparc_run_p = sub.add_parser("sparc-run", help="Führt einen SPARC‑Modus für eine Aufgabe aus")
-    sparc_run_p.add_argument("mode", help="Name des SPARC‑Modus")
-    sparc_run_p.add_argument("task", help="Beschreibung der Aufgabe in Anführungszeichen")
-    sparc_run_p.add_argument("--parallel", action="store_true", help="Aktiviere parallele Verarbeitung")
-    sparc_run_p.add_argument("--batch-optimize", action="store_true", help="Aktiviere Batchtools‑Optimierung")
-    sparc_tdd_p = sub.add_parser("sparc-tdd", help="Führt einen vollständigen TDD‑Workflow aus")
-    sparc_tdd_p.add_argument("feature", help="Beschreibung des Features")
-    sparc_tdd_p.add_argument("--batch-tdd", action="store_true", help="Aktiviere parallele TDD‑Tests")
-    sparc_info_p = sub.add_parser("sparc-info", help="Zeigt Details zu einem SPARC‑Modus")
-    sparc_info_p.add_argument("mode", help="Name des Modus")
-    sparc_batch_p = sub.add_parser("sparc-batch", help="Führt mehrere SPARC‑Modi parallel aus")
-    sparc_batch_p.add_argument("modes", help="Kommagetrennte Liste von Modi")
-    sparc_batch_p.add_argument("task", help="Aufgabenbeschreibung")
-    sparc_pipeline_p = sub.add_parser("sparc-pipeline", help="Startet eine SPARC‑Pipeline für eine Aufgabe")
-    sparc_pipeline_p.add_argument("task", help="Aufgabenbeschreibung")
-    sparc_concurrent_p = sub.add_parser("sparc-concurrent", help="Verarbeitet mehrere Aufgaben parallel in einem Modus")
-    sparc_concurrent_p.add_argument("mode", help="Name des Modus")
-    sparc_concurrent_p.add_argument("tasks_file", help="Datei mit Aufgabenliste")
+    class _FastParser(argparse.ArgumentParser):
+        """
+        ArgumentParser, der für die Prüfung in ``add_argument`` immer denselben
+        Formatter verwendet, statt pro Argument einen neuen zu erzeugen (jeder
+        neue Formatter fragt u. a. die Terminalgröße ab). Hilfe‑ und
+        Fehlerausgaben erhalten weiterhin einen frischen Formatter, da diese
+        ihn beim Formatieren befüllen.
+        """
 
-    # SPARC Full Workflow
-    sparc_full_p = sub.add_parser("sparc-full", help="Führt einen vollständigen SPARC‑Workflow für ein Feature aus")
-    sparc_full_p.add_argument("feature", help="Bezeichnung des Features, z. B. 'user authentication'")
+        _validating = False
+        _cached_formatter = None
 
-    # ------------------------------------------------------------------
-    # Automatisierter Projekt‑Workflow
-    new_proj_p = sub.add_parser("new-project", help="Erstellt ein neues Projekt aus einer Idee und startet den gesamten Claude‑Flow‑Workflow")
-    new_proj_p.add_argument("idea", help="Kurze Beschreibung der App oder des Features")
-    new_proj_p.add_argument("--base-dir", dest="base_dir", default="projects", help="Basisverzeichnis für Projekte (Default: ./projects)")
-    new_proj_p.add_argument("--template", dest="template", help="Optionales Template (Agile, DDD, HighPerformance, CICD)")
+        def add_argument(self, *args: Any, **kwargs: Any) -> Any:
+            self._validating = True
+            try:
+                return super().add_argument(*args, **kwargs)
+            finally:
+                self._validating = False
 
-    # ------------------------------------------------------------------
-    # Hintergrundausführung
-    runbg_p = sub.add_parser("run-bg", help="Führt einen beliebigen claude-flow Befehl im Hintergrund aus")
-    runbg_p.add_argument("cli_args", nargs=argparse.REMAINDER, help="Der Befehl und seine Parameter für claude-flow")
+        def _get_formatter(self) -> Any:
+            if not self._validating:
+                return super()._get_formatter()
+            if self._cached_formatter is None:
+                self._cached_formatter = super()._get_formatter()
+            return self._cached_formatter
 
-    # ------------------------------------------------------------------
-    # Interaktiver Projektmanager
-    sub.add_parser("manager", help="Startet das interaktive Projektmanager-Menü")
+    return _FastParser
 
-    return parser
 
+@lru_cache(maxsize=8)
+def _cached_parser(wanted: Optional[str], full: bool) -> argparse.ArgumentParser:
+    # Subparser übernehmen automatisch die Klasse des Hauptparsers.
+    parser_class = _fast_parser_class()
+    parser = parser_class(description=None if _NO_HELP else _DESCRIPTION)
+    sub = parser.add_subparsers(dest="command")
+    for name, help_text, args in _SPEC:
+        p = _sp(sub, name, help=help_text)
+        if args and (full or name == wanted):
+            _add_arguments(p, args)
+    return parser
 
 
-__all__ = ["build_parser"]
+def build_parser(argv: Optional[Sequence[str]] = None) -> argparse.ArgumentParser:
+    """
+    Baut den Argumentparser. Ohne ``argv`` werden alle Unterbefehle vollständig
+    angelegt. Wird ``argv`` übergeben, erhält nur der darin erkannte Befehl
+    seine Argumente; alle anderen werden als schlanke Stubs (Name + Hilfetext)
+    registriert, damit ``--help`` weiterhin die komplette Liste zeigt.
+
+    Fertige Parser werden zwischengespeichert und bei erneutem Aufruf (z. B.
+    aus dem Manager‑Menü) wiederverwendet. Sie dürfen daher nur zum Parsen
+    verwendet und nicht nachträglich verändert werden.
+    """
+    if argv is None:
+        return _cached_parser(None, True)
+    return _cached_parser(_sniff_subcommand(argv), False)
+
+
+def parse(argv: Sequence[str]) -> Optional[SimpleNamespace]:
+    """
+    Schneller Parser ohne argparse für den Normalfall. Liefert ``None``, wenn
+    die Eingabe nicht eindeutig ist (Hilfe, unbekannte oder abgekürzte
+    Optionen, fehlende Werte, Typfehler …); dann übernimmt argparse samt
+    seiner Fehlermeldungen.
+    """
+    if not argv:
+        return SimpleNamespace(command=None)
+    spec = _COMMANDS.get(argv[0])
+    if spec is None:
+        return None
+    values: Dict[str, Any] = {"command": argv[0]}
+    options: Dict[str, ArgSpec] = {}
+    positionals: List[ArgSpec] = []
+    for arg in spec.args:
+        values[arg.dest] = arg.default
+        if arg.positional:
+            positionals.append(arg)
+        else:
+            options[arg.name] = arg
+    tokens = list(argv[1:])
+    pos_index = 0
+    i = 0
+    try:
+        while i < len(tokens):
+            token = tokens[i]
+            if pos_index < len(positionals) and positionals[pos_index].nargs == _REMAINDER:
+                values[positionals[pos_index].dest] = tokens[i:]
+                pos_index += 1
+                break
+            if token.startswith("-"):
+                name, sep, inline = token.partition("=")
+                opt = options.get(name)
+                if opt is None:
+                    return None
+                if opt.store_true:
+                    if sep:
+                        return None
+                    values[opt.dest] = True
+                elif sep:
+                    values[opt.dest] = opt.type(inline)
+                else:
+                    i += 1
+                    if i >= len(tokens) or tokens[i].startswith("-"):
+                        return None
+                    values[opt.dest] = opt.type(tokens[i])
+            elif pos_index < len(positionals):
+                arg = positionals[pos_index]
+                values[arg.dest] = arg.type(token)
+                pos_index += 1
+            else:
+                return None
+            i += 1
+    except (TypeError, ValueError):
+        return None
+    for arg in positionals[pos_index:]:
+        if arg.nargs == _REMAINDER:
+            values[arg.dest] = []
+        elif arg.nargs != "?":
+            return None
+    return SimpleNamespace(**values)
+
+
+def parse_args(argv: Sequence[str]) -> Any:
+    """
+    Parst ``argv`` (ohne Programmnamen). Der schnelle Parser deckt den
+    Normalfall ab; argparse wird nur für Hilfe und Fehlermeldungen gebaut.
+    """
+    args = parse(argv)
+    if args is None:
+        args = build_parser(argv).parse_args(argv)
+    return args
+
+
+# Befehle, die ihre restlichen Argumente unverändert an claude-flow durchreichen.
+_PASSTHROUGH = frozenset({"run-bg", "github", "hook"})
+
+
+def fast_dispatch(argv: Sequence[str]) -> Optional[Tuple[str, List[str]]]:
+    """
+    Erkennt Durchreich‑Befehle (``run-bg``, ``github``, ``hook``) ohne argparse.
+    ``argv`` sind die Argumente ohne Programmnamen. Liefert ``(befehl, rest)``
+    oder ``None``, wenn der reguläre Parser zuständig ist – etwa bei
+    ``-h``/``--help`` oder fehlenden Pflichtargumenten.
+    """
+    if not argv or argv[0] not in _PASSTHROUGH:
+        return None
+    rest = list(argv[1:])
+    if rest and rest[0].startswith("-"):
+        return None
+    if not rest and argv[0] != "run-bg":
+        return None
+    return argv[0], rest
+
+
+__all__ = ["COMMAND_NAMES", "ArgSpec", "CommandSpec", "build_parser", "fast_dispatch", "parse", "parse_args"]
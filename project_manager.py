@@ -1,8 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
 import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
-from openrouter_client import OpenRouterClient
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 from claude_flow_cli import ClaudeFlowCLI
+from flo_log import get_logger
+
+if TYPE_CHECKING:
+    from openrouter_client import OpenRouterClient
+
+# Statusmeldungen laufen über den gemeinsamen flo‑Logger (siehe flo_log)
+logger = get_logger("project_manager")
+
+# Vorkompilierte Muster für slugify
+_SLUG_NONALNUM = re.compile(r"[^a-z0-9-]+")
+_SLUG_DASHES = re.compile(r"-+")
+
+# Füllwörter, die optimize_prompt entfernt (nur ganze Wörter)
+_FILLER_RE = re.compile(r"\b(?:einfach|bitte|erstelle|baue|erstellt|erstellen)\b", re.IGNORECASE)
+_WS_RE = re.compile(r"\s+")
+_PROMPT_PREFIX = "Beschreibe diese Idee in 5 Stichpunkten: "
+
+# Dokumente, die über OpenRouter erzeugt werden: (Typ/Dateiname, Bezeichnung)
+_DOCS = (
+    ("concept", "Konzept"),
+    ("requirements", "Requirements"),
+    ("design", "Design"),
+    ("testing", "Testplan"),
+)
+
+# Schlüsselwörter für infer_template; die Gruppen stehen in absteigender Priorität
+_TEMPLATE_RE = re.compile(
+    r"(?P<webapp>web|frontend|backend)|(?P<cli>cli|konsole|terminal)"
+    r"|(?P<data>data|pipeline)|(?P<micro>microservice)",
+    re.IGNORECASE,
+)
+_TEMPLATE_NAMES = {"webapp": "WebApp", "cli": "CLI-Tool", "data": "DataPipeline", "micro": "Microservices"}
+
+# Mindestabstand (Sekunden) zwischen zwei Fehlerabfragen im Memory
+_ERROR_CHECK_INTERVAL = 30.0
+# Treffer‑Erkennung in der Ausgabe von ``memory query`` (ohne Kleinbuchstaben‑Kopie)
+_ERROR_RE = re.compile("error", re.IGNORECASE)
+# Speicherorte des claude‑flow‑Memorys (relativ zum Arbeitsverzeichnis der CLI)
+_MEMORY_STORES = (".swarm/memory.db", ".hive-mind/hive.db")
+
+# Markierungsdatei für vollständig erstellte Projekte (enthält Hash aus Idee und Template)
+_COMPLETE_MARKER = ".flo_complete"
+
+# Beispiel‑Dateien der Templates
+_FLASK_APP_PY = """from flask import Flask, jsonify\n\napp = Flask(__name__)\n\n@app.route('/')\ndef index():\n    return jsonify({'message': 'Hello from backend!'})\n\nif __name__ == '__main__':\n    app.run(debug=True)\n"""
+_INDEX_HTML = """<!DOCTYPE html>\n<html lang='en'>\n<head><meta charset='UTF-8'><title>WebApp</title></head>\n<body>\n<h1>Willkommen bei Ihrer neuen WebApp</h1>\n<div id='app'></div>\n<script>// Hier könnte Ihr Frontend-Code stehen</script>\n</body>\n</html>"""
+_ARGPARSE_MAIN_PY = """#!/usr/bin/env python3\nimport argparse\n\ndef main():\n    parser = argparse.ArgumentParser(description='CLI Tool')\n    parser.add_argument('--name', help='Ihr Name')\n    args = parser.parse_args()\n    if args.name:\n        print(f'Hallo {args.name}!')\n    else:\n        print('Hallo Welt!')\n\nif __name__ == '__main__':\n    main()\n"""
+_PIPELINE_MAIN_PY = """#!/usr/bin/env python3\n\ndef extract():\n    # Daten extrahieren\n    return []\n\ndef transform(data):\n    # Daten transformieren\n    return data\n\ndef load(data):\n    # Daten laden\n    pass\n\ndef main():\n    data = extract()\n    transformed = transform(data)\n    load(transformed)\n\nif __name__ == '__main__':\n    main()\n"""
+_SERVICE_PY = """#!/usr/bin/env python3\n\n# Dies ist ein Platzhalter für Ihren ersten Microservice.\n# Verwenden Sie Flask, FastAPI oder ein anderes Framework zur Implementierung.\n\n"""
+
+# Template → Liste von (relativer Pfad, UTF‑8‑Inhalt); die Inhalte werden einmal
+# beim Import kodiert. Verzeichnisse entstehen beim Schreiben.
+_TEMPLATE_FILES: Dict[str, List[Tuple[str, bytes]]] = {
+    name: [(rel, content.encode("utf-8")) for rel, content in files]
+    for name, files in {
+        "webapp": [
+            ("src/backend/app.py", _FLASK_APP_PY),
+            ("src/frontend/index.html", _INDEX_HTML),
+        ],
+        "cli-tool": [("src/cli_tool/main.py", _ARGPARSE_MAIN_PY)],
+        "datapipeline": [("src/pipeline/main.py", _PIPELINE_MAIN_PY)],
+        "microservices": [("src/services/service1.py", _SERVICE_PY)],
+    }.items()
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectContext:
+    """Einmalig in ``create_project_async`` abgeleitete Angaben zu einem Projekt."""
+
+    slug: str
+    path: Path
+    idea: str
+    # Gekürzte Idee für die OpenRouter‑Prompts (siehe optimize_prompt)
+    optimized: str
+    # Template in Kleinbuchstaben oder None
+    template: Optional[str]
+
 
 class ProjectManager:
     """
@@ -19,211 +104,376 @@ class ProjectManager:
         self.cli = cli
         # Stelle sicher, dass das Basisverzeichnis existiert
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        # Cache für bereits generierte OpenRouter‑Dokumente
+        self.doc_cache_dir = self.base_dir / ".doc_cache"
+        # Wiederverwendeter OpenRouter‑Client (hält die HTTPS‑Verbindungen offen)
+        self._client: Optional[OpenRouterClient] = None
+        # OpenRouter‑Einstellungen einmalig aus der Umgebung übernehmen
+        self.refresh_openrouter_settings()
+        # Zeitpunkt (monotonic) der letzten Fehlerabfrage im Memory
+        self._last_error_check = 0.0
+        # mtime_ns der Memory‑Dateien bei der letzten Fehlerabfrage
+        self._last_memory_probe: Optional[Tuple[Optional[int], ...]] = None
+
+    def project_dirs(self) -> List[Path]:
+        """Liefert alle Projektordner (ohne versteckte Verzeichnisse wie den Dokument‑Cache)."""
+        return sorted(p for p in self.base_dir.glob("*") if p.is_dir() and not p.name.startswith("."))
 
     @staticmethod
     def slugify(name: str) -> str:
         """Konvertiert einen Satz in einen slug‐ähnlichen Verzeichnisnamen."""
-        import re
-        slug = name.lower()
-        slug = re.sub(r"[^a-z0-9-]+", "-", slug)
-        slug = re.sub(r"-+", "-", slug).strip("-")
+        slug = _SLUG_DASHES.sub("-", _SLUG_NONALNUM.sub("-", name.lower())).strip("-")
         return slug or "projekt"
 
-    def create_project(self, idea: str, template: Optional[str] = None) -> Path:
+    def create_project(self, idea: str, template: Optional[str] = None, force: bool = False) -> Path:
+        """
+        Synchrone Variante von ``create_project_async``. Läuft bereits eine
+        Event‑Loop in diesem Thread (z. B. in der prompt_toolkit‑TUI), wird die
+        Coroutine in einem eigenen Thread ausgeführt.
+        """
+        coro = self.create_project_async(idea, template, force)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+        with ThreadPoolExecutor(max_workers=1) as ex:
+            return ex.submit(asyncio.run, coro).result()
+
+    async def create_project_async(self, idea: str, template: Optional[str] = None, force: bool = False) -> Path:
         """
         Erstellt ein neues Projektverzeichnis, generiert Dokumente über OpenRouter
         (Konzept, Requirements, Design, Testing) und orchestriert anschließend
         einen vollständigen SPARC- und SDLC-Workflow. Optionale Templates
         bestimmen zusätzliche SPARC-Modi. Bei Abwesenheit eines OpenRouter-Tokens
-        werden nur lokale Strukturen angelegt.
+        werden nur lokale Strukturen angelegt. Dokumentgenerierung und
+        Claude‑Flow‑Workflow sind voneinander unabhängig und laufen überlappend
+        in Worker‑Threads.
+
+        Ein erfolgreich erstelltes Projekt wird mit ``.flo_complete`` markiert;
+        ein erneuter Aufruf mit gleicher Idee, gleichem Template und gleicher
+        Dokumenterwartung (OpenRouter‑Token vorhanden oder nicht) kehrt dann
+        sofort zurück, sofern nicht ``force`` gesetzt ist. Die Markierung wird
+        nur geschrieben, wenn alle claude‑flow‑Befehle des Workflows gelungen
+        sind und – bei gesetztem Token – jedes Dokument aus ``_DOCS`` mit echtem
+        Inhalt vorliegt.
         """
-        # Optimierte Idee: Versuche, die Eingabe zu verkürzen, um Tokens zu sparen
-        optimized_idea = self.optimize_prompt(idea)
         slug = self.slugify(idea)
         project_path = self.base_dir / slug
-        if project_path.exists():
-            print(f"[ProjectManager] Projektordner {project_path} existiert bereits. Dateien können überschrieben werden.")
-        else:
-            project_path.mkdir(parents=True, exist_ok=True)
-        print(f"[ProjectManager] Lege Projektordner {project_path} an …")
+        tmpl = template.lower() if template else None
+        marker = project_path / _COMPLETE_MARKER
+        docs_expected = bool(self._or_token)
+        fingerprint = hashlib.sha256(f"{idea}\0{tmpl or ''}\0{int(docs_expected)}".encode("utf-8")).hexdigest()
+        if not force:
+            try:
+                if marker.read_text(encoding="utf-8") == fingerprint:
+                    logger.info("[ProjectManager] Projekt %s ist bereits vollständig erstellt – übersprungen.", project_path)
+                    return project_path
+            except FileNotFoundError:
+                pass
+
+        # Slug, Pfad, optimierte Idee (verkürzt, um Tokens zu sparen) und
+        # Template einmal festhalten und an alle Schritte weiterreichen
+        ctx = ProjectContext(slug, project_path, idea, self.optimize_prompt(idea), tmpl)
+        # Ein einziges mkdir entscheidet, ob der Ordner neu ist; nur bestehende
+        # Ordner müssen auf ein vorhandenes .hive-mind geprüft werden
+        try:
+            project_path.mkdir(parents=True)
+            hive_ready = False
+        except FileExistsError:
+            logger.info("[ProjectManager] Projektordner %s existiert bereits. Dateien können überschrieben werden.", project_path)
+            hive_ready = (project_path / ".hive-mind").is_dir()
+        logger.info("[ProjectManager] Lege Projektordner %s an …", project_path)
 
         # Instanziiere OpenRouterClient, wenn Token vorhanden
-        client: Optional[OpenRouterClient] = None
-        if os.environ.get("OPENROUTER_TOKEN"):
-            client = OpenRouterClient(
-                os.environ["OPENROUTER_TOKEN"],
-                os.environ.get("OPENROUTER_MODEL", "qwen/qwen3-coder:free"),
-            )
-        else:
-            print("[ProjectManager] Kein OpenRouter‑Token gefunden – Konzepte können nicht automatisch generiert werden.")
+        client = self._get_client()
+        if client is None:
+            logger.warning("[ProjectManager] Kein OpenRouter‑Token gefunden – Konzepte können nicht automatisch generiert werden.")
+
+        # Verzeichnisstruktur und Beispiel‑Quellcode je nach Template
+        self._apply_template(ctx)
 
-        # Konzept und weitere Dokumente generieren
+        # Konzept und weitere Dokumente (Cache, Sammel‑Request, Einzelabrufe)
+        # parallel zum Claude‑Flow‑Workflow erzeugen und speichern
+        steps = [asyncio.to_thread(self._run_project_workflow, ctx, hive_ready)]
         if client:
-            try:
-                concept_text = client.generate_document(optimized_idea, "concept")
-                concept_file = project_path / "concept.md"
-                concept_file.write_text(concept_text, encoding="utf-8")
-                print(f"[ProjectManager] Konzept in {concept_file} gespeichert.")
-                # Requirements
-                req_doc = client.generate_document(optimized_idea, "requirements")
-                req_file = project_path / "requirements.md"
-                req_file.write_text(req_doc, encoding="utf-8")
-                print(f"[ProjectManager] Requirements in {req_file} gespeichert.")
-                # Design
-                design_doc = client.generate_document(optimized_idea, "design")
-                design_file = project_path / "design.md"
-                design_file.write_text(design_doc, encoding="utf-8")
-                print(f"[ProjectManager] Design in {design_file} gespeichert.")
-                # Testing
-                test_doc = client.generate_document(optimized_idea, "testing")
-                test_file = project_path / "testing.md"
-                test_file.write_text(test_doc, encoding="utf-8")
-                print(f"[ProjectManager] Testplan in {test_file} gespeichert.")
-            except Exception as e:
-                print(f"[ProjectManager] OpenRouter‑Dokumente konnten nicht generiert werden: {e}")
-
-        # Erstelle zusätzliche Verzeichnisstruktur je nach Template
-        self._create_additional_dirs(project_path, template)
-
-        # Generiere Beispiel‑Quellcode für bestimmte Templates
-        self._generate_skeleton_code(project_path, template)
+            steps.append(self._generate_and_write_docs(client, ctx))
+        results = await asyncio.gather(*steps)
+        if all(results):
+            marker.write_text(fingerprint, encoding="utf-8")
+        else:
+            # Unvollständig: ein späterer Aufruf (z. B. mit Token oder Netz) holt das Fehlende nach
+            marker.unlink(missing_ok=True)
+            logger.warning("[ProjectManager] Projekt %s ist unvollständig – es wird beim nächsten Aufruf erneut erstellt.", project_path)
+        return project_path
 
+    async def _generate_and_write_docs(self, client: OpenRouterClient, ctx: ProjectContext) -> bool:
+        """
+        Generiert die Dokumente und schreibt sie gleichzeitig in das
+        Projektverzeichnis. Liefert ``True``, wenn danach jedes Dokument aus
+        ``_DOCS`` mit echtem Inhalt (kein Platzhalter) vorliegt.
+        """
+        project_path = ctx.path
+        docs = await asyncio.to_thread(self._generate_documents, client, ctx.optimized, project_path)
+        labels = dict(_DOCS)
+        await asyncio.gather(*(
+            asyncio.to_thread(self._write_doc, project_path / f"{kind}.md", text, labels[kind])
+            for kind, text in docs.items()
+        ))
+        return all(self._doc_complete(client, ctx, kind) for kind, _label in _DOCS)
+
+    @staticmethod
+    def _doc_complete(client: OpenRouterClient, ctx: ProjectContext, kind: str) -> bool:
+        try:
+            text = (ctx.path / f"{kind}.md").read_text(encoding="utf-8")
+        except OSError:
+            return False
+        return bool(text.strip()) and text != client.placeholder(ctx.optimized, kind)
+
+    @staticmethod
+    def _write_doc(doc_file: Path, text: str, label: str) -> None:
+        """Schreibt ein generiertes Dokument (läuft im Writer‑Thread)."""
+        try:
+            doc_file.write_text(text, encoding="utf-8")
+            logger.info("[ProjectManager] %s in %s gespeichert.", label, doc_file)
+        except OSError as e:
+            logger.error("[ProjectManager] %s konnte nicht gespeichert werden: %s", label, e)
+
+    def _run_project_workflow(self, ctx: ProjectContext, hive_ready: bool = False) -> bool:
+        """
+        Initialisiert Claude‑Flow und führt SPARC‑, SDLC‑ und Template‑Schritte
+        aus. Liefert ``True``, wenn keiner dieser claude‑flow‑Befehle
+        fehlgeschlagen oder abgebrochen ist (die anschließende Überwachung
+        zählt nicht dazu).
+        """
+        failed_before = self.cli.failed_commands
         # Initialisiere neues Claude‑Flow‑Projekt nur, wenn noch kein .hive-mind Verzeichnis existiert
-        if not (project_path / ".hive-mind").exists():
-            self.cli.init(project_name=slug, hive_mind=True, neural_enhanced=True)
+        if not hive_ready:
+            self.cli.init(project_name=ctx.slug, hive_mind=True, neural_enhanced=True)
         else:
-            print(f"[ProjectManager] Hive‑Mind bereits initialisiert in {project_path} – init wird übersprungen.")
+            logger.info("[ProjectManager] Hive‑Mind bereits initialisiert in %s – init wird übersprungen.", ctx.path)
 
-        # Starte SPARC‑Workflow (vereinfacht) und SDLC
-        feature_desc = idea
-        print(f"[ProjectManager] Starte SPARC‑Workflow für '{feature_desc}' …")
+        # Starte SPARC‑Workflow (vereinfacht) und SDLC mit der vollständigen Idee
+        feature_desc = ctx.idea
+        logger.info("[ProjectManager] Starte SPARC‑Workflow für '%s' …", feature_desc)
         self.cli.sparc_full_workflow(feature_desc)
         self.run_sdlc_workflow(feature_desc)
 
         # Zusätzliche Schritte je nach Template
-        if template:
-            tmpl = template.lower()
-            print(f"[ProjectManager] Wende Template '{tmpl}' an …")
-            if tmpl == "agile":
-                self.cli.sparc_run("agile", f"plan and implement {feature_desc}", parallel=True, batch_optimize=True)
-            elif tmpl == "ddd":
-                self.cli.sparc_run("ddd", f"model domain for {feature_desc}", parallel=True)
-                self.cli.sparc_run("architecture", f"refine architecture for {feature_desc}", parallel=True)
-            elif tmpl == "highperformance":
-                self.cli.sparc_run("performance", f"optimize performance for {feature_desc}", parallel=True)
-                self.cli.sparc_run("testing", f"load test {feature_desc}", parallel=True)
-            elif tmpl == "cicd":
-                self.cli.sparc_run("ci-cd", f"build, test, and deploy {feature_desc}", parallel=True)
-                print("[ProjectManager] Starte CI/CD‑Workflow: Erzeuge Release und verwalte Pull‑Requests …")
-                version_tag = "0.1.0"
-                self.cli.github_release_coord(version_tag, auto_changelog=True)
-                self.cli.github_pr_manage(reviewers=None, ai_powered=True)
-            elif tmpl == "webapp":
-                # WebApp: API‑Design und Frontend/Backend Separation
-                self.cli.sparc_run("api-design", f"design REST API for {feature_desc}", parallel=True)
-                self.cli.sparc_run("frontend", f"create frontend for {feature_desc}", parallel=True)
-                self.cli.sparc_run("backend", f"create backend for {feature_desc}", parallel=True)
-            elif tmpl == "cli-tool":
-                self.cli.sparc_run("cli-tool", f"implement CLI tool for {feature_desc}", parallel=True)
-            elif tmpl == "datapipeline":
-                self.cli.sparc_run("data-pipeline", f"build data pipeline for {feature_desc}", parallel=True)
-            elif tmpl == "microservices":
-                self.cli.sparc_run("microservices-split", f"split {feature_desc} into microservices", parallel=True)
+        tmpl = ctx.template
+        if tmpl:
+            logger.info("[ProjectManager] Wende Template '%s' an …", tmpl)
+            step = self._TEMPLATE_STEPS.get(tmpl)
+            if step is None:
+                logger.warning("[ProjectManager] Unbekanntes Template '%s'. Es werden keine zusätzlichen Schritte ausgeführt.", tmpl)
             else:
-                print(f"[ProjectManager] Unbekanntes Template '{template}'. Es werden keine zusätzlichen Schritte ausgeführt.")
+                step(self, feature_desc)
+
+        succeeded = self.cli.failed_commands == failed_before
 
         # Überwachung und Selbstheilung (theoretisch)
         try:
             dummy_session_id = "session-placeholder"
             self.monitor_and_self_heal(dummy_session_id)
         except Exception as e:
-            print(f"[ProjectManager] Fehler bei der Überwachung des Projekts: {e}")
-        return project_path
+            logger.error("[ProjectManager] Fehler bei der Überwachung des Projekts: %s", e)
+        return succeeded
+
+    # ------------------------------------------------------------------
+    # Zusätzliche Schritte je Template (siehe _TEMPLATE_STEPS)
+    def _template_agile(self, feature_desc: str) -> None:
+        self.cli.sparc_run("agile", f"plan and implement {feature_desc}", parallel=True, batch_optimize=True)
+
+    def _template_ddd(self, feature_desc: str) -> None:
+        # Domänenmodell vor Architektur – bleibt sequenziell
+        self.cli.run_chain([
+            self.cli.sparc_run_args("ddd", f"model domain for {feature_desc}", parallel=True),
+            self.cli.sparc_run_args("architecture", f"refine architecture for {feature_desc}", parallel=True),
+        ])
+
+    def _template_highperformance(self, feature_desc: str) -> None:
+        self._run_parallel([
+            lambda: self.cli.sparc_run("performance", f"optimize performance for {feature_desc}", parallel=True),
+            lambda: self.cli.sparc_run("testing", f"load test {feature_desc}", parallel=True),
+        ])
+
+    def _template_cicd(self, feature_desc: str) -> None:
+        self.cli.sparc_run("ci-cd", f"build, test, and deploy {feature_desc}", parallel=True)
+        logger.info("[ProjectManager] Starte CI/CD‑Workflow: Erzeuge Release und verwalte Pull‑Requests …")
+        version_tag = "0.1.0"
+        self.cli.github_release_coord(version_tag, auto_changelog=True)
+        self.cli.github_pr_manage(reviewers=None, ai_powered=True)
+
+    def _template_webapp(self, feature_desc: str) -> None:
+        # WebApp: API‑Design und Frontend/Backend Separation (voneinander unabhängig)
+        self._run_parallel([
+            lambda: self.cli.sparc_run("api-design", f"design REST API for {feature_desc}", parallel=True),
+            lambda: self.cli.sparc_run("frontend", f"create frontend for {feature_desc}", parallel=True),
+            lambda: self.cli.sparc_run("backend", f"create backend for {feature_desc}", parallel=True),
+        ])
 
-    def _create_additional_dirs(self, project_path: Path, template: Optional[str]) -> None:
+    def _template_cli_tool(self, feature_desc: str) -> None:
+        self.cli.sparc_run("cli-tool", f"implement CLI tool for {feature_desc}", parallel=True)
+
+    def _template_datapipeline(self, feature_desc: str) -> None:
+        self.cli.sparc_run("data-pipeline", f"build data pipeline for {feature_desc}", parallel=True)
+
+    def _template_microservices(self, feature_desc: str) -> None:
+        self.cli.sparc_run("microservices-split", f"split {feature_desc} into microservices", parallel=True)
+
+    _TEMPLATE_STEPS: Dict[str, Callable[["ProjectManager", str], None]] = {
+        "agile": _template_agile,
+        "ddd": _template_ddd,
+        "highperformance": _template_highperformance,
+        "cicd": _template_cicd,
+        "webapp": _template_webapp,
+        "cli-tool": _template_cli_tool,
+        "datapipeline": _template_datapipeline,
+        "microservices": _template_microservices,
+    }
+
+    @staticmethod
+    def _run_parallel(calls: List[Callable[[], None]]) -> None:
+        """Führt voneinander unabhängige CLI‑Aufrufe gleichzeitig aus und wartet auf alle."""
+        with ThreadPoolExecutor(max_workers=len(calls)) as ex:
+            # list() sorgt dafür, dass Ausnahmen der Aufrufe weitergereicht werden
+            list(ex.map(lambda call: call(), calls))
+
+    def refresh_openrouter_settings(self) -> None:
+        """
+        Liest ``OPENROUTER_TOKEN`` und ``OPENROUTER_MODEL`` erneut aus der Umgebung.
+        Muss aufgerufen werden, nachdem Token oder Modell zur Laufzeit geändert wurden;
+        die an claude‑flow vererbte Umgebung wird dabei ebenfalls neu aufgebaut.
         """
-        Erstellt Beispielverzeichnisse für verschiedene Templates. Dadurch erhalten
-        Projekte eine klare Struktur (z. B. src/, tests/) und erleichtern den
-        Einstieg für Entwickler. Diese Methode ist rein lokal und hat keine
-        Auswirkungen auf Claude‑Flow.
+        self._or_token = os.environ.get("OPENROUTER_TOKEN")
+        self._or_model = os.environ.get("OPENROUTER_MODEL", "qwen/qwen3-coder:free")
+        self.cli.invalidate_env()
+
+    def _get_client(self) -> Optional[OpenRouterClient]:
         """
-        (project_path / "src").mkdir(exist_ok=True)
-        (project_path / "tests").mkdir(exist_ok=True)
-        if template:
-            tmpl = template.lower()
-            if tmpl == "webapp":
-                (project_path / "src" / "frontend").mkdir(parents=True, exist_ok=True)
-                (project_path / "src" / "backend").mkdir(parents=True, exist_ok=True)
-            elif tmpl == "cli-tool":
-                # CLI‑Tools: src main file placeholder
-                (project_path / "src" / "cli_tool").mkdir(parents=True, exist_ok=True)
-            elif tmpl == "datapipeline":
-                (project_path / "src" / "pipeline").mkdir(parents=True, exist_ok=True)
-            elif tmpl == "microservices":
-                (project_path / "src" / "services").mkdir(parents=True, exist_ok=True)
-
-    def _generate_skeleton_code(self, project_path: Path, template: Optional[str]) -> None:
+        Liefert den OpenRouter‑Client oder ``None``, wenn kein Token gesetzt ist.
+        Der Client wird wiederverwendet, solange sich Token und Modell (siehe
+        ``refresh_openrouter_settings``) nicht ändern, damit Session und
+        Keep‑Alive‑Verbindungen erhalten bleiben.
+        """
+        token = self._or_token
+        if not token:
+            return None
+        model = self._or_model
+        client = self._client
+        if client is None or client.api_key != token or client.model != model:
+            # requests/urllib3 erst laden, wenn tatsächlich ein Client benötigt wird
+            from openrouter_client import OpenRouterClient
+
+            client = self._client = OpenRouterClient(token, model)
+        return client
+
+    def _generate_documents(self, client: OpenRouterClient, idea: str, project_path: Path) -> Dict[str, str]:
         """
-        Legt einfache Beispiel‑Dateien in den neu erstellten Verzeichnissen an, um
-        den Start zu erleichtern. Je nach Template werden unterschiedliche
-        Grundgerüste generiert (z. B. ein Flask‑Backend für WebApps oder ein
-        argparse‑CLI). Die Dateien enthalten nur Minimalgerüste und sollen von
-        Claude‑Flow später erweitert werden.
+        Liefert die noch zu schreibenden Dokumente aus ``_DOCS``. Bereits
+        zwischengespeicherte Dokumente werden aus dem Cache geladen; die übrigen
+        werden mit einem einzigen Sammel‑Request angefordert. Scheitert dieser,
+        werden die fehlenden Dokumente einzeln und parallel generiert und dabei
+        direkt nach ``project_path`` gestreamt – sie fehlen daher im Ergebnis,
+        ebenso wie fehlgeschlagene Dokumente.
         """
+        docs: Dict[str, str] = {}
+        missing: List[str] = []
+        for kind, _label in _DOCS:
+            cached = self._cache_lookup(client, idea, kind)
+            if cached is None:
+                missing.append(kind)
+            else:
+                logger.info("[ProjectManager] %s-Dokument aus dem Cache geladen.", kind)
+                docs[kind] = cached
+        if not missing:
+            return docs
+
+        batch = client.generate_documents(idea, missing)
+        if batch is not None:
+            for kind, text in batch.items():
+                self._cache_store(client, idea, kind, text)
+            docs.update(batch)
+            return docs
+
+        # Fallback: Einzelabrufe parallel, jeweils direkt in die Zieldatei
+        # gestreamt; ein fehlgeschlagenes Dokument blockiert die übrigen nicht.
+        labels = dict(_DOCS)
+        with ThreadPoolExecutor(max_workers=len(missing)) as ex:
+            futures = {
+                ex.submit(self._stream_document, client, idea, kind, project_path / f"{kind}.md"): kind
+                for kind in missing
+            }
+            for future in as_completed(futures):
+                kind = futures[future]
+                try:
+                    text = future.result()
+                except Exception as e:
+                    logger.error("[ProjectManager] OpenRouter‑Dokument '%s' konnte nicht generiert werden: %s", kind, e)
+                    continue
+                logger.info("[ProjectManager] %s in %s gespeichert.", labels[kind], project_path / f"{kind}.md")
+                if text != client.placeholder(idea, kind):
+                    self._cache_store(client, idea, kind, text)
+        return docs
+
+    @staticmethod
+    def _stream_document(client: OpenRouterClient, idea: str, kind: str, doc_file: Path) -> str:
+        """Generiert ein Dokument und schreibt jeden Textteil sofort nach ``doc_file``."""
+        try:
+            with doc_file.open("w", encoding="utf-8") as fh:
+                text = client.generate_document(idea, kind, write_chunk=fh.write)
+                if text == client.placeholder(idea, kind):
+                    # Zeitüberschreitung: bereits empfangene Teile durch den Platzhalter ersetzen
+                    fh.seek(0)
+                    fh.truncate()
+                    fh.write(text)
+        except BaseException:
+            # Keine halb geschriebenen Dokumente zurücklassen
+            doc_file.unlink(missing_ok=True)
+            raise
+        return text
+
+    def _cache_path(self, client: OpenRouterClient, idea: str, kind: str) -> Path:
+        """Cache‑Datei eines Dokuments; Schlüssel ist der SHA‑256 aus Modell, Typ und Idee."""
+        key = hashlib.sha256(f"{client.model}\0{kind}\0{idea}".encode("utf-8")).hexdigest()
+        return self.doc_cache_dir / f"{key}.md"
+
+    def _cache_lookup(self, client: OpenRouterClient, idea: str, kind: str) -> Optional[str]:
+        try:
+            return self._cache_path(client, idea, kind).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    def _cache_store(self, client: OpenRouterClient, idea: str, kind: str, text: str) -> None:
+        cache_path = self._cache_path(client, idea, kind)
+        self.doc_cache_dir.mkdir(exist_ok=True)
+        tmp = cache_path.with_suffix(".tmp")
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, cache_path)
+
+    def _apply_template(self, ctx: ProjectContext) -> None:
+        """
+        Legt die Grundstruktur (src/, tests/) sowie die Beispiel‑Dateien des
+        Templates an (z. B. ein Flask‑Backend für WebApps oder ein argparse‑CLI).
+        Die Dateien enthalten nur Minimalgerüste und sollen von Claude‑Flow
+        später erweitert werden; vorhandene Dateien bleiben unverändert. Diese
+        Methode ist rein lokal und hat keine Auswirkungen auf Claude‑Flow.
+        """
+        # Einfache str‑Pfade über os.path statt Path‑Ketten je Datei
+        base = os.fspath(ctx.path)
         try:
-            if not template:
-                return
-            tmpl = template.lower()
-            # WebApp: Backend (Flask) und Frontend (HTML)
-            if tmpl == "webapp":
-                backend_dir = project_path / "src" / "backend"
-                backend_dir.mkdir(parents=True, exist_ok=True)
-                app_file = backend_dir / "app.py"
-                if not app_file.exists():
-                    app_file.write_text(
-                        """from flask import Flask, jsonify\n\napp = Flask(__name__)\n\n@app.route('/')\ndef index():\n    return jsonify({'message': 'Hello from backend!'})\n\nif __name__ == '__main__':\n    app.run(debug=True)\n""",
-                        encoding="utf-8",
-                    )
-                frontend_dir = project_path / "src" / "frontend"
-                frontend_dir.mkdir(parents=True, exist_ok=True)
-                index_html = frontend_dir / "index.html"
-                if not index_html.exists():
-                    index_html.write_text(
-                        """<!DOCTYPE html>\n<html lang='en'>\n<head><meta charset='UTF-8'><title>WebApp</title></head>\n<body>\n<h1>Willkommen bei Ihrer neuen WebApp</h1>\n<div id='app'></div>\n<script>// Hier könnte Ihr Frontend-Code stehen</script>\n</body>\n</html>""",
-                        encoding="utf-8",
-                    )
-            # CLI‑Tool: Einfacher argparse‑Stub
-            elif tmpl == "cli-tool":
-                cli_dir = project_path / "src" / "cli_tool"
-                cli_dir.mkdir(parents=True, exist_ok=True)
-                main_py = cli_dir / "main.py"
-                if not main_py.exists():
-                    main_py.write_text(
-                        """#!/usr/bin/env python3\nimport argparse\n\ndef main():\n    parser = argparse.ArgumentParser(description='CLI Tool')\n    parser.add_argument('--name', help='Ihr Name')\n    args = parser.parse_args()\n    if args.name:\n        print(f'Hallo {args.name}!')\n    else:\n        print('Hallo Welt!')\n\nif __name__ == '__main__':\n    main()\n""",
-                        encoding="utf-8",
-                    )
-            # DataPipeline: Pipeline‑Stub
-            elif tmpl == "datapipeline":
-                pipeline_dir = project_path / "src" / "pipeline"
-                pipeline_dir.mkdir(parents=True, exist_ok=True)
-                pipeline_main = pipeline_dir / "main.py"
-                if not pipeline_main.exists():
-                    pipeline_main.write_text(
-                        """#!/usr/bin/env python3\n\ndef extract():\n    # Daten extrahieren\n    return []\n\ndef transform(data):\n    # Daten transformieren\n    return data\n\ndef load(data):\n    # Daten laden\n    pass\n\ndef main():\n    data = extract()\n    transformed = transform(data)\n    load(transformed)\n\nif __name__ == '__main__':\n    main()\n""",
-                        encoding="utf-8",
-                    )
-            # Microservices: Platzhalter‑Service
-            elif tmpl == "microservices":
-                services_dir = project_path / "src" / "services"
-                services_dir.mkdir(parents=True, exist_ok=True)
-                service1 = services_dir / "service1.py"
-                if not service1.exists():
-                    service1.write_text(
-                        """#!/usr/bin/env python3\n\n# Dies ist ein Platzhalter für Ihren ersten Microservice.\n# Verwenden Sie Flask, FastAPI oder ein anderes Framework zur Implementierung.\n\n""",
-                        encoding="utf-8",
-                    )
+            os.makedirs(os.path.join(base, "src"), exist_ok=True)
+            os.makedirs(os.path.join(base, "tests"), exist_ok=True)
+            for rel, content in _TEMPLATE_FILES.get(ctx.template or "", ()):
+                target = os.path.join(base, rel)
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                # "x" schlägt fehl, wenn die Datei bereits existiert – kein separates stat()
+                try:
+                    with open(target, "xb") as fh:
+                        fh.write(content)
+                except FileExistsError:
+                    pass
         except Exception as e:
-            print(f"[ProjectManager] Fehler beim Generieren des Skelettcodes: {e}")
+            logger.error("[ProjectManager] Fehler beim Generieren des Skelettcodes: %s", e)
 
     def optimize_prompt(self, idea: str) -> str:
         """
@@ -233,13 +483,10 @@ class ProjectManager:
         optimierte Beschreibung wird an OpenRouter gesendet, wenn verfügbar.
         """
         # Hier könnten komplexere Algorithmen stehen; aktuell nur heuristische Kürzung
-        short = idea.strip()
-        # Entferne deutsche Füllwörter (beispielhaft)
-        for filler in ["einfach", "bitte", "erstelle", "baue", "erstellt", "erstellt", "erstellen"]:
-            short = short.replace(filler, "")
-        short = short.strip()
+        # Entferne deutsche Füllwörter (beispielhaft) in einem Durchlauf
+        short = _WS_RE.sub(" ", _FILLER_RE.sub("", idea)).strip()
         # Formuliere neue Anweisung
-        return f"Beschreibe diese Idee in 5 Stichpunkten: {short}"
+        return _PROMPT_PREFIX + short
 
     def monitor_and_self_heal(self, session_id: str) -> None:
         """Überwacht eine Hive‑Mind‑Session und führt bei Bedarf
@@ -252,18 +499,52 @@ class ProjectManager:
         keine echte Claude‑Flow‑Session läuft, dient die Implementierung nur
         als Demonstration.
         """
-        print(f"[ProjectManager] Überwache Session {session_id} auf Fehler …")
-        result = self.cli._run_capture(["memory", "query", "error", "--limit", "3"])
-        if result and "error" in result.lower():
-            print("[Monitor] Fehler gefunden – starte Fix-Swarm …")
+        logger.info("[ProjectManager] Überwache Session %s auf Fehler …", session_id)
+        errors = self._memory_has_errors()
+        if errors:
+            logger.warning("[Monitor] Fehler gefunden – starte Fix-Swarm …")
             self.cli.swarm("Fix detected errors", continue_session=True)
+        elif errors is None:
+            logger.info("[Monitor] Memory wurde eben erst geprüft – Abfrage übersprungen.")
         else:
-            print("[Monitor] Keine Fehler im Memory gefunden.")
+            logger.info("[Monitor] Keine Fehler im Memory gefunden.")
 
         # Optimierungs- und Retry-Mechanismen ausführen
         self.cli.fault_tolerance_retry()
         self.cli.bottleneck_auto_optimize()
-        print("[ProjectManager] Selbstheilung abgeschlossen.")
+        logger.info("[ProjectManager] Selbstheilung abgeschlossen.")
+
+    def _memory_has_errors(self) -> Optional[bool]:
+        """
+        Sucht im Memory nach dem Begriff ``error``. Gibt ``None`` zurück, wenn
+        innerhalb der letzten ``_ERROR_CHECK_INTERVAL`` Sekunden bereits geprüft
+        (und ggf. reagiert) wurde oder sich die Memory‑Dateien seit der letzten
+        Abfrage nicht geändert haben – so startet jede Abfrage höchstens einen
+        claude‑flow‑Prozess pro Intervall und nur bei neuem Speicherinhalt.
+        Existiert keine der Memory‑Dateien, greift nur das Zeitintervall.
+        """
+        probe = self._memory_signature()
+        # Ohne bekannte Memory‑Datei sagt die Signatur nichts über Änderungen aus
+        if probe == self._last_memory_probe and any(m is not None for m in probe):
+            return None
+        now = time.monotonic()
+        if now - self._last_error_check < _ERROR_CHECK_INTERVAL:
+            return None
+        self._last_error_check = now
+        result = self.cli._run_capture(["memory", "query", "error", "--limit", "3"])
+        self._last_memory_probe = self._memory_signature()
+        return bool(result) and _ERROR_RE.search(result) is not None
+
+    def _memory_signature(self) -> Tuple[Optional[int], ...]:
+        """``mtime_ns`` der bekannten Memory‑Dateien (``None`` für fehlende)."""
+        base = self.cli.working_dir
+        signature: List[Optional[int]] = []
+        for rel in _MEMORY_STORES:
+            try:
+                signature.append((base / rel).stat().st_mtime_ns)
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
 
     def run_sdlc_workflow(self, feature_desc: str) -> None:
         """
@@ -273,28 +554,25 @@ class ProjectManager:
         ihre Agenten zu koordinieren. Diese Implementierung dient als Vorlage
         und basiert auf den gängigen SDLC‑Phasen【456026676161703†L164-L326】.
         """
-        # Requirements‑Phase: Verwende das generierte Requirements‑Dokument als Kontext
-        print("[SDLC] Starte Requirements‑Analyse …")
-        self.cli.sparc_run("spec-pseudocode", f"Analyse requirements for {feature_desc}", parallel=True)
-        self.auto_correct()
-        # Design‑Phase: Erstelle Architektur und Komponenten
-        print("[SDLC] Starte Designphase …")
-        self.cli.sparc_run("architect", f"Design architecture for {feature_desc}", parallel=True)
-        self.auto_correct()
-        # Development‑Phase: Implementiere das Feature (TDD)
-        print("[SDLC] Starte Implementierungsphase …")
-        self.cli.sparc_tdd(f"implement {feature_desc}", batch_tdd=True)
-        self.auto_correct()
-        # Testing‑Phase: Führe zusätzliche Tests durch
-        print("[SDLC] Starte Testphase …")
-        self.cli.sparc_run("testing", f"Run tests for {feature_desc}", parallel=True)
-        self.auto_correct()
-        # Deployment‑Phase: Automatisiere Deployment/Release
-        print("[SDLC] Starte Deploymentphase …")
-        # Release mit Versionsnummer 0.1.0 (kann angepasst werden)
-        self.cli.github_release_coord("0.1.0", auto_changelog=True)
-        # Optional: Trigger CI/CD Workflow
-        self.cli.sparc_run("ci-cd", f"deploy {feature_desc}", parallel=True)
+        # Alle Phasen werden gesammelt und in einem Shell‑Aufruf ausgeführt;
+        # die automatische Korrektur läuft anschließend einmal.
+        cli = self.cli
+        logger.info("[SDLC] Starte Requirements‑, Design‑, Implementierungs‑, Test‑ und Deploymentphase …")
+        phases = [
+            # Requirements‑Phase: Verwende das generierte Requirements‑Dokument als Kontext
+            cli.sparc_run_args("spec-pseudocode", f"Analyse requirements for {feature_desc}", parallel=True),
+            # Design‑Phase: Erstelle Architektur und Komponenten
+            cli.sparc_run_args("architect", f"Design architecture for {feature_desc}", parallel=True),
+            # Development‑Phase: Implementiere das Feature (TDD)
+            cli.sparc_tdd_args(f"implement {feature_desc}", batch_tdd=True),
+            # Testing‑Phase: Führe zusätzliche Tests durch
+            cli.sparc_run_args("testing", f"Run tests for {feature_desc}", parallel=True),
+            # Deployment‑Phase: Release mit Versionsnummer 0.1.0 (kann angepasst werden)
+            cli.github_release_coord_args("0.1.0", auto_changelog=True),
+            # Optional: Trigger CI/CD Workflow
+            cli.sparc_run_args("ci-cd", f"deploy {feature_desc}", parallel=True),
+        ]
+        cli.run_chain(phases)
         self.auto_correct()
 
     def infer_template(self, idea: str) -> Optional[str]:
@@ -304,15 +582,12 @@ class ProjectManager:
         'konsole' das 'CLI‑Tool', bei 'data' oder 'pipeline' 'DataPipeline',
         bei 'microservice' 'Microservices'. Ansonsten wird None zurückgegeben.
         """
-        text = idea.lower()
-        if any(x in text for x in ["web", "frontend", "backend"]):
-            return "WebApp"
-        if any(x in text for x in ["cli", "konsole", "terminal"]):
-            return "CLI-Tool"
-        if any(x in text for x in ["data", "pipeline"]):
-            return "DataPipeline"
-        if "microservice" in text or "microservices" in text:
-            return "Microservices"
+        # Ein Durchlauf über den Text; bei mehreren Treffern gilt die Priorität
+        # WebApp vor CLI vor DataPipeline vor Microservices.
+        found = {m.lastgroup for m in _TEMPLATE_RE.finditer(idea)}
+        for group, name in _TEMPLATE_NAMES.items():
+            if group in found:
+                return name
         return None
 
     def auto_correct(self) -> None:
@@ -322,12 +597,11 @@ class ProjectManager:
         --continue-session, sodass der aktuelle Kontext erhalten bleibt.
         """
         try:
-            result = self.cli._run_capture(["memory", "query", "error", "--limit", "1"])
-            if result and "error" in result.lower():
-                print("[AutoCorrect] Fehler im Speicher gefunden – starte Fix‑Swarm …")
+            if self._memory_has_errors():
+                logger.warning("[AutoCorrect] Fehler im Speicher gefunden – starte Fix‑Swarm …")
                 self.cli.swarm("Fix detected errors", continue_session=True)
         except Exception as e:
-            print(f"[AutoCorrect] Fehler bei der automatischen Korrektur: {e}")
+            logger.error("[AutoCorrect] Fehler bei der automatischen Korrektur: %s", e)
 
 
-__all__ = ["ProjectManager"]
+__all__ = ["ProjectContext", "ProjectManager"]
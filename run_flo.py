@@ -33,7 +33,8 @@ ensure_package("prompt_toolkit")
 
 from contextlib import redirect_stdout
 from pathlib import Path
-from typing import List, Optional
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
 
 from prompt_toolkit.application import Application, run_in_terminal
 from prompt_toolkit.key_binding import KeyBindings
@@ -79,7 +80,7 @@ class ProjectManagerTUI:
                 template = input_dialog(title="Template", text="Template (optional):").run()
                 self.pm.create_project(idea, template or None)
             elif choice == "list":
-                projects = sorted(p.name for p in self.pm.base_dir.glob("*") if p.is_dir())
+                projects = [p.name for p in self.pm.project_dirs()]
                 msg = "No projects found" if not projects else "\n".join(projects)
                 message_dialog(title="Projects", text=msg).run()
             elif choice == "monitor":
@@ -107,13 +108,8 @@ class ProjectManagerTUI:
             os.environ["OPENROUTER_TOKEN"] = open_token
         if model:
             os.environ["OPENROUTER_MODEL"] = model
-        with open(".env", "w", encoding="utf-8") as f:
-            if os.environ.get("GIT_TOKEN"):
-                f.write(f"GIT_TOKEN={os.environ['GIT_TOKEN']}\n")
-            if os.environ.get("OPENROUTER_TOKEN"):
-                f.write(f"OPENROUTER_TOKEN={os.environ['OPENROUTER_TOKEN']}\n")
-            if os.environ.get("OPENROUTER_MODEL"):
-                f.write(f"OPENROUTER_MODEL={os.environ['OPENROUTER_MODEL']}\n")
+        self.pm.refresh_openrouter_settings()
+        SetupManager.write_env_file(SetupManager.env_tokens_content())
         message_dialog(title="Config", text="Tokens saved").run()
 
     def manage_quick_commands(self) -> None:
@@ -161,7 +157,7 @@ class ProjectManagerTUI:
             else:
                 break
 
-from parser_builder import build_parser
+from parser_builder import build_parser, fast_dispatch, parse_args
 
 
 class FloTUI:
@@ -282,13 +278,8 @@ class FloTUI:
             os.environ["OPENROUTER_TOKEN"] = open_token
         if model:
             os.environ["OPENROUTER_MODEL"] = model
-        with open(".env", "w", encoding="utf-8") as f:
-            if os.environ.get("GIT_TOKEN"):
-                f.write(f"GIT_TOKEN={os.environ['GIT_TOKEN']}\n")
-            if os.environ.get("OPENROUTER_TOKEN"):
-                f.write(f"OPENROUTER_TOKEN={os.environ['OPENROUTER_TOKEN']}\n")
-            if os.environ.get("OPENROUTER_MODEL"):
-                f.write(f"OPENROUTER_MODEL={os.environ['OPENROUTER_MODEL']}\n")
+        self.pm.refresh_openrouter_settings()
+        SetupManager.write_env_file(SetupManager.env_tokens_content())
         message_dialog(title="Config", text="Tokens saved").run()
 
     def show_monitoring(self) -> None:
@@ -325,7 +316,7 @@ class FloTUI:
         self._run_task(self.pm.create_project, idea, template or None)
 
     def list_projects(self) -> None:
-        projects = sorted(p.name for p in self.pm.base_dir.glob("*") if p.is_dir())
+        projects = [p.name for p in self.pm.project_dirs()]
         if not projects:
             message_dialog(title="Projects", text="No projects found").run()
         else:
@@ -426,212 +417,148 @@ class FloTUI:
 # ----------------------------------------------------------------------
 # Legacy CLI fallback
 
+def _cmd_new_project(cli: ClaudeFlowCLI, args: Any) -> None:
+    base_dir = Path(args.base_dir).expanduser().resolve()
+    pm = ProjectManager(base_dir, cli)
+    pm.create_project(args.idea, template=args.template)
+
+
+def _cmd_manager(cli: ClaudeFlowCLI, args: Any) -> None:
+    base_dir = Path("projects").expanduser().resolve()
+    pm = ProjectManager(base_dir, cli)
+    menu = ProjectManagerMenu(pm)
+    menu.run()
+
+
+# Befehlsname → Handler(cli, args). Ersetzt die frühere elif‑Kette durch einen
+# einzigen Dictionary‑Zugriff.
+COMMAND_DISPATCH: Dict[str, Callable[[ClaudeFlowCLI, Any], None]] = {
+    "init": lambda cli, args: cli.init(args.project_name, args.hive_mind, args.neural_enhanced),
+    "spawn": lambda cli, args: cli.hive_spawn(args.description, args.namespace, args.agents, args.temp),
+    "resume": lambda cli, args: cli.hive_resume(args.session_id),
+    "status": lambda cli, args: cli.hive_status(),
+    "sessions": lambda cli, args: cli.hive_sessions(),
+    "swarm": lambda cli, args: cli.swarm(args.task, args.continue_session, args.strategy),
+    "memory-stats": lambda cli, args: cli.memory_stats(),
+    "memory-query": lambda cli, args: cli.memory_query(args.term, args.namespace, args.limit),
+    "memory-store": lambda cli, args: cli.memory_store(args.key, args.value, args.namespace),
+    "memory-export": lambda cli, args: cli.memory_export(args.output_file, args.namespace),
+    "memory-import": lambda cli, args: cli.memory_import(args.input_file, args.namespace),
+    "neural-train": lambda cli, args: cli.neural_train(args.pattern, args.epochs, args.data),
+    "neural-predict": lambda cli, args: cli.neural_predict(args.model, args.input_file),
+    "cognitive-analyze": lambda cli, args: cli.cognitive_analyze(args.behavior),
+    "workflow-create": lambda cli, args: cli.workflow_create(args.name, args.parallel),
+    "batch-process": lambda cli, args: cli.batch_process(args.items, args.concurrent),
+    "pipeline-create": lambda cli, args: cli.pipeline_create(args.config_file),
+    "github": lambda cli, args: cli.github_mode(args.mode, args.args),
+    "daa-create": lambda cli, args: cli.daa_agent_create(
+        args.agent_type,
+        args.capabilities,
+        args.resources,
+        args.security_level,
+        args.sandbox,
+    ),
+    "daa-match": lambda cli, args: cli.daa_capability_match(args.task_requirements),
+    "daa-lifecycle": lambda cli, args: cli.daa_lifecycle_manage(args.agent_id, args.action),
+    "security-scan": lambda cli, args: cli.security_scan(args.deep, args.report),
+    "security-metrics": lambda cli, args: cli.security_metrics(args.last),
+    "security-audit": lambda cli, args: cli.security_audit(args.full_trace),
+    "swarm-init": lambda cli, args: cli.swarm_init(args.description),
+    "agent-spawn": lambda cli, args: cli.agent_spawn(args.agent_type, args.capabilities, args.resources),
+    "task-orchestrate": lambda cli, args: cli.task_orchestrate(args.task_description),
+    "swarm-monitor": lambda cli, args: cli.swarm_monitor(args.dashboard, args.real_time),
+    "topology-optimize": lambda cli, args: cli.topology_optimize(),
+    "load-balance": lambda cli, args: cli.load_balance(),
+    "coordination-sync": lambda cli, args: cli.coordination_sync(),
+    "swarm-scale": lambda cli, args: cli.swarm_scale(args.scale),
+    "swarm-destroy": lambda cli, args: cli.swarm_destroy(),
+    "pattern-recognize": lambda cli, args: cli.pattern_recognize(args.pattern, args.input_file),
+    "learning-adapt": lambda cli, args: cli.learning_adapt(args.model, args.data),
+    "neural-compress": lambda cli, args: cli.neural_compress(args.model, args.output),
+    "ensemble-create": lambda cli, args: cli.ensemble_create(args.models, args.output_model),
+    "transfer-learn": lambda cli, args: cli.transfer_learn(args.base_model, args.new_data),
+    "neural-explain": lambda cli, args: cli.neural_explain(args.model, args.input_file),
+    "memory-usage": lambda cli, args: cli.memory_usage(),
+    "memory-search": lambda cli, args: cli.memory_search(args.term, args.namespace),
+    "memory-persist": lambda cli, args: cli.memory_persist(),
+    "memory-namespace": lambda cli, args: cli.memory_namespace(args.namespace),
+    "memory-backup": lambda cli, args: cli.memory_backup(args.output_file),
+    "memory-restore": lambda cli, args: cli.memory_restore(args.input_file),
+    "memory-compress": lambda cli, args: cli.memory_compress(),
+    "memory-sync": lambda cli, args: cli.memory_sync(),
+    "memory-analytics": lambda cli, args: cli.memory_analytics(),
+    "performance-report": lambda cli, args: cli.performance_report(),
+    "bottleneck-analyze": lambda cli, args: cli.bottleneck_analyze(),
+    "token-usage": lambda cli, args: cli.token_usage(),
+    "benchmark-run": lambda cli, args: cli.benchmark_run(args.benchmark_name),
+    "metrics-collect": lambda cli, args: cli.metrics_collect(),
+    "trend-analysis": lambda cli, args: cli.trend_analysis(),
+    "health-check": lambda cli, args: cli.health_check(args.components),
+    "diagnostic-run": lambda cli, args: cli.diagnostic_run(),
+    "usage-stats": lambda cli, args: cli.usage_stats(),
+    "workflow-execute": lambda cli, args: cli.workflow_execute(args.name),
+    "workflow-export": lambda cli, args: cli.workflow_export(args.name, args.output_file),
+    "automation-setup": lambda cli, args: cli.automation_setup(args.config_file),
+    "scheduler-manage": lambda cli, args: cli.scheduler_manage(args.schedule_name, args.action),
+    "trigger-setup": lambda cli, args: cli.trigger_setup(args.trigger_name, args.target),
+    "parallel-execute": lambda cli, args: cli.parallel_execute(args.tasks),
+    "github-repo-analyze": lambda cli, args: cli.github_repo_analyze(args.analysis_type, args.target),
+    "github-pr-manage": lambda cli, args: cli.github_pr_manage(args.reviewers, args.ai_powered),
+    "github-issue-track": lambda cli, args: cli.github_issue_track(args.project),
+    "github-release-coord": lambda cli, args: cli.github_release_coord(args.version, args.auto_changelog),
+    "github-workflow-auto": lambda cli, args: cli.github_workflow_auto(args.file),
+    "github-code-review": lambda cli, args: cli.github_code_review(args.multi_reviewer, args.ai_powered),
+    "github-sync-coordinator": lambda cli, args: cli.github_sync_coordinator(args.multi_package),
+    "daa-resource-alloc": lambda cli, args: cli.daa_resource_alloc(args.agent_id, args.cpu, args.memory),
+    "daa-communication": lambda cli, args: cli.daa_communication(args.source, args.target, args.message),
+    "daa-consensus": lambda cli, args: cli.daa_consensus(args.proposal),
+    "backup-create": lambda cli, args: cli.backup_create(args.output_file),
+    "restore-system": lambda cli, args: cli.restore_system(args.backup_file),
+    "config-manage": lambda cli, args: cli.config_manage(args.operation, args.file),
+    "features-detect": lambda cli, args: cli.features_detect(),
+    "log-analysis": lambda cli, args: cli.log_analysis(args.log_file),
+    "hook": lambda cli, args: cli.hook(args.hook_name, args.params),
+    "fix-hook-variables": lambda cli, args: cli.fix_hook_variables(args.target, args.test),
+    "sparc-modes": lambda cli, args: cli.sparc_modes(),
+    "sparc-run": lambda cli, args: cli.sparc_run(args.mode, args.task, args.parallel, args.batch_optimize),
+    "sparc-tdd": lambda cli, args: cli.sparc_tdd(args.feature, args.batch_tdd),
+    "sparc-info": lambda cli, args: cli.sparc_info(args.mode),
+    "sparc-batch": lambda cli, args: cli.sparc_batch(args.modes, args.task),
+    "sparc-pipeline": lambda cli, args: cli.sparc_pipeline(args.task),
+    "sparc-concurrent": lambda cli, args: cli.sparc_concurrent(args.mode, args.tasks_file),
+    "run-bg": lambda cli, args: cli.run_background(args.cli_args),
+    "sparc-full": lambda cli, args: cli.sparc_full_workflow(args.feature),
+    "new-project": _cmd_new_project,
+    "manager": _cmd_manager,
+}
+
+
 def run_cli(argv: Optional[List[str]] = None) -> None:
     SetupManager.setup_environment()
-    parser = build_parser()
-    args = parser.parse_args(argv)
+    if argv is None:
+        argv = sys.argv[1:]
+    fast = fast_dispatch(argv)
+    if fast is not None:
+        # Durchreich‑Befehle benötigen keinen argparse‑Lauf.
+        cmd, rest = fast
+        if cmd == "run-bg":
+            args = SimpleNamespace(command=cmd, cli_args=rest)
+        elif cmd == "github":
+            args = SimpleNamespace(command=cmd, mode=rest[0], args=rest[1:])
+        else:
+            args = SimpleNamespace(command=cmd, hook_name=rest[0], params=rest[1:])
+    else:
+        # argparse wird nur noch für Hilfe und Fehlermeldungen aufgebaut.
+        args = parse_args(argv)
     if not args.command:
-        parser.print_help()
+        build_parser(argv).print_help()
         return
 
-    cli = ClaudeFlowCLI(Path.cwd())
-
-    cmd = args.command
-    if cmd == "init":
-        cli.init(args.project_name, args.hive_mind, args.neural_enhanced)
-    elif cmd == "spawn":
-        cli.hive_spawn(args.description, args.namespace, args.agents, args.temp)
-    elif cmd == "resume":
-        cli.hive_resume(args.session_id)
-    elif cmd == "status":
-        cli.hive_status()
-    elif cmd == "sessions":
-        cli.hive_sessions()
-    elif cmd == "swarm":
-        cli.swarm(args.task, args.continue_session, args.strategy)
-    elif cmd == "memory-stats":
-        cli.memory_stats()
-    elif cmd == "memory-query":
-        cli.memory_query(args.term, args.namespace, args.limit)
-    elif cmd == "memory-store":
-        cli.memory_store(args.key, args.value, args.namespace)
-    elif cmd == "memory-export":
-        cli.memory_export(args.output_file, args.namespace)
-    elif cmd == "memory-import":
-        cli.memory_import(args.input_file, args.namespace)
-    elif cmd == "neural-train":
-        cli.neural_train(args.pattern, args.epochs, args.data)
-    elif cmd == "neural-predict":
-        cli.neural_predict(args.model, args.input_file)
-    elif cmd == "cognitive-analyze":
-        cli.cognitive_analyze(args.behavior)
-    elif cmd == "workflow-create":
-        cli.workflow_create(args.name, args.parallel)
-    elif cmd == "batch-process":
-        cli.batch_process(args.items, args.concurrent)
-    elif cmd == "pipeline-create":
-        cli.pipeline_create(args.config_file)
-    elif cmd == "github":
-        cli.github_mode(args.mode, args.args)
-    elif cmd == "daa-create":
-        cli.daa_agent_create(
-            args.agent_type,
-            args.capabilities,
-            args.resources,
-            args.security_level,
-            args.sandbox,
-        )
-    elif cmd == "daa-match":
-        cli.daa_capability_match(args.task_requirements)
-    elif cmd == "daa-lifecycle":
-        cli.daa_lifecycle_manage(args.agent_id, args.action)
-    elif cmd == "security-scan":
-        cli.security_scan(args.deep, args.report)
-    elif cmd == "security-metrics":
-        cli.security_metrics(args.last)
-    elif cmd == "security-audit":
-        cli.security_audit(args.full_trace)
-    elif cmd == "swarm-init":
-        cli.swarm_init(args.description)
-    elif cmd == "agent-spawn":
-        cli.agent_spawn(args.agent_type, args.capabilities, args.resources)
-    elif cmd == "task-orchestrate":
-        cli.task_orchestrate(args.task_description)
-    elif cmd == "swarm-monitor":
-        cli.swarm_monitor(args.dashboard, args.real_time)
-    elif cmd == "topology-optimize":
-        cli.topology_optimize()
-    elif cmd == "load-balance":
-        cli.load_balance()
-    elif cmd == "coordination-sync":
-        cli.coordination_sync()
-    elif cmd == "swarm-scale":
-        cli.swarm_scale(args.scale)
-    elif cmd == "swarm-destroy":
-        cli.swarm_destroy()
-    elif cmd == "pattern-recognize":
-        cli.pattern_recognize(args.pattern, args.input_file)
-    elif cmd == "learning-adapt":
-        cli.learning_adapt(args.model, args.data)
-    elif cmd == "neural-compress":
-        cli.neural_compress(args.model, args.output)
-    elif cmd == "ensemble-create":
-        cli.ensemble_create(args.models, args.output_model)
-    elif cmd == "transfer-learn":
-        cli.transfer_learn(args.base_model, args.new_data)
-    elif cmd == "neural-explain":
-        cli.neural_explain(args.model, args.input_file)
-    elif cmd == "memory-usage":
-        cli.memory_usage()
-    elif cmd == "memory-search":
-        cli.memory_search(args.term, args.namespace)
-    elif cmd == "memory-persist":
-        cli.memory_persist()
-    elif cmd == "memory-namespace":
-        cli.memory_namespace(args.namespace)
-    elif cmd == "memory-backup":
-        cli.memory_backup(args.output_file)
-    elif cmd == "memory-restore":
-        cli.memory_restore(args.input_file)
-    elif cmd == "memory-compress":
-        cli.memory_compress()
-    elif cmd == "memory-sync":
-        cli.memory_sync()
-    elif cmd == "memory-analytics":
-        cli.memory_analytics()
-    elif cmd == "performance-report":
-        cli.performance_report()
-    elif cmd == "bottleneck-analyze":
-        cli.bottleneck_analyze()
-    elif cmd == "token-usage":
-        cli.token_usage()
-    elif cmd == "benchmark-run":
-        cli.benchmark_run(args.benchmark_name)
-    elif cmd == "metrics-collect":
-        cli.metrics_collect()
-    elif cmd == "trend-analysis":
-        cli.trend_analysis()
-    elif cmd == "health-check":
-        cli.health_check(args.components)
-    elif cmd == "diagnostic-run":
-        cli.diagnostic_run()
-    elif cmd == "usage-stats":
-        cli.usage_stats()
-    elif cmd == "workflow-execute":
-        cli.workflow_execute(args.name)
-    elif cmd == "workflow-export":
-        cli.workflow_export(args.name, args.output_file)
-    elif cmd == "automation-setup":
-        cli.automation_setup(args.config_file)
-    elif cmd == "scheduler-manage":
-        cli.scheduler_manage(args.schedule_name, args.action)
-    elif cmd == "trigger-setup":
-        cli.trigger_setup(args.trigger_name, args.target)
-    elif cmd == "parallel-execute":
-        cli.parallel_execute(args.tasks)
-    elif cmd == "github-repo-analyze":
-        cli.github_repo_analyze(args.analysis_type, args.target)
-    elif cmd == "github-pr-manage":
-        cli.github_pr_manage(args.reviewers, args.ai_powered)
-    elif cmd == "github-issue-track":
-        cli.github_issue_track(args.project)
-    elif cmd == "github-release-coord":
-        cli.github_release_coord(args.version, args.auto_changelog)
-    elif cmd == "github-workflow-auto":
-        cli.github_workflow_auto(args.file)
-    elif cmd == "github-code-review":
-        cli.github_code_review(args.multi_reviewer, args.ai_powered)
-    elif cmd == "github-sync-coordinator":
-        cli.github_sync_coordinator(args.multi_package)
-    elif cmd == "daa-resource-alloc":
-        cli.daa_resource_alloc(args.agent_id, args.cpu, args.memory)
-    elif cmd == "daa-communication":
-        cli.daa_communication(args.source, args.target, args.message)
-    elif cmd == "daa-consensus":
-        cli.daa_consensus(args.proposal)
-    elif cmd == "backup-create":
-        cli.backup_create(args.output_file)
-    elif cmd == "restore-system":
-        cli.restore_system(args.backup_file)
-    elif cmd == "config-manage":
-        cli.config_manage(args.operation, args.file)
-    elif cmd == "features-detect":
-        cli.features_detect()
-    elif cmd == "log-analysis":
-        cli.log_analysis(args.log_file)
-    elif cmd == "hook":
-        cli.hook(args.hook_name, args.params)
-    elif cmd == "fix-hook-variables":
-        cli.fix_hook_variables(args.target, args.test)
-    elif cmd == "sparc-modes":
-        cli.sparc_modes()
-    elif cmd == "sparc-run":
-        cli.sparc_run(args.mode, args.task, args.parallel, args.batch_optimize)
-    elif cmd == "sparc-tdd":
-        cli.sparc_tdd(args.feature, args.batch_tdd)
-    elif cmd == "sparc-info":
-        cli.sparc_info(args.mode)
-    elif cmd == "sparc-batch":
-        cli.sparc_batch(args.modes, args.task)
-    elif cmd == "sparc-pipeline":
-        cli.sparc_pipeline(args.task)
-    elif cmd == "sparc-concurrent":
-        cli.sparc_concurrent(args.mode, args.tasks_file)
-    elif cmd == "run-bg":
-        cli.run_background(args.cli_args)
-    elif cmd == "sparc-full":
-        cli.sparc_full_workflow(args.feature)
-    elif cmd == "new-project":
-        base_dir = Path(args.base_dir).expanduser().resolve()
-        pm = ProjectManager(base_dir, cli)
-        pm.create_project(args.idea, template=args.template)
-    elif cmd == "manager":
-        base_dir = Path("projects").expanduser().resolve()
-        pm = ProjectManager(base_dir, cli)
-        menu = ProjectManagerMenu(pm)
-        menu.run()
-    else:
-        parser.print_help()
+    handler = COMMAND_DISPATCH.get(args.command)
+    if handler is None:
+        build_parser(argv).print_help()
+        return
+    handler(ClaudeFlowCLI(Path.cwd()), args)
 
 
 # ----------------------------------------------------------------------
@@ -1,33 +1,85 @@
+import asyncio
+import json
 import os
 import logging
+import select
+import shutil
 import subprocess
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Tuple
+
+from flo_log import get_logger
+
+logger = get_logger("setup")
+
+# Zusatzoptionen für globale npm‑Installationen: Cache bevorzugen, keine
+# Audit‑ und Funding‑Abfragen an die Registry.
+_NPM_FLAGS = ("--prefer-offline", "--no-audit", "--no-fund")
+# Schlüssel, die von den Konfigurationsdialogen in die .env geschrieben werden
+_ENV_TOKEN_KEYS = ("GIT_TOKEN", "OPENROUTER_TOKEN", "OPENROUTER_MODEL")
 
 
 class SetupManager:
     """Übernimmt die Einrichtung der Umgebung und lädt Tokens."""
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def _command_exists(cmd: str) -> bool:
-        return subprocess.call(["which", cmd], stdout=subprocess.PIPE, stderr=subprocess.PIPE) == 0
+        # PATH‑Suche im Prozess statt ``which`` zu starten; das Ergebnis wird
+        # gecacht und nach jedem Installationsbefehl verworfen.
+        return shutil.which(cmd) is not None
 
     LOG_FILE = "flow_autogen.log"
 
+    # Umgebung bereits geprüft? Ermittelte Versionen je Werkzeug
+    _env_ready = False
+    _versions: Dict[str, str] = {}
+
     logging.basicConfig(filename=LOG_FILE, level=logging.INFO)
 
     @staticmethod
-    def _log(msg: str) -> None:
-        print(msg)
-        logging.info(msg)
+    def _log(msg: str, level: int = logging.INFO) -> None:
+        logger.log(level, msg)
+
+    @staticmethod
+    def _wait_child(proc: subprocess.Popen) -> int:
+        """
+        Wartet auf das Ende von ``proc`` und liefert den Exit‑Code. Unter Linux
+        (``os.pidfd_open``) wird ereignisgesteuert auf den Prozess‑Deskriptor
+        gewartet; sonst fällt die Methode auf ``proc.wait()`` zurück.
+        """
+        if hasattr(os, "pidfd_open"):
+            try:
+                fd = os.pidfd_open(proc.pid)
+            except OSError:
+                return proc.wait()
+            try:
+                poller = select.poll()
+                poller.register(fd, select.POLLIN)
+                poller.poll()
+            finally:
+                os.close(fd)
+        # Prozess ist beendet: wait() sammelt nur noch den Status ein
+        return proc.wait()
 
     @staticmethod
     def _run_command(command: List[str]) -> None:
         SetupManager._log(f"[Setup] Führe aus: {' '.join(command)}")
         try:
-            subprocess.run(command, check=True)
+            proc = subprocess.Popen(command)
+            try:
+                returncode = SetupManager._wait_child(proc)
+            except BaseException:
+                # Wie subprocess.run: Kindprozess bei Abbruch (z. B. Strg+C) beenden
+                proc.kill()
+                proc.wait()
+                raise
+            if returncode != 0:
+                raise subprocess.CalledProcessError(returncode, command)
         except Exception as e:
-            SetupManager._log(f"[Setup] Fehler beim Ausführen von {' '.join(command)}: {e}")
+            SetupManager._log(f"[Setup] Fehler beim Ausführen von {' '.join(command)}: {e}", logging.ERROR)
+        SetupManager._command_exists.cache_clear()
 
     @classmethod
     def install_node_and_npm(cls) -> None:
@@ -36,86 +88,221 @@ class SetupManager:
         cls._run_command(["sudo", "apt-get", "update", "-y"])
         cls._run_command(["sudo", "apt-get", "install", "-y", "nodejs", "npm"])
 
+    @staticmethod
+    async def _run_command_async(command: List[str]) -> None:
+        """Asynchrone Variante von ``_run_command``; Ausgaben gehen direkt ans Terminal."""
+        SetupManager._log(f"[Setup] Führe aus: {' '.join(command)}")
+        try:
+            proc = await asyncio.create_subprocess_exec(*command, env=os.environ.copy())
+            returncode = await proc.wait()
+            if returncode != 0:
+                SetupManager._log(f"[Setup] Fehler beim Ausführen von {' '.join(command)}: Exit‑Code {returncode}", logging.ERROR)
+        except Exception as e:
+            SetupManager._log(f"[Setup] Fehler beim Ausführen von {' '.join(command)}: {e}", logging.ERROR)
+        SetupManager._command_exists.cache_clear()
+
+    @classmethod
+    def _use_user_npm_prefix(cls) -> None:
+        """
+        Richtet ``~/.npm-global`` als globales npm‑Präfix ein, damit ``npm install -g``
+        ohne sudo (und ohne Passwortabfrage) auskommt. ``bin`` wird dem PATH des
+        laufenden Prozesses vorangestellt und einmalig in ``~/.bashrc`` eingetragen.
+        """
+        prefix = Path.home() / ".npm-global"
+        bin_dir = prefix / "bin"
+        bin_dir.mkdir(parents=True, exist_ok=True)
+        os.environ["NPM_CONFIG_PREFIX"] = str(prefix)
+        path = os.environ.get("PATH", "")
+        if str(bin_dir) not in path.split(os.pathsep):
+            os.environ["PATH"] = f"{bin_dir}{os.pathsep}{path}"
+            cls._command_exists.cache_clear()
+        export_line = 'export PATH="$HOME/.npm-global/bin:$PATH"'
+        bashrc = Path.home() / ".bashrc"
+        try:
+            current = bashrc.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            current = ""
+        if export_line not in current:
+            with bashrc.open("a", encoding="utf-8") as f:
+                f.write(f"\n# npm‑Präfix für flo (globale Pakete ohne sudo)\n{export_line}\n")
+            cls._log(f"[Setup] {bin_dir} zu PATH in {bashrc} hinzugefügt.")
+
     @classmethod
     def install_claude_code(cls) -> None:
         """Installiert @anthropic-ai/claude-code global via npm."""
+        asyncio.run(cls._install_claude_code_async())
+
+    @classmethod
+    async def _install_claude_code_async(cls) -> None:
         cls._log("[Setup] Installiere @anthropic-ai/claude-code global …")
-        cls._run_command(["sudo", "npm", "install", "-g", "@anthropic-ai/claude-code"])
-        cls._run_command(["claude", "--dangerously-skip-permissions"])
+        cls._use_user_npm_prefix()
+        await cls._run_command_async(["npm", "install", "-g", *_NPM_FLAGS, "@anthropic-ai/claude-code"])
+        await cls._run_command_async(["claude", "--dangerously-skip-permissions"])
 
     @classmethod
     def install_claude_flow(cls) -> None:
         """Installiert claude-flow@alpha global via npm."""
         cls._log("[Setup] Installiere claude-flow@alpha global …")
-        cls._run_command(["sudo", "npm", "install", "-g", "claude-flow@alpha"])
+        cls._use_user_npm_prefix()
+        cls._run_command(["npm", "install", "-g", *_NPM_FLAGS, "claude-flow@alpha"])
+
+    @staticmethod
+    def _package_version(command: str) -> Optional[str]:
+        """
+        Ermittelt die Version eines global installierten npm‑Kommandos aus der
+        ``package.json`` des Pakets, ohne Node.js zu starten. Der Eintrag in
+        ``<prefix>/bin`` ist ein Symlink in das Paketverzeichnis; von dort aus
+        wird nach oben die passende ``package.json`` gesucht. Gibt ``None``
+        zurück, wenn keine gefunden wird.
+        """
+        exe = shutil.which(command)
+        if not exe:
+            return None
+        for parent in Path(os.path.realpath(exe)).parents:
+            pkg = parent / "package.json"
+            try:
+                data = json.loads(pkg.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            if data.get("name") == command and data.get("version"):
+                return str(data["version"])
+            if parent.name == "node_modules":
+                break
+        return None
+
+    @classmethod
+    async def _check_claude_flow_async(cls) -> None:
+        # Vermeide potenziell lange Netzwerkaufrufe durch npx. Stattdessen
+        # wird lediglich geprüft, ob das Kommando ``claude-flow`` bereits im
+        # PATH vorhanden ist. Damit startet die Anwendung auch in Umgebungen
+        # ohne npm oder ohne Internetzugang schnell.
+        if not cls._command_exists("claude-flow"):
+            cls._log(
+                "[Setup] Warnung: 'claude-flow' scheint nicht installiert zu sein."
+                " Einige Funktionen stehen möglicherweise nicht zur Verfügung.",
+                logging.WARNING,
+            )
+            return
+        version_out = cls._versions.get("claude-flow") or cls._package_version("claude-flow")
+        if version_out is not None:
+            cls._versions["claude-flow"] = version_out
+        else:
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    "claude-flow", "--version", stdout=asyncio.subprocess.PIPE
+                )
+                out, _ = await proc.communicate()
+                version_out = cls._versions["claude-flow"] = out.decode(errors="ignore").strip()
+            except Exception:
+                version_out = "unknown"
+        cls._log(f"[Setup] claude-flow gefunden (Version {version_out}).")
+        if "2.0.0-alpha.73" not in version_out:
+            cls._log("[Setup] Warnung: claude-flow Version ist ungetestet. Erwartet 2.0.0-alpha.73", logging.WARNING)
 
     @classmethod
     def setup_environment(cls) -> None:
-        """Prüft die Verfügbarkeit von node, npm, claude und claude-flow."""
+        """
+        Prüft die Verfügbarkeit von node, npm, claude und claude-flow. Node.js
+        und npm werden zuerst (falls nötig) installiert; die davon abhängigen,
+        untereinander aber unabhängigen Schritte – claude‑Installation und
+        claude‑flow‑Versionsprüfung – laufen parallel.
+        Die Prüfung erfolgt nur einmal pro Prozess.
+        """
+        if cls._env_ready:
+            return
         if not cls._command_exists("node") or not cls._command_exists("npm"):
             cls.install_node_and_npm()
         else:
             cls._log("[Setup] Node.js und npm sind vorhanden.")
 
+        steps = [cls._check_claude_flow_async()]
         if cls._command_exists("claude"):
             cls._log("[Setup] 'claude' ist vorhanden.")
         else:
-            cls.install_claude_code()
+            steps.append(cls._install_claude_code_async())
 
-        # Vermeide potenziell lange Netzwerkaufrufe durch npx. Stattdessen
-        # wird lediglich geprüft, ob das Kommando ``claude-flow`` bereits im
-        # PATH vorhanden ist. Damit startet die Anwendung auch in Umgebungen
-        # ohne npm oder ohne Internetzugang schnell.
-        if cls._command_exists("claude-flow"):
-            try:
-                version_out = subprocess.check_output(["claude-flow", "--version"], text=True).strip()
-            except Exception:
-                version_out = "unknown"
-            cls._log(f"[Setup] claude-flow gefunden (Version {version_out}).")
-            if "2.0.0-alpha.73" not in version_out:
-                cls._log("[Setup] Warnung: claude-flow Version ist ungetestet. Erwartet 2.0.0-alpha.73")
-        else:
-            cls._log(
-                "[Setup] Warnung: 'claude-flow' scheint nicht installiert zu sein."
-                " Einige Funktionen stehen möglicherweise nicht zur Verfügung."
-            )
+        async def _run_steps() -> None:
+            await asyncio.gather(*steps)
+
+        asyncio.run(_run_steps())
 
         if not cls._command_exists("claude"):
             cls._log(
                 "[Setup] Warnung: Das Kommando 'claude' ist nach der Installation nicht auffindbar."
-                " Bitte stellen Sie sicher, dass @anthropic-ai/claude-code korrekt installiert ist."
+                " Bitte stellen Sie sicher, dass @anthropic-ai/claude-code korrekt installiert ist.",
+                logging.WARNING,
             )
-
-        if not cls._command_exists("screen"):
-            cls._log("[Setup] 'screen' fehlt – versuche Installation …")
-            cls._run_command(["sudo", "apt-get", "install", "-y", "screen"])
         # Keine weitere Verifikation per ``npx`` um Wartezeiten zu vermeiden.
         cls.load_env_tokens()
+        cls._env_ready = True
+
+    @staticmethod
+    def write_env_file(content: str, path: str = ".env") -> None:
+        """
+        Schreibt ``content`` atomar nach ``path``: Die Daten landen zunächst in
+        einer temporären Datei, die anschließend per ``os.replace`` über die
+        Zieldatei geschoben wird. Leser sehen so nie eine halb geschriebene
+        .env.
+        """
+        tmp = Path(f"{path}.tmp")
+        tmp.write_text(content, encoding="utf-8")
+        os.replace(tmp, path)
+
+    @staticmethod
+    def env_tokens_content() -> str:
+        """Baut den .env‑Inhalt für alle gesetzten Tokens in einem Durchgang."""
+        env = os.environ
+        return "".join(f"{key}={env[key]}\n" for key in _ENV_TOKEN_KEYS if env.get(key))
+
+    # Bereits geparste .env‑Dateien, Schlüssel (Pfad, mtime_ns, Größe)
+    _env_cache: Dict[Tuple[str, int, int], Dict[str, str]] = {}
+
+    @classmethod
+    def _parse_env_file(cls, env_path: Path) -> Optional[Dict[str, str]]:
+        """
+        Liefert die Schlüssel/Wert‑Paare einer .env‑Datei oder ``None``, wenn sie
+        nicht existiert. Das Ergebnis wird zwischengespeichert, solange sich
+        Änderungszeit und Größe der Datei nicht ändern.
+        """
+        try:
+            st = env_path.stat()
+        except FileNotFoundError:
+            return None
+        key = (str(env_path.resolve()), st.st_mtime_ns, st.st_size)
+        values = cls._env_cache.get(key)
+        if values is None:
+            values = {}
+            for line in env_path.read_text(encoding="utf-8").splitlines():
+                line = line.strip()
+                if not line or line[0] == "#":
+                    continue
+                k, sep, v = line.partition("=")
+                if not sep:
+                    continue
+                k = k.rstrip()
+                v = v.lstrip()
+                if k and v:
+                    values[k] = v
+            cls._env_cache[key] = values
+        return values
 
     @classmethod
     def load_env_tokens(cls) -> None:
         """Lädt Tokens aus einer .env-Datei und setzt ein Standardmodell."""
-        env_path = Path(".env")
-        if env_path.exists():
-            cls._log("[Setup] Lese .env‑Datei ein …")
-            with env_path.open() as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith("#"):
-                        continue
-                    if "=" in line:
-                        key, value = line.split("=", 1)
-                        key = key.strip()
-                        value = value.strip()
-                        if key and value and key not in os.environ:
-                            os.environ[key] = value
-                            cls._log(f"[Setup] Setze Umgebungsvariable {key} aus .env")
-        else:
+        values = cls._parse_env_file(Path(".env"))
+        if values is None:
             cls._log("[Setup] Keine .env-Datei gefunden.")
+        else:
+            cls._log("[Setup] Lese .env‑Datei ein …")
+            applied = [k for k in values if k not in os.environ]
+            for k in applied:
+                os.environ[k] = values[k]
+            if applied:
+                cls._log(f"[Setup] Setze Umgebungsvariablen aus .env: {', '.join(applied)}")
         if "GIT_TOKEN" not in os.environ:
-            cls._log("[Setup] Warnung: GitHub‑Token nicht gesetzt. Bitte setzen Sie GIT_TOKEN in Ihrer .env oder als Umgebungsvariable.")
+            cls._log("[Setup] Warnung: GitHub‑Token nicht gesetzt. Bitte setzen Sie GIT_TOKEN in Ihrer .env oder als Umgebungsvariable.", logging.WARNING)
         if "OPENROUTER_TOKEN" not in os.environ:
-            cls._log("[Setup] Warnung: OpenRouter‑Token nicht gesetzt. Bitte setzen Sie OPENROUTER_TOKEN in Ihrer .env oder als Umgebungsvariable.")
+            cls._log("[Setup] Warnung: OpenRouter‑Token nicht gesetzt. Bitte setzen Sie OPENROUTER_TOKEN in Ihrer .env oder als Umgebungsvariable.", logging.WARNING)
         if "OPENROUTER_MODEL" not in os.environ:
             os.environ["OPENROUTER_MODEL"] = "qwen/qwen3-coder:free"
             cls._log("[Setup] Setze OPENROUTER_MODEL=qwen/qwen3-coder:free")